@@ -27,7 +27,7 @@ GOOGLE_CREDENTIALS_FILE = BASE_DIR / "credentials.json"
 GOOGLE_TOKEN_FILE = DATA_DIR / "token.json"
 GOOGLE_DRIVE_FOLDER_ID = "13zJsXH5CasIXnky9wBcwTXW2uh20UTb7"  # Direct folder ID
 GOOGLE_DRIVE_FOLDER = "Neuro-Tracker"  # Folder name (for display)
-SYNC_INTERVAL_MINUTES = 5  # Auto-sync every 5 minutes
+SYNC_DELAY_SECONDS = 30  # Auto-sync this long after the last change
 
 # UI Settings
 WINDOW_TITLE = f"{APP_NAME} v{APP_VERSION}"
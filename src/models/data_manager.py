@@ -2,6 +2,8 @@
 Data Manager for loading and saving day entries
 """
 import json
+from bisect import bisect_left, bisect_right
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
@@ -22,41 +24,83 @@ class DataManager:
         """
         self.data_file = data_file or config.ENTRIES_FILE
         self.entries: Dict[str, DayEntry] = {}
+        self._dirty = False
+        # Bumped on every change to self.entries; lets callers cache derived data
+        self._version = 0
+        # (version, entries sorted by date, their ISO dates) for range slicing
+        self._sorted: tuple = (-1, [], [])
+        # save() may run on a worker thread (close, sync) while the GUI flushes
+        self._save_lock = threading.Lock()
+        # Statistics workers read the entries while the GUI thread edits them;
+        # guards self.entries, self._version and self._sorted
+        self._entries_lock = threading.Lock()
         self.load()
 
     def load(self):
-        """Load entries from JSON file"""
-        if not self.data_file.exists():
-            self.entries = {}
-            return
-
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.entries = {
-                    date: DayEntry.from_dict(entry_data)
-                    for date, entry_data in data.items()
-                }
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading data: {e}")
-            self.entries = {}
+        """
+        Load entries from JSON file
+
+        Raises:
+            RuntimeError: If changes made with save=False are not on disk yet;
+                reloading would drop them, so flush() first
+        """
+        if self._dirty:
+            raise RuntimeError("load() would discard unsaved changes; call flush() first")
+        entries = {}
+        if self.data_file.exists():
+            try:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    entries = {
+                        date: DayEntry.from_dict(entry_data)
+                        for date, entry_data in data.items()
+                    }
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading data: {e}")
+                entries = {}
+
+        with self._entries_lock:
+            self.entries = entries
+            self._version += 1
 
     def save(self):
         """Save entries to JSON file"""
-        try:
-            # Ensure directory exists
-            self.data_file.parent.mkdir(parents=True, exist_ok=True)
-
-            data = {
+        with self._save_lock:
+            try:
+                # Ensure directory exists
+                self.data_file.parent.mkdir(parents=True, exist_ok=True)
+
+                data = self.to_dict()
+
+                with open(self.data_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._dirty = False
+            except IOError as e:
+                print(f"Error saving data: {e}")
+                raise
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """All entries as plain dicts, keyed by ISO date (the file format)"""
+        with self._entries_lock:
+            return {
                 date: entry.to_dict()
                 for date, entry in self.entries.items()
             }
 
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            print(f"Error saving data: {e}")
-            raise
+    def flush(self):
+        """Write changes made with save=False to disk, if there are any"""
+        if self._dirty:
+            self.save()
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the entries change"""
+        return self._version
+
+    @property
+    def entry_count(self) -> int:
+        """Number of stored entries (cheap; no statistics are computed)"""
+        return len(self.entries)
 
     def get_entry(self, date) -> Optional[DayEntry]:
         """
@@ -72,33 +116,46 @@ class DataManager:
             date = date.isoformat()
         return self.entries.get(date)
 
-    def add_or_update_entry(self, entry: DayEntry):
+    def add_or_update_entry(self, entry: DayEntry, save: bool = True):
         """
         Add new entry or update existing one
 
         Args:
             entry: DayEntry to add/update
+            save: Write to disk now; with False the change is kept in
+                memory until flush() or save()
         """
-        self.entries[entry.date] = entry
-        self.save()
+        with self._entries_lock:
+            self.entries[entry.date] = entry
+            self._version += 1
+        if save:
+            self.save()
+        else:
+            self._dirty = True
 
-    def delete_entry(self, date) -> bool:
+    def delete_entry(self, date, save: bool = True) -> bool:
         """
         Delete entry for a specific date
 
         Args:
             date: Date in ISO format (YYYY-MM-DD) or date object
+            save: Write to disk now; see add_or_update_entry
 
         Returns:
             True if entry was deleted, False if it didn't exist
         """
         if hasattr(date, 'isoformat'):
             date = date.isoformat()
-        if date in self.entries:
+        with self._entries_lock:
+            if date not in self.entries:
+                return False
             del self.entries[date]
+            self._version += 1
+        if save:
             self.save()
-            return True
-        return False
+        else:
+            self._dirty = True
+        return True
 
     def get_entries_in_range(self, start_date, end_date) -> List[DayEntry]:
         """
@@ -116,11 +173,8 @@ class DataManager:
         if hasattr(end_date, 'isoformat'):
             end_date = end_date.isoformat()
 
-        entries = [
-            entry for date, entry in self.entries.items()
-            if start_date <= date <= end_date
-        ]
-        return sorted(entries, key=lambda e: e.date)
+        entries, dates = self._sorted_entries()
+        return entries[bisect_left(dates, start_date):bisect_right(dates, end_date)]
 
     def get_recent_entries(self, days: int = 14) -> List[DayEntry]:
         """
@@ -147,7 +201,18 @@ class DataManager:
         Returns:
             List of all DayEntry objects
         """
-        return sorted(self.entries.values(), key=lambda e: e.date)
+        return self._sorted_entries()[0][:]
+
+    def _sorted_entries(self):
+        """Entries sorted by date plus their dates, re-sorted only after a change"""
+        with self._entries_lock:
+            version, entries, dates = self._sorted
+            if version != self._version:
+                version = self._version
+                entries = sorted(self.entries.values(), key=lambda e: e.date)
+                dates = [e.date for e in entries]
+                self._sorted = (version, entries, dates)
+        return entries, dates
 
     def get_all_foods(self) -> List[str]:
         """
@@ -1,29 +1,46 @@
 """
 Utilities for Neuro-Tracker Application
+
+Submodules are imported on first attribute access, so importing one of them
+(e.g. utils.statistics) does not pull in the Google API client or reportlab.
 """
 
-from utils.google_drive import GoogleDriveSync, GoogleDriveAuthenticator
-from utils.statistics import StatisticsCalculator
-from utils.export import ExportManager
-from utils.validators import (
-    Validators,
-    DateRangeValidator,
-    ExportValidator
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
+_EXPORTS = {
     # Google Drive
-    'GoogleDriveSync',
-    'GoogleDriveAuthenticator',
+    'GoogleDriveSync': 'utils.google_drive',
+    'GoogleDriveAuthenticator': 'utils.google_drive',
 
     # Statistics
-    'StatisticsCalculator',
+    'StatisticsCalculator': 'utils.statistics',
 
     # Export
-    'ExportManager',
+    'ExportManager': 'utils.export',
 
     # Validators
-    'Validators',
-    'DateRangeValidator',
-    'ExportValidator',
-]
+    'Validators': 'utils.validators',
+    'DateRangeValidator': 'utils.validators',
+    'ExportValidator': 'utils.validators',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from utils.google_drive import GoogleDriveSync, GoogleDriveAuthenticator
+    from utils.statistics import StatisticsCalculator
+    from utils.export import ExportManager
+    from utils.validators import (
+        Validators,
+        DateRangeValidator,
+        ExportValidator
+    )
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -8,7 +8,8 @@ Real implementation using Google Drive API v3 with OAuth 2.0
 import json
 import io
 import tempfile
-from datetime import datetime
+import threading
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
@@ -161,6 +162,7 @@ class GoogleDriveSync:
     """
 
     FOLDER_ID = GOOGLE_DRIVE_FOLDER_ID
+    SYNC_FILES = ('entries.json', 'food_suggestions.json')
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
 
@@ -171,6 +173,8 @@ class GoogleDriveSync:
         self._connected = False
         self._last_sync: Optional[datetime] = None
         self._sync_status_file = DATA_DIR / "sync_status.json"
+        # A background sync and the push on close must not upload concurrently
+        self._exchange_lock = threading.Lock()
         self._load_status()
 
     def _load_status(self):
@@ -254,34 +258,37 @@ class GoogleDriveSync:
 
         return True, "Verbindung zu Google Drive getrennt."
 
-    def _find_file_in_folder(self, filename: str) -> Optional[str]:
+    def _find_files_in_folder(self, filenames) -> Dict[str, str]:
         """
-        Find a file by name in the target folder.
+        Look up several files in the target folder with a single list request.
 
         Args:
-            filename: Name of the file to find
+            filenames: Names of the files to find
 
         Returns:
-            File ID if found, None otherwise
+            Dict of filename -> file ID for the files that exist
         """
         if not self.service:
-            return None
+            return {}
 
         try:
-            query = f"name = '{filename}' and '{self.FOLDER_ID}' in parents and trashed = false"
+            names = " or ".join(f"name = '{name}'" for name in filenames)
+            query = f"({names}) and '{self.FOLDER_ID}' in parents and trashed = false"
 
             results = self.service.files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id, name, modifiedTime)',
-                pageSize=1
+                pageSize=100
             ).execute()
 
-            files = results.get('files', [])
-            return files[0]['id'] if files else None
+            found = {}
+            for f in results.get('files', []):
+                found.setdefault(f['name'], f['id'])
+            return found
 
         except Exception:
-            return None
+            return {}
 
     def _download_file(self, file_id: str) -> Optional[bytes]:
         """
@@ -414,21 +421,21 @@ class GoogleDriveSync:
         # Get all unique dates
         all_dates = set(local_entries.keys()) | set(remote_entries.keys())
 
-        for date in all_dates:
-            local_entry = local_entries.get(date)
-            remote_entry = remote_entries.get(date)
+        for day in all_dates:
+            local_entry = local_entries.get(day)
+            remote_entry = remote_entries.get(day)
 
             if local_entry and not remote_entry:
                 # Only local exists
-                merged[date] = local_entry
+                merged[day] = local_entry
 
             elif remote_entry and not local_entry:
                 # Only remote exists
-                merged[date] = remote_entry
+                merged[day] = remote_entry
 
             else:
                 # Both exist - conflict resolution
-                merged[date] = self._resolve_entry_conflict(local_entry, remote_entry)
+                merged[day] = self._resolve_entry_conflict(local_entry, remote_entry)
 
         return merged
 
@@ -494,136 +501,210 @@ class GoogleDriveSync:
         merged = set(local_foods) | set(remote_foods)
         return sorted(merged)
 
-    def sync(self) -> Tuple[bool, str]:
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the local data a sync starts from. Call on the GUI thread;
+        the result is plain data that the worker can use without locking.
+
+        Returns:
+            Dict with the entries' data version, the entries as dicts and
+            the local food suggestions
+        """
+        local_foods = []
+        if FOOD_SUGGESTIONS_FILE.exists():
+            try:
+                with open(FOOD_SUGGESTIONS_FILE, 'r', encoding='utf-8') as f:
+                    local_foods = json.load(f)
+            except json.JSONDecodeError:
+                local_foods = []
+
+        return {
+            'version': self.data_manager.version,
+            'entries': self.data_manager.to_dict(),
+            'foods': local_foods,
+        }
+
+    def sync(self) -> Tuple[bool, str, List[date]]:
         """
-        Full synchronization with Google Drive.
+        Full synchronization with Google Drive, blocking the calling thread.
 
         Flow:
-        1. Download remote files
-        2. Load local files
-        3. Merge with conflict resolution
-        4. Save merged data locally
-        5. Upload merged data to Drive
+        1. Snapshot local data
+        2. Download remote files, merge and upload (see exchange)
+        3. Save merged data locally (see apply)
 
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message, dates whose local entry changed)
+        """
+        snapshot = self.snapshot()
+        success, message, result = self.exchange(snapshot)
+        if not success:
+            return False, message, []
+        changed, _ = self.apply(snapshot, result)
+        return True, message, changed
+
+    def exchange(self, snapshot: Dict[str, Any]) -> Tuple[bool, str, Optional[Dict]]:
         """
+        Network part of a sync: download remote files, merge them with the
+        snapshot and upload the merged data. Touches no local data, so it can
+        run on a worker thread.
+
+        Args:
+            snapshot: Local data from snapshot()
+
+        Returns:
+            Tuple of (success, message, merged data for apply())
+        """
+        with self._exchange_lock:
+            return self._exchange(snapshot)
+
+    def _exchange(self, snapshot: Dict[str, Any]) -> Tuple[bool, str, Optional[Dict]]:
         if not GOOGLE_DRIVE_ENABLED:
-            return False, "Google Drive Sync ist deaktiviert."
+            return False, "Google Drive Sync ist deaktiviert.", None
 
         if not self._connected or not self.service:
             # Try to reconnect
             success, msg = self.connect()
             if not success:
-                return False, f"Nicht verbunden: {msg}"
+                return False, f"Nicht verbunden: {msg}", None
 
         try:
             results = []
+            file_ids = self._find_files_in_folder(self.SYNC_FILES)
 
             # === SYNC ENTRIES.JSON ===
-            entries_result = self._sync_entries()
+            entries_result, merged_entries = self._sync_entries(
+                file_ids.get('entries.json'), snapshot['entries'])
             results.append(entries_result)
 
             # === SYNC FOOD_SUGGESTIONS.JSON ===
-            foods_result = self._sync_food_suggestions()
+            foods_result, merged_foods = self._sync_food_suggestions(
+                file_ids.get('food_suggestions.json'), snapshot['foods'])
             results.append(foods_result)
 
             # Update sync timestamp
             self._last_sync = datetime.now()
             self._save_status()
 
-            return True, f"Sync erfolgreich um {self._last_sync.strftime('%H:%M:%S')}\n" + "\n".join(results)
+            message = f"Sync erfolgreich um {self._last_sync.strftime('%H:%M:%S')}\n" + "\n".join(results)
+            return True, message, {'entries': merged_entries, 'foods': merged_foods}
 
         except SyncError as e:
             if not e.recoverable:
                 self._connected = False
                 self._save_status()
-            return False, e.message
+            return False, e.message, None
 
         except Exception as e:
-            return False, f"Sync-Fehler: {str(e)}"
+            return False, f"Sync-Fehler: {str(e)}", None
 
-    def _sync_entries(self) -> str:
+    def apply(self, snapshot: Dict[str, Any], result: Dict) -> Tuple[List[date], bool]:
         """
-        Sync entries.json with merge.
+        Save the merged data of a finished exchange() locally. Call on the
+        GUI thread. Entries edited after the snapshot was taken are newer
+        than anything the sync has seen, so they win over the merged ones.
+
+        Args:
+            snapshot: The snapshot the exchange started from
+            result: Merged data returned by exchange()
 
         Returns:
-            Status message
+            Tuple of (dates whose local entry changed, whether local edits
+            made during the sync still need to be uploaded)
+        """
+        changed: List[date] = []
+        edited = self.data_manager.version != snapshot['version']
+
+        merged_entries = result['entries']
+        if merged_entries is not None:
+            current = self.data_manager.to_dict()
+            merged_entries = dict(merged_entries)
+            if edited:
+                before = snapshot['entries']
+                for day in set(current) | set(before):
+                    if current.get(day) != before.get(day):
+                        if day in current:
+                            merged_entries[day] = current[day]
+                        else:
+                            merged_entries.pop(day, None)
+
+            changed = sorted(
+                date.fromisoformat(day)
+                for day in set(merged_entries) | set(current)
+                if merged_entries.get(day) != current.get(day)
+            )
+            if changed:
+                # In-memory edits are part of merged_entries; load() refuses to
+                # run over unsaved changes, so write them out first
+                self.data_manager.flush()
+                ENTRIES_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with open(ENTRIES_FILE, 'w', encoding='utf-8') as f:
+                    json.dump(merged_entries, f, ensure_ascii=False, indent=2)
+                self.data_manager.load()
+
+        merged_foods = result['foods']
+        if merged_foods is not None:
+            FOOD_SUGGESTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(FOOD_SUGGESTIONS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(merged_foods, f, ensure_ascii=False, indent=2)
+
+        return changed, edited
+
+    def _sync_entries(self, remote_file_id: Optional[str],
+                      local_data: Dict[str, Dict]) -> Tuple[str, Optional[Dict[str, Dict]]]:
         """
-        # Find remote file
-        remote_file_id = self._find_file_in_folder('entries.json')
+        Sync entries.json with merge.
 
-        # Load local entries
-        local_data = {}
-        if ENTRIES_FILE.exists():
-            try:
-                with open(ENTRIES_FILE, 'r', encoding='utf-8') as f:
-                    local_data = json.load(f)
-            except json.JSONDecodeError:
-                local_data = {}
+        Args:
+            remote_file_id: Drive ID of entries.json, None if it does not exist yet
+            local_data: Local entries dict {date: entry_dict}
 
+        Returns:
+            Tuple of (status message, merged entries or None if nothing was merged)
+        """
         if remote_file_id:
             # Download and merge
             remote_data = self._download_json(remote_file_id) or {}
             merged_data = self._merge_entries(local_data, remote_data)
 
-            # Save merged locally
-            ENTRIES_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(ENTRIES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(merged_data, f, ensure_ascii=False, indent=2)
-
             # Upload merged to Drive
             self._upload_json(merged_data, 'entries.json', remote_file_id)
 
-            # Reload DataManager
-            self.data_manager.load()
-
             local_count = len(local_data)
             remote_count = len(remote_data)
             merged_count = len(merged_data)
 
-            return f"Einträge: {merged_count} (lokal: {local_count}, remote: {remote_count})"
+            return f"Einträge: {merged_count} (lokal: {local_count}, remote: {remote_count})", merged_data
         else:
             # No remote file - upload local
             if local_data:
                 self._upload_json(local_data, 'entries.json')
-            return f"Einträge: {len(local_data)} hochgeladen"
+            return f"Einträge: {len(local_data)} hochgeladen", None
 
-    def _sync_food_suggestions(self) -> str:
+    def _sync_food_suggestions(self, remote_file_id: Optional[str],
+                               local_foods: List[str]) -> Tuple[str, Optional[List[str]]]:
         """
         Sync food_suggestions.json with merge.
 
+        Args:
+            remote_file_id: Drive ID of food_suggestions.json, None if it does not exist yet
+            local_foods: Local food suggestions list
+
         Returns:
-            Status message
+            Tuple of (status message, merged list or None if nothing was merged)
         """
-        remote_file_id = self._find_file_in_folder('food_suggestions.json')
-
-        # Load local
-        local_foods = []
-        if FOOD_SUGGESTIONS_FILE.exists():
-            try:
-                with open(FOOD_SUGGESTIONS_FILE, 'r', encoding='utf-8') as f:
-                    local_foods = json.load(f)
-            except json.JSONDecodeError:
-                local_foods = []
-
         if remote_file_id:
             remote_foods = self._download_json(remote_file_id) or []
             merged_foods = self._merge_food_suggestions(local_foods, remote_foods)
 
-            # Save merged locally
-            FOOD_SUGGESTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(FOOD_SUGGESTIONS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(merged_foods, f, ensure_ascii=False, indent=2)
-
             # Upload merged
             self._upload_json(merged_foods, 'food_suggestions.json', remote_file_id)
 
-            return f"Lebensmittel: {len(merged_foods)} synchronisiert"
+            return f"Lebensmittel: {len(merged_foods)} synchronisiert", merged_foods
         else:
             if local_foods:
                 self._upload_json(local_foods, 'food_suggestions.json')
-            return f"Lebensmittel: {len(local_foods)} hochgeladen"
+            return f"Lebensmittel: {len(local_foods)} hochgeladen", None
 
     def upload(self) -> Tuple[bool, str]:
         """
@@ -637,14 +718,15 @@ class GoogleDriveSync:
 
         try:
             results = []
+            file_ids = self._find_files_in_folder(self.SYNC_FILES)
 
             # Upload entries
+            self.data_manager.flush()
             if ENTRIES_FILE.exists():
                 with open(ENTRIES_FILE, 'r', encoding='utf-8') as f:
                     entries_data = json.load(f)
 
-                file_id = self._find_file_in_folder('entries.json')
-                self._upload_json(entries_data, 'entries.json', file_id)
+                self._upload_json(entries_data, 'entries.json', file_ids.get('entries.json'))
                 results.append(f"Einträge: {len(entries_data)} hochgeladen")
 
             # Upload food suggestions
@@ -652,8 +734,8 @@ class GoogleDriveSync:
                 with open(FOOD_SUGGESTIONS_FILE, 'r', encoding='utf-8') as f:
                     foods_data = json.load(f)
 
-                file_id = self._find_file_in_folder('food_suggestions.json')
-                self._upload_json(foods_data, 'food_suggestions.json', file_id)
+                self._upload_json(foods_data, 'food_suggestions.json',
+                                  file_ids.get('food_suggestions.json'))
                 results.append(f"Lebensmittel: {len(foods_data)} hochgeladen")
 
             self._last_sync = datetime.now()
@@ -676,12 +758,15 @@ class GoogleDriveSync:
 
         try:
             results = []
+            file_ids = self._find_files_in_folder(self.SYNC_FILES)
 
             # Download entries
-            file_id = self._find_file_in_folder('entries.json')
+            file_id = file_ids.get('entries.json')
             if file_id:
                 entries_data = self._download_json(file_id)
                 if entries_data:
+                    # load() refuses to drop unsaved edits; this download replaces them on purpose
+                    self.data_manager.flush()
                     ENTRIES_FILE.parent.mkdir(parents=True, exist_ok=True)
                     with open(ENTRIES_FILE, 'w', encoding='utf-8') as f:
                         json.dump(entries_data, f, ensure_ascii=False, indent=2)
@@ -689,7 +774,7 @@ class GoogleDriveSync:
                     results.append(f"Einträge: {len(entries_data)} heruntergeladen")
 
             # Download food suggestions
-            file_id = self._find_file_in_folder('food_suggestions.json')
+            file_id = file_ids.get('food_suggestions.json')
             if file_id:
                 foods_data = self._download_json(file_id)
                 if foods_data:
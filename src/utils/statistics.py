@@ -3,6 +3,9 @@ Statistics Calculator for Neuro-Tracker Application
 Complete trigger analysis: food, stress, fungal infections, sleep, weather, sweating, contact.
 """
 
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
@@ -20,6 +23,12 @@ class StatisticsCalculator:
 
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
+        # (data version, correlations over all entries)
+        self._all_food_correlations: Tuple[int, List[Dict]] = (-1, [])
+        # (data version, (entries, day ordinals, ordinal -> entry))
+        self._day_index_cache: Tuple[int, tuple] = (-1, ([], [], {}))
+        # Several statistics workers may run at once; guards the two caches above
+        self._cache_lock = threading.Lock()
 
     # ── Core helpers ────────────────────────────────────────────────────────────
 
@@ -33,91 +42,150 @@ class StatisticsCalculator:
     def _avg(self, values: List[float]) -> float:
         return round(sum(values) / len(values), 2) if values else 0.0
 
-    def _entry_map(self, entries: List[DayEntry]) -> Dict[date, DayEntry]:
-        return {date.fromisoformat(e.date): e for e in entries}
+    def _day_index(self) -> Tuple[List[DayEntry], List[int], Dict[int, DayEntry]]:
+        """
+        All entries sorted by date, their day ordinals and an ordinal -> entry
+        map; parsed once per data version and shared by the trigger analyses.
+        """
+        with self._cache_lock:
+            version, index = self._day_index_cache
+            if version != self.data_manager.version:
+                version = self.data_manager.version
+                entries = self.data_manager.get_all_entries()
+                days = [date.fromisoformat(e.date).toordinal() for e in entries]
+                index = (entries, days, dict(zip(days, entries)))
+                self._day_index_cache = (version, index)
+        return index
+
+    def daily_entries(self, start: date, end: date) -> List[Optional[DayEntry]]:
+        """The entry (or None) for each day from start to end, from the shared day index."""
+        entries, days, _ = self._day_index()
+        first, last = start.toordinal(), end.toordinal()
+        series: List[Optional[DayEntry]] = [None] * (last - first + 1)
+        # Only the entries inside the range are touched; no per-day lookups
+        for i in range(bisect_left(days, first), bisect_right(days, last)):
+            series[days[i] - first] = entries[i]
+        return series
+
+    @staticmethod
+    def _first_flare(by_day: Dict[int, DayEntry], day: int, first: int, last: int,
+                     threshold: int) -> Optional[Tuple[int, DayEntry]]:
+        """First (offset, entry) in day+first..day+last with severity >= threshold."""
+        for offset in range(first, last + 1):
+            fut = by_day.get(day + offset)
+            if fut is not None and fut.severity is not None and fut.severity >= threshold:
+                return offset, fut
+        return None
 
     # ── Primary statistics ──────────────────────────────────────────────────────
 
     def calculate_all(self, days: Optional[int] = None) -> Dict:
         entries = self._get_entries_for_period(days)
+
+        # One pass over the entries feeds every aggregate below
+        distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+        sev_sum = sev_count = good = bad = 0
+        stress_sum = stress_count = sleep_sum = sleep_count = 0
+        fungal = sweating = 0
+        food_severities: Dict[str, List] = defaultdict(list)
+        weeks: Dict[date, List[int]] = defaultdict(list)
+        dow: Dict[int, List[int]] = defaultdict(list)
+        weather: Dict[str, int] = defaultdict(int)
+
+        for e in entries:
+            sev = e.severity
+            for f in e.foods:
+                food_severities[f].append(sev)
+            if sev is not None:
+                sev_sum += sev
+                sev_count += 1
+                if sev in distribution:
+                    distribution[sev] += 1
+                if sev <= 2:
+                    good += 1
+                elif sev >= 4:
+                    bad += 1
+                d = date.fromisoformat(e.date)
+                weekday = d.weekday()
+                weeks[d - timedelta(days=weekday)].append(sev)
+                dow[weekday].append(sev)
+            if e.stress_level is not None:
+                stress_sum += e.stress_level
+                stress_count += 1
+            if e.sleep_quality is not None:
+                sleep_sum += e.sleep_quality
+                sleep_count += 1
+            if e.fungal_active:
+                fungal += 1
+            if e.sweating:
+                sweating += 1
+            if e.weather:
+                weather[e.weather] += 1
+
+        top_foods = heapq.nlargest(
+            10, ((f, len(v)) for f, v in food_severities.items()), key=lambda x: x[1],
+        )
         return {
             'total_entries': len(entries),
-            'average_severity': self._calculate_average_severity(entries),
-            'severity_distribution': self._calculate_severity_distribution(entries),
-            'good_days': self._count_good_days(entries),
-            'bad_days': self._count_bad_days(entries),
-            'top_foods': self._get_top_foods(entries),
-            'food_correlations': self._calculate_food_correlations(entries),
-            'weekly_averages': self._calculate_weekly_averages(entries),
-            'day_of_week_averages': self._calculate_day_of_week_averages(entries),
+            'average_severity': round(sev_sum / sev_count, 2) if sev_count else 0.0,
+            'severity_distribution': distribution,
+            'good_days': good,
+            'bad_days': bad,
+            'top_foods': top_foods,
+            'food_correlations': self._food_correlations(food_severities),
+            'weekly_averages': self._weekly_averages(weeks),
+            'day_of_week_averages': {
+                d: round(sum(v) / len(v), 2) if v else 0
+                for d in range(7)
+                for v in [dow[d]]
+            },
             'streak_info': self._calculate_streak_info(entries),
             # New trigger metrics
-            'average_stress': self._avg_field(entries, 'stress_level'),
-            'fungal_days': sum(1 for e in entries if e.fungal_active),
-            'average_sleep': self._avg_field(entries, 'sleep_quality'),
-            'weather_distribution': self._weather_distribution(entries),
-            'sweating_days': sum(1 for e in entries if e.sweating),
+            'average_stress': round(stress_sum / stress_count, 2) if stress_count else 0.0,
+            'fungal_days': fungal,
+            'average_sleep': round(sleep_sum / sleep_count, 2) if sleep_count else 0.0,
+            'weather_distribution': dict(weather),
+            'sweating_days': sweating,
         }
 
-    def _avg_field(self, entries: List[DayEntry], field: str) -> float:
-        values = [getattr(e, field) for e in entries if getattr(e, field) is not None]
-        return self._avg(values)
-
     def _calculate_average_severity(self, entries: List[DayEntry]) -> float:
         values = [e.severity for e in entries if e.severity is not None]
         return self._avg(values)
 
-    def _calculate_severity_distribution(self, entries: List[DayEntry]) -> Dict[int, int]:
-        dist = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        for e in entries:
-            if e.severity in dist:
-                dist[e.severity] += 1
-        return dist
-
-    def _count_good_days(self, entries: List[DayEntry]) -> int:
-        return sum(1 for e in entries if e.severity is not None and e.severity <= 2)
-
-    def _count_bad_days(self, entries: List[DayEntry]) -> int:
-        return sum(1 for e in entries if e.severity is not None and e.severity >= 4)
-
-    def _get_top_foods(self, entries: List[DayEntry], limit: int = 10) -> List[Tuple[str, int]]:
-        counts = defaultdict(int)
-        for e in entries:
-            for f in e.foods:
-                counts[f] += 1
-        return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-
     def _calculate_food_correlations(self, entries: List[DayEntry]) -> List[Dict]:
-        food_data: Dict[str, Dict] = defaultdict(lambda: {'severities': [], 'count': 0})
+        food_severities: Dict[str, List] = defaultdict(list)
         for e in entries:
             for f in e.foods:
-                food_data[f]['severities'].append(e.severity)
-                food_data[f]['count'] += 1
+                food_severities[f].append(e.severity)
+        return self._food_correlations(food_severities)
+
+    def _all_entry_food_correlations(self) -> List[Dict]:
+        """Food correlations over every entry, regrouped only when the data changed."""
+        with self._cache_lock:
+            version, result = self._all_food_correlations
+            if version != self.data_manager.version:
+                version = self.data_manager.version
+                result = self._calculate_food_correlations(self.data_manager.get_all_entries())
+                self._all_food_correlations = (version, result)
+        return result
+
+    def _food_correlations(self, food_severities: Dict[str, List]) -> List[Dict]:
         result = []
-        for food, data in food_data.items():
-            if data['count'] >= 2:
-                avg = sum(data['severities']) / len(data['severities'])
+        for food, severities in food_severities.items():
+            if len(severities) >= 2:
+                avg = sum(severities) / len(severities)
                 result.append({
                     'food': food,
-                    'count': data['count'],
+                    'count': len(severities),
                     'average_severity': round(avg, 2),
-                    'severities': data['severities'],
+                    'severities': severities,
                 })
         result.sort(key=lambda x: x['average_severity'], reverse=True)
         return result
 
-    def _calculate_weekly_averages(self, entries: List[DayEntry]) -> List[Dict]:
-        if not entries:
-            return []
-        weeks: Dict[date, List[float]] = defaultdict(list)
-        for e in entries:
-            if e.severity is None:
-                continue
-            d = date.fromisoformat(e.date)
-            week_start = d - timedelta(days=d.weekday())
-            weeks[week_start].append(e.severity)
+    def _weekly_averages(self, weeks: Dict[date, List[int]]) -> List[Dict]:
         weekly = []
-        for ws in sorted(weeks.keys()):
+        for ws in sorted(weeks.keys())[-8:]:
             we = ws + timedelta(days=6)
             label = (
                 f"{ws.day}.-{we.day}. {ws.strftime('%b')}"
@@ -131,19 +199,7 @@ class StatisticsCalculator:
                 'average': round(sum(sevs) / len(sevs), 2),
                 'count': len(sevs),
             })
-        return weekly[-8:]
-
-    def _calculate_day_of_week_averages(self, entries: List[DayEntry]) -> Dict[int, float]:
-        day_data: Dict[int, List[float]] = defaultdict(list)
-        for e in entries:
-            if e.severity is None:
-                continue
-            day_data[date.fromisoformat(e.date).weekday()].append(e.severity)
-        return {
-            d: round(sum(v) / len(v), 2) if v else 0
-            for d in range(7)
-            for v in [day_data[d]]
-        }
+        return weekly
 
     def _calculate_streak_info(self, entries: List[DayEntry]) -> Dict:
         if not entries:
@@ -175,13 +231,6 @@ class StatisticsCalculator:
             'best_good_streak': best_good,
         }
 
-    def _weather_distribution(self, entries: List[DayEntry]) -> Dict[str, int]:
-        dist: Dict[str, int] = defaultdict(int)
-        for e in entries:
-            if e.weather:
-                dist[e.weather] += 1
-        return dict(dist)
-
     # ── Pattern detection: foods (original, unchanged API) ────────────────────
 
     def detect_patterns(self, delay_days: int = 2, severity_threshold: int = 4) -> List[Dict]:
@@ -189,30 +238,28 @@ class StatisticsCalculator:
         Detect food → skin-reaction patterns with a configurable time delay.
         Minimum 3 occurrences required for a result to appear.
         """
-        entries = self.data_manager.get_all_entries()
+        entries, days, by_day = self._day_index()
         if len(entries) < 5:
             return []
 
-        emap = self._entry_map(entries)
         patterns: Dict[str, Dict] = defaultdict(lambda: {'total': 0, 'bad': 0, 'details': []})
 
-        for e in entries:
+        for e, day in zip(entries, days):
             if not e.foods:
                 continue
-            edate = date.fromisoformat(e.date)
+            # The window does not depend on the food; look it up once per day
+            hit = self._first_flare(by_day, day, 1, delay_days, severity_threshold)
             for food in e.foods:
                 patterns[food]['total'] += 1
-                for offset in range(1, delay_days + 1):
-                    fut = emap.get(edate + timedelta(days=offset))
-                    if fut and fut.severity is not None and fut.severity >= severity_threshold:
-                        patterns[food]['bad'] += 1
-                        patterns[food]['details'].append({
-                            'food_date': e.date,
-                            'reaction_date': fut.date,
-                            'delay': offset,
-                            'severity': fut.severity,
-                        })
-                        break
+                if hit:
+                    offset, fut = hit
+                    patterns[food]['bad'] += 1
+                    patterns[food]['details'].append({
+                        'food_date': e.date,
+                        'reaction_date': fut.date,
+                        'delay': offset,
+                        'severity': fut.severity,
+                    })
 
         result = []
         for food, data in patterns.items():
@@ -249,13 +296,10 @@ class StatisticsCalculator:
           avg_peak_delay    – avg days until peak after fungal onset
           flare_probability – % of fungal onsets followed by severity ≥4
         """
-        entries = self.data_manager.get_all_entries()
-        if len(entries) < 5:
+        sorted_entries, days, by_day = self._day_index()
+        if len(sorted_entries) < 5:
             return {'insufficient_data': True}
 
-        emap = self._entry_map(entries)
-        sorted_entries = sorted(entries, key=lambda x: x.date)
-
         # Split severities by fungal status
         sev_no_fungus = [
             e.severity for e in sorted_entries
@@ -269,15 +313,14 @@ class StatisticsCalculator:
         # Detect onset events (day fungal_active first becomes True in a sequence)
         onset_events = []
         prev_fungal = False
-        for e in sorted_entries:
+        for e, day in zip(sorted_entries, days):
             current = bool(e.fungal_active)
             if current and not prev_fungal:
                 # Onset detected
-                onset_date = date.fromisoformat(e.date)
                 window_sevs = []
                 for offset in range(0, look_ahead_days + 1):
-                    fut = emap.get(onset_date + timedelta(days=offset))
-                    if fut and fut.severity is not None:
+                    fut = by_day.get(day + offset)
+                    if fut is not None and fut.severity is not None:
                         window_sevs.append((offset, fut.severity))
 
                 if window_sevs:
@@ -319,8 +362,7 @@ class StatisticsCalculator:
           correlation_hint          – human-readable string
           delayed_patterns          – list of detected stress→flare events
         """
-        entries = self.data_manager.get_all_entries()
-        emap = self._entry_map(entries)
+        entries, days, by_day = self._day_index()
 
         # Average severity grouped by stress level (same day)
         sev_by_stress: Dict[int, List[float]] = defaultdict(list)
@@ -337,23 +379,21 @@ class StatisticsCalculator:
         high_stress_flares = 0
         delayed_patterns = []
 
-        for e in entries:
+        for e, day in zip(entries, days):
             if e.stress_level is None or e.stress_level < 4:
                 continue
-            edate = date.fromisoformat(e.date)
             high_stress_events += 1
-            for offset in range(0, delay_days + 1):
-                fut = emap.get(edate + timedelta(days=offset))
-                if fut and fut.severity is not None and fut.severity >= severity_threshold:
-                    high_stress_flares += 1
-                    delayed_patterns.append({
-                        'stress_date': e.date,
-                        'stress_level': e.stress_level,
-                        'reaction_date': fut.date,
-                        'delay': offset,
-                        'severity': fut.severity,
-                    })
-                    break
+            hit = self._first_flare(by_day, day, 0, delay_days, severity_threshold)
+            if hit:
+                offset, fut = hit
+                high_stress_flares += 1
+                delayed_patterns.append({
+                    'stress_date': e.date,
+                    'stress_level': e.stress_level,
+                    'reaction_date': fut.date,
+                    'delay': offset,
+                    'severity': fut.severity,
+                })
 
         flare_prob = (
             round(high_stress_flares / high_stress_events * 100, 1)
@@ -394,7 +434,7 @@ class StatisticsCalculator:
 
     # ── NEW: Nickel-load analysis ─────────────────────────────────────────────
 
-    def get_nickel_analysis(self) -> Dict:
+    def get_nickel_analysis(self, top_n: int = 6) -> Dict:
         """
         Calculate daily nickel load (count of nickel-rich foods consumed)
         and correlate with skin severity.
@@ -402,17 +442,17 @@ class StatisticsCalculator:
         Returns:
           avg_severity_by_nickel_load  – dict {nickel_count: avg_severity}
           high_nickel_flare_prob       – % of high-nickel days (≥2 foods) → flare
-          nickel_food_frequencies      – {food: count} for nickel-rich foods only
+          nickel_food_frequencies      – [(food, count)] of the top_n most frequent
+                                         nickel-rich foods, most frequent first
         """
-        entries = self.data_manager.get_all_entries()
-        emap = self._entry_map(entries)
+        entries, days, by_day = self._day_index()
 
         sev_by_load: Dict[int, List[float]] = defaultdict(list)
         nickel_food_counts: Dict[str, int] = defaultdict(int)
         high_nickel_events = 0
         high_nickel_flares = 0
 
-        for e in entries:
+        for e, day in zip(entries, days):
             nickel_count = sum(1 for f in e.foods if f in NICKEL_RICH_FOODS)
             for f in e.foods:
                 if f in NICKEL_RICH_FOODS:
@@ -423,12 +463,8 @@ class StatisticsCalculator:
 
             if nickel_count >= 2:
                 high_nickel_events += 1
-                edate = date.fromisoformat(e.date)
-                for offset in range(0, 3):
-                    fut = emap.get(edate + timedelta(days=offset))
-                    if fut and fut.severity is not None and fut.severity >= 4:
-                        high_nickel_flares += 1
-                        break
+                if self._first_flare(by_day, day, 0, 2, 4):
+                    high_nickel_flares += 1
 
         return {
             'avg_severity_by_nickel_load': {
@@ -438,8 +474,8 @@ class StatisticsCalculator:
                 round(high_nickel_flares / high_nickel_events * 100, 1)
                 if high_nickel_events else 0
             ),
-            'nickel_food_frequencies': dict(
-                sorted(nickel_food_counts.items(), key=lambda x: x[1], reverse=True)
+            'nickel_food_frequencies': heapq.nlargest(
+                top_n, nickel_food_counts.items(), key=lambda x: x[1]
             ),
         }
 
@@ -447,7 +483,7 @@ class StatisticsCalculator:
 
     def get_weather_analysis(self) -> Dict[str, float]:
         """Return average severity per weather category."""
-        entries = self.data_manager.get_all_entries()
+        entries = self._day_index()[0]
         sev_by_weather: Dict[str, List[float]] = defaultdict(list)
         for e in entries:
             if e.weather and e.severity is not None:
@@ -458,18 +494,17 @@ class StatisticsCalculator:
 
     def get_sleep_analysis(self) -> Dict:
         """Correlate sleep quality with next-day severity."""
-        entries = self.data_manager.get_all_entries()
-        emap = self._entry_map(entries)
+        entries, days, by_day = self._day_index()
 
         sev_by_sleep: Dict[int, List[float]] = defaultdict(list)
         next_day_impact: Dict[int, List[float]] = defaultdict(list)
 
-        for e in entries:
+        for e, day in zip(entries, days):
             if e.sleep_quality is not None and e.severity is not None:
                 sev_by_sleep[e.sleep_quality].append(e.severity)
             if e.sleep_quality is not None:
-                tomorrow = emap.get(date.fromisoformat(e.date) + timedelta(days=1))
-                if tomorrow and tomorrow.severity is not None:
+                tomorrow = by_day.get(day + 1)
+                if tomorrow is not None and tomorrow.severity is not None:
                     next_day_impact[e.sleep_quality].append(tomorrow.severity)
 
         return {
@@ -501,33 +536,32 @@ class StatisticsCalculator:
           trigger_type, trigger_label, total_occurrences,
           triggered_reactions, probability, details
         """
-        entries = self.data_manager.get_all_entries()
+        entries, days, by_day = self._day_index()
         if len(entries) < 5:
             return []
 
-        emap = self._entry_map(entries)
+        # Each day's flare window is the same for every trigger: evaluate it once
+        hits = [self._first_flare(by_day, day, 0, delay_days, severity_threshold) for day in days]
         results: List[Dict] = []
 
-        # Helper: test trigger events
-        def analyse(label: str, ttype: str, event_filter, extra: Dict = None) -> Optional[Dict]:
-            events = [(e, date.fromisoformat(e.date)) for e in entries if event_filter(e)]
+        # Helper: test trigger events (indices into entries)
+        def analyse(label: str, ttype: str, events: List[int], extra: Dict = None) -> Optional[Dict]:
             if not events:
                 return None
             total = len(events)
             bad = 0
             details = []
-            for e, edate in events:
-                for offset in range(0, delay_days + 1):
-                    fut = emap.get(edate + timedelta(days=offset))
-                    if fut and fut.severity is not None and fut.severity >= severity_threshold:
-                        bad += 1
-                        details.append({
-                            'trigger_date': e.date,
-                            'reaction_date': fut.date,
-                            'delay': offset,
-                            'severity': fut.severity,
-                        })
-                        break
+            for i in events:
+                hit = hits[i]
+                if hit:
+                    offset, fut = hit
+                    bad += 1
+                    details.append({
+                        'trigger_date': entries[i].date,
+                        'reaction_date': fut.date,
+                        'delay': offset,
+                        'severity': fut.severity,
+                    })
             if total < 2:
                 return None
             prob = round(bad / total * 100, 1)
@@ -543,76 +577,64 @@ class StatisticsCalculator:
                 r.update(extra)
             return r
 
+        # Group event days per trigger in one pass instead of one scan per trigger
+        food_events: Dict[str, List[int]] = defaultdict(list)
+        weather_events: Dict[str, List[int]] = defaultdict(list)
+        contact_events: Dict[str, List[int]] = defaultdict(list)
+        for i, e in enumerate(entries):
+            for f in dict.fromkeys(e.foods):
+                food_events[f].append(i)
+            if e.weather:
+                weather_events[e.weather].append(i)
+            for c in dict.fromkeys(e.contact_exposures or []):
+                contact_events[c].append(i)
+
+        def days_where(pred) -> List[int]:
+            return [i for i, e in enumerate(entries) if pred(e)]
+
         # Foods
-        all_foods: Dict[str, int] = defaultdict(int)
-        for e in entries:
-            for f in e.foods:
-                all_foods[f] += 1
-        for food in all_foods:
+        for food, events in food_events.items():
             r = analyse(
                 label=food,
                 ttype='food',
-                event_filter=lambda e, f=food: f in e.foods,
+                events=events,
                 extra={'is_nickel_rich': food in NICKEL_RICH_FOODS},
             )
             if r and r['total_occurrences'] >= 3:
                 results.append(r)
 
-        # Stress ≥4
-        r = analyse("Hoher Stress (≥4)", 'stress',
-                    lambda e: e.stress_level is not None and e.stress_level >= 4)
-        if r:
-            results.append(r)
-
-        # Stress = 5
-        r = analyse("Extremer Stress (5)", 'stress',
-                    lambda e: e.stress_level == 5)
-        if r:
-            results.append(r)
-
-        # Fungal active
-        r = analyse("Zehenpilz aktiv 🍄", 'fungal',
-                    lambda e: e.fungal_active is True)
-        if r:
-            results.append(r)
-
-        # Bad sleep (≤2)
-        r = analyse("Schlechter Schlaf (≤2)", 'sleep',
-                    lambda e: e.sleep_quality is not None and e.sleep_quality <= 2)
-        if r:
-            results.append(r)
-
-        # Good sleep (≥4) — protective factor
-        r = analyse("Guter Schlaf (≥4)", 'sleep',
-                    lambda e: e.sleep_quality is not None and e.sleep_quality >= 4)
-        if r:
-            results.append(r)
+        fixed_triggers = (
+            ("Hoher Stress (≥4)", 'stress',
+             lambda e: e.stress_level is not None and e.stress_level >= 4),
+            ("Extremer Stress (5)", 'stress',
+             lambda e: e.stress_level == 5),
+            ("Zehenpilz aktiv 🍄", 'fungal',
+             lambda e: e.fungal_active is True),
+            ("Schlechter Schlaf (≤2)", 'sleep',
+             lambda e: e.sleep_quality is not None and e.sleep_quality <= 2),
+            # Good sleep — protective factor
+            ("Guter Schlaf (≥4)", 'sleep',
+             lambda e: e.sleep_quality is not None and e.sleep_quality >= 4),
+        )
+        for label, ttype, pred in fixed_triggers:
+            r = analyse(label, ttype, days_where(pred))
+            if r:
+                results.append(r)
 
         # Weather types
-        weathers: Dict[str, int] = defaultdict(int)
-        for e in entries:
-            if e.weather:
-                weathers[e.weather] += 1
-        for w in weathers:
-            r = analyse(f"Wetter: {w}", 'weather',
-                        lambda e, ww=w: e.weather == ww)
+        for w, events in weather_events.items():
+            r = analyse(f"Wetter: {w}", 'weather', events)
             if r and r['total_occurrences'] >= 3:
                 results.append(r)
 
         # Sweating
-        r = analyse("Starkes Schwitzen 💧", 'sweating',
-                    lambda e: e.sweating is True)
+        r = analyse("Starkes Schwitzen 💧", 'sweating', days_where(lambda e: e.sweating is True))
         if r:
             results.append(r)
 
         # Contact exposures
-        contact_items: Dict[str, int] = defaultdict(int)
-        for e in entries:
-            for c in (e.contact_exposures or []):
-                contact_items[c] += 1
-        for item in contact_items:
-            r = analyse(f"Kontakt: {item}", 'contact',
-                        lambda e, ci=item: ci in (e.contact_exposures or []))
+        for item, events in contact_events.items():
+            r = analyse(f"Kontakt: {item}", 'contact', events)
             if r and r['total_occurrences'] >= 3:
                 results.append(r)
 
@@ -622,16 +644,14 @@ class StatisticsCalculator:
     # ── Legacy helpers (kept for backward compat) ──────────────────────────────
 
     def get_potential_triggers(self, threshold: float = 3.5, min_occurrences: int = 3) -> List[Dict]:
-        entries = self.data_manager.get_all_entries()
         return [
-            d for d in self._calculate_food_correlations(entries)
+            d for d in self._all_entry_food_correlations()
             if d['average_severity'] >= threshold and d['count'] >= min_occurrences
         ]
 
     def get_safe_foods(self, threshold: float = 2.5, min_occurrences: int = 3) -> List[Dict]:
-        entries = self.data_manager.get_all_entries()
         safe = [
-            d for d in self._calculate_food_correlations(entries)
+            d for d in self._all_entry_food_correlations()
             if d['average_severity'] <= threshold and d['count'] >= min_occurrences
         ]
         safe.sort(key=lambda x: x['average_severity'])
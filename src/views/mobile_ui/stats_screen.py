@@ -221,7 +221,7 @@ class StatsScreen(MDScreen):
                 adaptive_height=True,
             ))
             max_count = top_foods[0][1] if top_foods else 1
-            for food, count in top_foods[:10]:
+            for food, count in top_foods:
                 pct = (count / max_count) * 100
                 card.add_widget(self._bar_row(food, count, pct, "#1565C0"))
             self.stats_content.add_widget(card)
@@ -409,11 +409,13 @@ class StatsScreen(MDScreen):
                 adaptive_height=True,
             ))
             stress_names = {1: "Entspannt", 2: "Leicht", 3: "Mittel", 4: "Hoch", 5: "Extrem"}
-            for level in sorted(sev_by_stress):
-                avg = sev_by_stress[level]
+            for level, name in stress_names.items():
+                avg = sev_by_stress.get(level)
+                if avg is None:
+                    continue
                 color = COLOR_DANGER if avg >= 4 else (COLOR_WARNING if avg >= 3 else None)
                 card.add_widget(self._info_row(
-                    f"Stress {level} ({stress_names.get(level, '')})", f"Ø {avg:.1f}", color,
+                    f"Stress {level} ({name})", f"Ø {avg:.1f}", color,
                 ))
             prob = stress.get("high_stress_flare_probability", 0)
             card.add_widget(self._info_row(
@@ -434,11 +436,13 @@ class StatsScreen(MDScreen):
                 adaptive_height=True,
             ))
             sleep_names = {1: "Schlecht", 2: "Wenig", 3: "OK", 4: "Gut", 5: "Sehr gut"}
-            for q in sorted(same_day):
-                avg = same_day[q]
+            for q, name in sleep_names.items():
+                avg = same_day.get(q)
+                if avg is None:
+                    continue
                 color = COLOR_SUCCESS if avg <= 2 else (COLOR_DANGER if avg >= 4 else None)
                 card.add_widget(self._info_row(
-                    f"Schlaf {q} ({sleep_names.get(q, '')})", f"Ø {avg:.1f}", color,
+                    f"Schlaf {q} ({name})", f"Ø {avg:.1f}", color,
                 ))
             self.stats_content.add_widget(card)
 
@@ -459,7 +463,7 @@ class StatsScreen(MDScreen):
 
         # Nickel
         nickel = self.stats_calculator.get_nickel_analysis()
-        nickel_foods = nickel.get("nickel_food_frequencies", {})
+        nickel_foods = nickel.get("nickel_food_frequencies", [])
         if nickel_foods:
             card = _SectionCard()
             card.add_widget(MDLabel(
@@ -473,7 +477,7 @@ class StatsScreen(MDScreen):
                 "Schub bei ≥2 Nickel-LM", f"{prob}%",
                 COLOR_DANGER if prob >= 50 else COLOR_WARNING if prob >= 25 else COLOR_SUCCESS,
             ))
-            for food, cnt in list(nickel_foods.items())[:6]:
+            for food, cnt in nickel_foods:
                 card.add_widget(self._info_row(food, f"{cnt}×", "#E65100"))
             self.stats_content.add_widget(card)
 
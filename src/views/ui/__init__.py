@@ -1,45 +1,61 @@
 """
 UI Components for Neuro-Tracker Application
+
+Widgets are imported on first attribute access, so importing one module
+(e.g. views.ui.styles) does not pull in every PyQt5 widget module.
 """
 
-from views.ui.styles import (
-    get_main_stylesheet,
-    get_severity_button_style,
-    get_day_card_style,
-    get_panel_style,
-    get_calendar_header_style,
-    get_food_tag_style,
-    get_statistics_card_style,
-    get_empty_state_style,
-    severity_to_color,
-    get_contrast_text_color
-)
-
-from views.ui.day_card import DayCard, EmptyDayCard
-from views.ui.calendar_widget import CalendarWidget
-from views.ui.entry_panel import EntryPanel
-from views.ui.statistics_dialog import StatisticsDialog, StatCard
-from views.ui.main_window import MainWindow
-
-__all__ = [
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
     # Styles
-    'get_main_stylesheet',
-    'get_severity_button_style',
-    'get_day_card_style',
-    'get_panel_style',
-    'get_calendar_header_style',
-    'get_food_tag_style',
-    'get_statistics_card_style',
-    'get_empty_state_style',
-    'severity_to_color',
-    'get_contrast_text_color',
+    'get_main_stylesheet': 'views.ui.styles',
+    'get_severity_button_style': 'views.ui.styles',
+    'get_day_card_style': 'views.ui.styles',
+    'get_panel_style': 'views.ui.styles',
+    'get_calendar_header_style': 'views.ui.styles',
+    'get_food_tag_style': 'views.ui.styles',
+    'get_statistics_card_style': 'views.ui.styles',
+    'get_empty_state_style': 'views.ui.styles',
+    'severity_to_color': 'views.ui.styles',
+    'get_contrast_text_color': 'views.ui.styles',
 
     # Widgets
-    'DayCard',
-    'EmptyDayCard',
-    'CalendarWidget',
-    'EntryPanel',
-    'StatisticsDialog',
-    'StatCard',
-    'MainWindow',
-]
+    'DayCard': 'views.ui.day_card',
+    'EmptyDayCard': 'views.ui.day_card',
+    'CalendarWidget': 'views.ui.calendar_widget',
+    'EntryPanel': 'views.ui.entry_panel',
+    'StatisticsDialog': 'views.ui.statistics_dialog',
+    'StatCard': 'views.ui.statistics_dialog',
+    'MainWindow': 'views.ui.main_window',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from views.ui.styles import (
+        get_main_stylesheet,
+        get_severity_button_style,
+        get_day_card_style,
+        get_panel_style,
+        get_calendar_header_style,
+        get_food_tag_style,
+        get_statistics_card_style,
+        get_empty_state_style,
+        severity_to_color,
+        get_contrast_text_color
+    )
+    from views.ui.day_card import DayCard, EmptyDayCard
+    from views.ui.calendar_widget import CalendarWidget
+    from views.ui.entry_panel import EntryPanel
+    from views.ui.statistics_dialog import StatisticsDialog, StatCard
+    from views.ui.main_window import MainWindow
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
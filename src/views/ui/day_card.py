@@ -4,6 +4,7 @@ Displays a single day's entry in the calendar view with trigger indicators.
 """
 
 from datetime import date
+from typing import Optional
 from PyQt5.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QWidget
 )
@@ -14,6 +15,79 @@ from config import SEVERITY_COLORS, COLOR_TEXT_SECONDARY, COLOR_PRIMARY, FOOD_EM
 from models.day_entry import DayEntry
 
 
+_SEV_TEXTS = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
+_DAY_ABBR = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+_MONTH_ABBR = ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
+               "Jul", "Aug", "Sep", "Okt", "Nov", "Dez")
+
+_DAY_FONT = QFont("Segoe UI", 10, QFont.Bold)
+_DATE_FONT = QFont("Segoe UI", 18, QFont.Bold)
+_INDICATOR_FONT = QFont("Segoe UI", 11, QFont.Bold)
+
+# Static label styles, shared by every card instead of rebuilt per card
+_CAPTION_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;"
+_TRIGGER_QSS = "font-size: 13px; padding: 0;"
+_NOTES_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-size: 10px;"
+_TODAY_DATE_QSS = f"color: {COLOR_PRIMARY}; font-weight: bold;"
+_EMPTY_CARD_QSS = """
+    QFrame {
+        background-color: #F5F5F5;
+        border: 1px dashed #E0E0E0;
+        border-radius: 8px;
+    }
+"""
+
+# Severity indicator badge, keyed by severity (None = no entry)
+_UNKNOWN_SEVERITY = "unknown"
+_INDICATOR_QSS = {
+    sev: f"""
+        background-color: {color}; color: white;
+        border-radius: 12px; font-weight: bold;
+    """
+    for sev, color in (*SEVERITY_COLORS.items(), (_UNKNOWN_SEVERITY, "#9E9E9E"))
+}
+_INDICATOR_QSS[None] = f"""
+    background-color: #E0E0E0; color: {COLOR_TEXT_SECONDARY}; border-radius: 12px;
+"""
+
+# Food emoji row, keyed by "has foods"
+_FOOD_QSS = {
+    True: "font-size: 12px;",
+    False: f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;",
+}
+
+
+def _card_qss(severity, is_selected: bool, is_today: bool) -> str:
+    base_color = SEVERITY_COLORS.get(severity, "#E0E0E0")
+    if is_selected:
+        border_color, border_width, bg = COLOR_PRIMARY, "3px", "#E3F2FD"
+    elif is_today:
+        border_color, border_width, bg = "#424242", "2px", "#FFFFFF"
+    else:
+        border_color, border_width, bg = "#E0E0E0", "1px", "#FFFFFF"
+    return f"""
+        QFrame#dayCard {{
+            background-color: {bg};
+            border: {border_width} solid {border_color};
+            border-radius: 8px;
+            border-left: 4px solid {base_color};
+        }}
+        QFrame#dayCard:hover {{
+            border-color: {COLOR_PRIMARY};
+            background-color: #FAFAFA;
+        }}
+    """
+
+
+# Card frame, keyed by (severity, is_selected, is_today)
+_CARD_QSS = {
+    (sev, selected, today): _card_qss(sev, selected, today)
+    for sev in (None, _UNKNOWN_SEVERITY, *SEVERITY_COLORS)
+    for selected in (False, True)
+    for today in (False, True)
+}
+
+
 class DayCard(QFrame):
     """
     A card widget representing a single day in the calendar.
@@ -28,9 +102,10 @@ class DayCard(QFrame):
         self.entry = entry
         self._is_selected = False
         self._is_today = display_date == date.today()
+        self._indicator_key = self._food_key = self._card_key = object()
+        self._entry_key = self._visual_key(entry)
 
         self.setup_ui()
-        self.update_style()
 
     def setup_ui(self):
         self.setFixedSize(160, 150)
@@ -43,12 +118,11 @@ class DayCard(QFrame):
 
         # Header: day name + date number
         header = QHBoxLayout()
-        day_names = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
-        self.day_label = QLabel(day_names[self.display_date.weekday()])
-        self.day_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.day_label = QLabel(_DAY_ABBR[self.display_date.weekday()])
+        self.day_label.setFont(_DAY_FONT)
 
         self.date_label = QLabel(str(self.display_date.day))
-        self.date_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.date_label.setFont(_DATE_FONT)
         self.date_label.setAlignment(Qt.AlignRight)
 
         header.addWidget(self.day_label)
@@ -58,10 +132,8 @@ class DayCard(QFrame):
 
         # Month indicator (only if not current month)
         if self.display_date.month != date.today().month:
-            month_names = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
-                          "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-            month_lbl = QLabel(month_names[self.display_date.month - 1])
-            month_lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+            month_lbl = QLabel(_MONTH_ABBR[self.display_date.month - 1])
+            month_lbl.setStyleSheet(_CAPTION_QSS)
             month_lbl.setAlignment(Qt.AlignRight)
             layout.addWidget(month_lbl)
 
@@ -76,10 +148,10 @@ class DayCard(QFrame):
         self.severity_indicator = QLabel()
         self.severity_indicator.setFixedSize(24, 24)
         self.severity_indicator.setAlignment(Qt.AlignCenter)
-        self.severity_indicator.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        self.severity_indicator.setFont(_INDICATOR_FONT)
 
         self.severity_text = QLabel()
-        self.severity_text.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+        self.severity_text.setStyleSheet(_CAPTION_QSS)
 
         sev_layout.addWidget(self.severity_indicator)
         sev_layout.addWidget(self.severity_text)
@@ -88,110 +160,117 @@ class DayCard(QFrame):
 
         # Trigger icons row
         self.trigger_label = QLabel()
-        self.trigger_label.setStyleSheet("font-size: 13px; padding: 0;")
+        self.trigger_label.setStyleSheet(_TRIGGER_QSS)
         layout.addWidget(self.trigger_label)
 
         # Food emojis
         self.food_label = QLabel()
-        self.food_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
         layout.addWidget(self.food_label)
 
         # Notes preview
         self.notes_preview = QLabel()
-        self.notes_preview.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 10px;")
+        self.notes_preview.setStyleSheet(_NOTES_QSS)
         self.notes_preview.setWordWrap(True)
         self.notes_preview.setMaximumHeight(30)
         layout.addWidget(self.notes_preview)
 
-        self.update_content()
-
-    def update_content(self):
-        if self.entry:
-            severity = self.entry.severity
-            color = SEVERITY_COLORS.get(severity, "#9E9E9E")
-
-            self.severity_indicator.setText(str(severity))
-            self.severity_indicator.setStyleSheet(f"""
-                background-color: {color}; color: white;
-                border-radius: 12px; font-weight: bold;
-            """)
-
-            sev_texts = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
-            self.severity_text.setText(sev_texts.get(severity, ""))
-
-            # Trigger icons
-            icons = []
-            if self.entry.fungal_active:
-                icons.append("🍄")
-            if self.entry.stress_level is not None and self.entry.stress_level >= 4:
-                icons.append("😰")
-            if self.entry.sweating:
-                icons.append("💧")
-            if self.entry.sleep_quality is not None and self.entry.sleep_quality <= 2:
-                icons.append("😴")
-            if self.entry.weather and "Trocken" in self.entry.weather:
-                icons.append("🏜")
-            self.trigger_label.setText(" ".join(icons))
-
-            # Food emojis
-            if self.entry.foods:
-                emojis = [FOOD_EMOJIS.get(f, "🍽️") for f in self.entry.foods[:5]]
-                self.food_label.setText(" ".join(emojis))
-                self.food_label.setStyleSheet("font-size: 12px;")
+        if self._is_today:
+            self.date_label.setStyleSheet(_TODAY_DATE_QSS)
+
+        self._refresh()
+
+    def _refresh(self):
+        """Apply entry content and frame style in a single paint pass."""
+        entry = self.entry
+        severity = entry.severity if entry else None
+
+        self.setUpdatesEnabled(False)
+        try:
+            if entry:
+                self.severity_indicator.setText(str(severity))
+                self.severity_text.setText(_SEV_TEXTS.get(severity, ""))
+
+                # Trigger icons
+                icons = []
+                if entry.fungal_active:
+                    icons.append("🍄")
+                if entry.stress_level is not None and entry.stress_level >= 4:
+                    icons.append("😰")
+                if entry.sweating:
+                    icons.append("💧")
+                if entry.sleep_quality is not None and entry.sleep_quality <= 2:
+                    icons.append("😴")
+                if entry.weather and "Trocken" in entry.weather:
+                    icons.append("🏜")
+                self.trigger_label.setText(" ".join(icons))
+
+                # Food emojis
+                if entry.foods:
+                    emojis = [FOOD_EMOJIS.get(f, "🍽️") for f in entry.foods[:5]]
+                    self.food_label.setText(" ".join(emojis))
+                else:
+                    self.food_label.setText("")
+
+                # Notes preview
+                notes = entry.skin_notes or entry.food_notes or ""
+                self.notes_preview.setText(notes[:32] + "..." if len(notes) > 35 else notes)
             else:
+                self.severity_indicator.setText("-")
+                self.severity_text.setText("Kein Eintrag")
+                self.trigger_label.setText("")
                 self.food_label.setText("")
-                self.food_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+                self.notes_preview.setText("")
 
-            # Notes preview
-            notes = self.entry.skin_notes or self.entry.food_notes or ""
-            if notes:
-                self.notes_preview.setText(notes[:32] + "..." if len(notes) > 35 else notes)
+            # Stylesheets are only re-applied when their lookup key changes
+            if entry is None or severity in SEVERITY_COLORS:
+                indicator_key = severity
             else:
-                self.notes_preview.setText("")
-        else:
-            self.severity_indicator.setText("-")
-            self.severity_indicator.setStyleSheet(f"""
-                background-color: #E0E0E0; color: {COLOR_TEXT_SECONDARY}; border-radius: 12px;
-            """)
-            self.severity_text.setText("Kein Eintrag")
-            self.trigger_label.setText("")
-            self.food_label.setText("")
-            self.notes_preview.setText("")
-
-    def update_style(self):
-        severity = self.entry.severity if self.entry else None
-        base_color = SEVERITY_COLORS.get(severity, "#E0E0E0") if severity else "#E0E0E0"
-
-        if self._is_selected:
-            border_color, border_width, bg = COLOR_PRIMARY, "3px", "#E3F2FD"
-        elif self._is_today:
-            border_color, border_width, bg = "#424242", "2px", "#FFFFFF"
-        else:
-            border_color, border_width, bg = "#E0E0E0", "1px", "#FFFFFF"
-
-        self.setStyleSheet(f"""
-            QFrame#dayCard {{
-                background-color: {bg};
-                border: {border_width} solid {border_color};
-                border-radius: 8px;
-                border-left: 4px solid {base_color};
-            }}
-            QFrame#dayCard:hover {{
-                border-color: {COLOR_PRIMARY};
-                background-color: #FAFAFA;
-            }}
-        """)
-        if self._is_today:
-            self.date_label.setStyleSheet(f"color: {COLOR_PRIMARY}; font-weight: bold;")
+                indicator_key = _UNKNOWN_SEVERITY
+            if indicator_key != self._indicator_key:
+                self._indicator_key = indicator_key
+                self.severity_indicator.setStyleSheet(_INDICATOR_QSS[indicator_key])
+
+            has_foods = bool(entry and entry.foods)
+            if has_foods != self._food_key:
+                self._food_key = has_foods
+                self.food_label.setStyleSheet(_FOOD_QSS[has_foods])
+
+            card_key = (indicator_key, self._is_selected, self._is_today)
+            if card_key != self._card_key:
+                self._card_key = card_key
+                self.setStyleSheet(_CARD_QSS[card_key])
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+
+    @staticmethod
+    def _visual_key(entry: Optional[DayEntry]) -> Optional[tuple]:
+        """Everything the card renders from an entry, as a comparable tuple."""
+        if entry is None:
+            return None
+        return (
+            entry.severity, tuple(entry.foods[:5]),
+            entry.fungal_active, entry.stress_level, entry.sweating,
+            entry.sleep_quality, entry.weather,
+            entry.skin_notes or entry.food_notes or "",
+        )
+
+    @staticmethod
+    def entries_visually_equal(a: Optional[DayEntry], b: Optional[DayEntry]) -> bool:
+        """True if a card showing `a` would look the same showing `b`."""
+        return DayCard._visual_key(a) == DayCard._visual_key(b)
 
     def set_entry(self, entry: DayEntry):
+        key = self._visual_key(entry)
         self.entry = entry
-        self.update_content()
-        self.update_style()
+        if key == self._entry_key:
+            return
+        self._entry_key = key
+        self._refresh()
 
     def set_selected(self, selected: bool):
         self._is_selected = selected
-        self.update_style()
+        self._refresh()
 
     def is_selected(self) -> bool:
         return self._is_selected
@@ -206,10 +285,4 @@ class EmptyDayCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(160, 150)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #F5F5F5;
-                border: 1px dashed #E0E0E0;
-                border-radius: 8px;
-            }
-        """)
+        self.setStyleSheet(_EMPTY_CARD_QSS)
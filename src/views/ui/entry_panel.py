@@ -5,15 +5,17 @@ Trigger modules are shown/hidden based on SettingsManager.
 """
 
 from datetime import date
+from functools import lru_cache, partial
 from typing import List, Optional
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QFrame, QScrollArea, QMessageBox, QSizePolicy,
-    QGridLayout, QCheckBox, QComboBox, QTabWidget
+    QTextEdit, QFrame, QScrollArea, QSizePolicy,
+    QCheckBox, QComboBox, QTabWidget, QStackedWidget, QListView,
+    QStyle, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QSize
+from PyQt5.QtGui import QFont, QColor, QPainter, QStandardItem, QStandardItemModel
 import json
 
 from config import (
@@ -29,6 +31,307 @@ from models.food_manager import FoodManager
 from models.settings_manager import SettingsManager
 
 
+def _rating_button_qss(prop: str, colors: dict) -> str:
+    """Rules for one 1-5 rating row, selected state driven by [selected]."""
+    rules = []
+    for val, c in colors.items():
+        sel = f'QPushButton[{prop}="{val}"]'
+        rules.append(f"""
+    {sel} {{
+        background-color: white; color: {c};
+        border: 2px solid {c}; border-radius: 22px;
+        font-weight: bold; font-size: 15px;
+    }}
+    {sel}[selected="false"]:hover {{ background-color: {c}20; }}
+    {sel}[selected="true"] {{ background-color: {c}; color: white; }}""")
+    return "".join(rules)
+
+
+# One stylesheet for the whole panel. Widgets pick their rules through
+# object names and dynamic properties, so state changes only need a
+# setProperty() + repolish instead of a fresh setStyleSheet() parse.
+_PANEL_QSS = f"""
+    QWidget {{ background-color: white; }}
+
+    QLabel#dateLabel {{ color: {COLOR_TEXT_PRIMARY}; }}
+    QLabel#weekdayLabel {{ color: {COLOR_TEXT_SECONDARY}; font-size: 14px; }}
+    QLabel[styleClass="emptyHint"] {{
+        color: {COLOR_TEXT_SECONDARY}; font-style: italic; padding: 16px;
+    }}
+    QLabel[styleClass="caption"] {{ color: {COLOR_TEXT_SECONDARY}; font-size: 12px; }}
+    QLabel[styleClass="fieldLabel"] {{ color: {COLOR_TEXT_SECONDARY}; }}
+    QLabel[styleClass="scaleHint"] {{ color: {COLOR_TEXT_SECONDARY}; font-size: 11px; }}
+    QLabel#fungalHint {{ color: #FF9800; font-size: 11px; }}
+
+    QTabWidget QLabel {{ border: none; }}
+    QFrame[styleClass="separator"] {{ background-color: #E0E0E0; }}
+    QScrollArea {{ border: none; }}
+
+    QTabWidget::pane {{
+        border: none;
+        background-color: white;
+    }}
+    QTabBar::tab {{
+        padding: 8px 12px;
+        margin: 0 2px;
+        background-color: #F5F5F5;
+        border: 1px solid #E0E0E0;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    QTabBar::tab:selected {{
+        background-color: white;
+        border-bottom: 2px solid {COLOR_PRIMARY};
+        color: {COLOR_PRIMARY};
+    }}
+    QTabBar::tab:!selected {{
+        color: {COLOR_TEXT_SECONDARY};
+    }}
+
+    QTextEdit {{
+        border: 1px solid #E0E0E0; border-radius: 4px;
+        padding: 8px; font-size: 13px;
+    }}
+    QTextEdit:focus {{ border: 2px solid {COLOR_PRIMARY}; }}
+
+    QComboBox {{
+        padding: 6px 10px; border: 1px solid #E0E0E0;
+        border-radius: 4px; font-size: 12px;
+    }}
+    QComboBox:focus {{ border: 2px solid {COLOR_PRIMARY}; }}
+
+    QCheckBox {{ font-size: 12px; padding: 4px; }}
+    QCheckBox::indicator {{ width: 16px; height: 16px; }}
+    QCheckBox::indicator:checked {{
+        background-color: {COLOR_PRIMARY};
+        border: 1px solid {COLOR_PRIMARY}; border-radius: 3px;
+    }}
+    QCheckBox::indicator:unchecked {{
+        background-color: white; border: 1px solid #BDBDBD; border-radius: 3px;
+    }}
+
+    QListView[styleClass="checkList"] {{
+        border: none; background-color: white; font-size: 12px; outline: 0;
+    }}
+    QListView[styleClass="checkList"]::item {{ padding: 4px; border: none; }}
+    QListView[styleClass="checkList"]::item:hover {{ background-color: transparent; }}
+    QListView[styleClass="checkList"]::item:focus {{ background-color: #E3F2FD; }}
+    QListView[styleClass="checkList"]::indicator {{ width: 16px; height: 16px; }}
+    QListView[styleClass="checkList"]::indicator:checked {{
+        background-color: {COLOR_PRIMARY};
+        border: 1px solid {COLOR_PRIMARY}; border-radius: 3px;
+    }}
+    QListView[styleClass="checkList"]::indicator:unchecked {{
+        background-color: white; border: 1px solid #BDBDBD; border-radius: 3px;
+    }}
+
+    QCheckBox#fungalCheckbox {{
+        font-size: 13px; padding: 6px;
+        border: 1px solid #E0E0E0; border-radius: 6px;
+    }}
+    QCheckBox#fungalCheckbox:checked {{
+        background-color: #FFF3E0; border: 2px solid #FF9800; font-weight: bold;
+    }}
+    QCheckBox#fungalCheckbox::indicator {{ width: 18px; height: 18px; }}
+    QCheckBox#fungalCheckbox::indicator:checked {{
+        background-color: #FF9800; border: 1px solid #FF9800; border-radius: 3px;
+    }}
+{_rating_button_qss("severity", SEVERITY_COLORS)}
+{_rating_button_qss("stress_val", STRESS_COLORS)}
+{_rating_button_qss("sleep_val", SLEEP_COLORS)}
+
+    QWidget#actionBar, QWidget#actionBar QLabel {{ border-top: 1px solid #E0E0E0; }}
+    QPushButton#saveButton {{
+        background-color: {COLOR_SUCCESS}; color: white; border: none;
+        border-radius: 4px; padding: 8px 16px; font-size: 12px; font-weight: bold;
+    }}
+    QPushButton#saveButton:hover {{ background-color: #388E3C; }}
+    QPushButton#saveButton:disabled {{ background-color: #BDBDBD; }}
+    QPushButton#deleteButton {{
+        background-color: white; color: {COLOR_DANGER};
+        border: 1px solid {COLOR_DANGER}; border-radius: 4px;
+        padding: 8px 16px; font-size: 12px;
+    }}
+    QPushButton#deleteButton:hover {{ background-color: #FFEBEE; }}
+    QLabel#statusLabel {{
+        color: {COLOR_SUCCESS}; font-size: 13px; font-weight: bold; padding: 5px;
+    }}
+    QLabel#statusLabel[error="true"] {{ color: {COLOR_DANGER}; }}
+"""
+
+
+_WEEKDAYS = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+_MONTHS = ("Januar", "Februar", "März", "April", "Mai", "Juni",
+           "Juli", "August", "September", "Oktober", "November", "Dezember")
+_SEVERITY_DESCS = {
+    1: "Sehr gut — Haut ist klar",
+    2: "Gut — Leichte Rötungen",
+    3: "Mittel — Moderate Symptome",
+    4: "Schlecht — Deutliche Symptome",
+    5: "Sehr schlecht — Starke Symptome",
+}
+
+_FLUSH_DELAY_MS = 500
+
+# Trigger modules as bits of EntryPanel._active_mods
+_MOD_STRESS = 1 << 0
+_MOD_FUNGAL = 1 << 1
+_MOD_SLEEP = 1 << 2
+_MOD_WEATHER = 1 << 3
+_MOD_SWEATING = 1 << 4
+_MOD_CONTACT = 1 << 5
+_MOD_BITS = {
+    "stress": _MOD_STRESS, "fungal": _MOD_FUNGAL, "sleep": _MOD_SLEEP,
+    "weather": _MOD_WEATHER, "sweating": _MOD_SWEATING, "contact": _MOD_CONTACT,
+}
+
+_TITLE_FONT = QFont("Segoe UI", 14, QFont.Bold)
+_SECTION_FONT = QFont("Segoe UI", 13, QFont.Bold)
+_FIELD_FONT = QFont("Segoe UI", 12)
+
+_NICKEL_SET = frozenset(NICKEL_RICH_FOODS)
+# Combo index per weather option; 0 is "— nicht erfasst —"
+_WEATHER_INDEX = {opt: i for i, opt in enumerate(WEATHER_OPTIONS, start=1)}
+
+
+@lru_cache(maxsize=1)
+def _load_food_suggestions() -> tuple:
+    """Read the food suggestion list once per process."""
+    try:
+        with open(FOOD_SUGGESTIONS_FILE, "r", encoding="utf-8") as f:
+            return tuple(json.load(f))
+    except Exception:
+        return ("Milch", "Weizen", "Eier", "Nüsse", "Schokolade")
+
+
+class _CheckDelegate(QStyledItemDelegate):
+    """Paints a checked indicator in the item's own colour, if it has one.
+
+    The QSS indicator rule applies to every item of the view alike; items
+    carrying _CheckList._INDICATOR_ROLE get their checked box filled over.
+    """
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        color = index.data(_CheckList._INDICATOR_ROLE)
+        if not color or index.data(Qt.CheckStateRole) != Qt.Checked:
+            return
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        rect = opt.widget.style().subElementRect(
+            QStyle.SE_ItemViewItemCheckIndicator, opt, opt.widget
+        )
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor(color))
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 3, 3)
+        painter.restore()
+
+
+class _CheckList(QListView):
+    """Two-column list of checkable items backed by one model.
+
+    Replaces a grid of QCheckBox widgets: items are painted by the view's
+    delegate instead of each being a widget. A click anywhere on a row
+    toggles it, like clicking a checkbox label; Space or Enter toggles the
+    current row from the keyboard.
+    """
+
+    _ROW_HEIGHT = 30
+    _KEY_ROLE = Qt.UserRole + 1
+    _INDICATOR_ROLE = Qt.UserRole + 2
+    _TOGGLE_KEYS = (Qt.Key_Space, Qt.Key_Return, Qt.Key_Enter)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setProperty("styleClass", "checkList")
+        self.setModel(QStandardItemModel(self))
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setItemDelegate(_CheckDelegate(self))
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setCursor(Qt.PointingHandCursor)
+        self.clicked.connect(self._toggle)
+        self._items: dict = {}
+
+    def add_item(self, key: str, text: str, tooltip: str = "", color: str = "",
+                 indicator: str = ""):
+        item = QStandardItem(text)
+        # Not user-checkable: the delegate would toggle on an indicator
+        # click and _toggle again on clicked(); rows toggle via _toggle only
+        item.setFlags(Qt.ItemIsEnabled)
+        item.setData(Qt.Unchecked, Qt.CheckStateRole)
+        item.setData(key, self._KEY_ROLE)
+        item.setSizeHint(self.gridSize())
+        if tooltip:
+            item.setToolTip(tooltip)
+        if color:
+            item.setForeground(QColor(color))
+        if indicator:
+            item.setData(indicator, self._INDICATOR_ROLE)
+        self.model().appendRow(item)
+        self._items[key] = item
+        rows = (len(self._items) + 1) // 2
+        self.setFixedHeight(rows * self._ROW_HEIGHT + 2 * self.frameWidth())
+
+    def checked_keys(self) -> list:
+        return [k for k, item in self._items.items() if item.checkState() == Qt.Checked]
+
+    def set_checked(self, wanted: set):
+        """Check exactly the `wanted` keys, touching only items that differ."""
+        for key, item in self._items.items():
+            state = Qt.Checked if key in wanted else Qt.Unchecked
+            if item.checkState() != state:
+                item.setCheckState(state)
+
+    def _toggle(self, index):
+        item = self.model().itemFromIndex(index)
+        item.setCheckState(
+            Qt.Unchecked if item.checkState() == Qt.Checked else Qt.Checked
+        )
+
+    def keyPressEvent(self, event):
+        index = self.currentIndex()
+        if event.key() in self._TOGGLE_KEYS and index.isValid():
+            self._toggle(index)
+            event.accept()
+            return
+        super().keyPressEvent(event)
+
+    def resizeEvent(self, event):
+        # Two columns; one pixel of slack or the flow wraps after each item.
+        # Items fill their cell, otherwise the delegate's size estimate
+        # (which ignores the QSS indicator) elides the text.
+        cell = QSize((self.viewport().width() - 1) // 2, self._ROW_HEIGHT)
+        if cell != self.gridSize():
+            self.setGridSize(cell)
+            for item in self._items.values():
+                item.setSizeHint(cell)
+        super().resizeEvent(event)
+
+
+def _set_plain_text(edit: QTextEdit, text: str):
+    """Replace the text of `edit` unless it already matches."""
+    if edit.toPlainText() != text:
+        with QSignalBlocker(edit):
+            edit.setPlainText(text)
+
+
+def _repolish(widget: QWidget):
+    """Re-evaluate stylesheet rules after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 class EntryPanel(QWidget):
     """
     Left panel with tab navigation for day entry editing.
@@ -52,13 +355,19 @@ class EntryPanel(QWidget):
         self.current_date: Optional[date] = None
         self.current_entry: Optional[DayEntry] = None
 
+        # Saves/deletes stay in memory until the edits pause
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.data_manager.flush)
+
         self.setFixedWidth(ENTRY_PANEL_WIDTH)
         self.setup_ui()
 
     # ── Main UI ────────────────────────────────────────────────────────────────
 
     def setup_ui(self):
-        self.setStyleSheet("QWidget { background-color: white; }")
+        self.setStyleSheet(_PANEL_QSS)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -66,49 +375,48 @@ class EntryPanel(QWidget):
 
         # ── Date header (always visible) ───────────────────────────────────────
         header = QWidget()
-        header.setStyleSheet("QWidget { background-color: white; }")
         header_layout = QVBoxLayout(header)
         header_layout.setContentsMargins(20, 16, 20, 12)
         header_layout.setSpacing(4)
 
         self.date_label = QLabel("Datum auswählen")
         self.date_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
-        self.date_label.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY};")
+        self.date_label.setObjectName("dateLabel")
         header_layout.addWidget(self.date_label)
 
         self.weekday_label = QLabel("")
-        self.weekday_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 14px;")
+        self.weekday_label.setObjectName("weekdayLabel")
         header_layout.addWidget(self.weekday_label)
 
         main_layout.addWidget(header)
 
+        # ── Editor stack: empty state until the first date is selected ─────────
+        self._stack = QStackedWidget()
+        empty = QLabel("Wähle einen Tag im Kalender aus,\num ihn zu bearbeiten.")
+        empty.setAlignment(Qt.AlignCenter)
+        empty.setWordWrap(True)
+        empty.setProperty("styleClass", "emptyHint")
+        self._empty_state = empty
+        self._stack.addWidget(empty)
+        main_layout.addWidget(self._stack, stretch=1)
+
+        self._editor: Optional[QWidget] = None
+        self.current_severity = None
+        self.current_stress = None
+        self.current_sleep = None
+        self.severity_buttons: list = []
+        self.stress_buttons: list = []
+        self.sleep_buttons: list = []
+
+    def _build_editor(self) -> QWidget:
+        """Build the tabs and action bar; deferred until the first set_date."""
+        editor = QWidget()
+        editor_layout = QVBoxLayout(editor)
+        editor_layout.setContentsMargins(0, 0, 0, 0)
+        editor_layout.setSpacing(0)
+
         # ── Tab widget ─────────────────────────────────────────────────────────
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: none;
-                background-color: white;
-            }}
-            QTabBar::tab {{
-                padding: 8px 12px;
-                margin: 0 2px;
-                background-color: #F5F5F5;
-                border: 1px solid #E0E0E0;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QTabBar::tab:selected {{
-                background-color: white;
-                border-bottom: 2px solid {COLOR_PRIMARY};
-                color: {COLOR_PRIMARY};
-            }}
-            QTabBar::tab:!selected {{
-                color: {COLOR_TEXT_SECONDARY};
-            }}
-        """)
 
         # Tab 1: Hautzustand
         self.skin_tab = self._create_scrollable_tab()
@@ -116,33 +424,50 @@ class EntryPanel(QWidget):
         self.skin_tab.layout().addStretch()
         self.tabs.addTab(self.skin_tab, "Hautzustand")
 
-        # Tab 2: Lebensmittel
+        # Tabs 2 + 3 start as empty placeholders and are filled on first view
         self.food_tab = self._create_scrollable_tab()
-        self._build_food_section(self.food_tab.layout())
-        self.food_tab.layout().addStretch()
         self.tabs.addTab(self.food_tab, "Lebensmittel")
+        self._food_built = False
 
-        # Tab 3: Trigger (modular)
         self.trigger_tab = self._create_scrollable_tab()
-        self._build_trigger_sections()
         self.tabs.addTab(self.trigger_tab, "Trigger")
+        self._trigger_built = False
+
+        self._active_mods = self._enabled_mods()
 
-        main_layout.addWidget(self.tabs, stretch=1)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        editor_layout.addWidget(self.tabs, stretch=1)
 
         # ── Action bar ─────────────────────────────────────────────────────────
-        main_layout.addWidget(self._build_action_bar())
+        editor_layout.addWidget(self._build_action_bar())
 
-        self.current_severity = None
-        self.current_stress = None
-        self.current_sleep = None
         self.update_severity_buttons()
+        return editor
+
+    def _ensure_editor(self):
+        if self._editor is None:
+            self._editor = self._build_editor()
+            self._stack.addWidget(self._editor)
+        self._stack.setCurrentWidget(self._editor)
+
+    def _on_tab_changed(self, index: int):
+        """Build a lazy tab on first view and load the current entry into it."""
+        tab = self.tabs.widget(index)
+        if tab is self.food_tab and not self._food_built:
+            self._build_food_section(self.food_tab.layout())
+            self.food_tab.layout().addStretch()
+            self._food_built = True
+            self._load_food_fields(self.current_entry)
+        elif tab is self.trigger_tab and not self._trigger_built:
+            self._build_trigger_sections()
+            self._trigger_built = True
+            self._load_trigger_fields(self.current_entry)
 
     def _create_scrollable_tab(self) -> QWidget:
         """Create a scrollable container for a tab."""
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
 
         inner = QWidget()
         inner_layout = QVBoxLayout(inner)
@@ -167,101 +492,68 @@ class EntryPanel(QWidget):
 
     def _build_severity_section(self, layout):
         header = QLabel("Hautzustand")
-        header.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        header.setFont(_TITLE_FONT)
         layout.addWidget(header)
 
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-        self.severity_buttons = []
-        for i in range(1, 6):
-            btn = QPushButton(str(i))
-            btn.setFixedSize(48, 48)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setProperty("severity", i)
-            btn.clicked.connect(lambda _, s=i: self.set_severity(s))
-            self.severity_buttons.append(btn)
-            btn_row.addWidget(btn)
-        btn_row.addStretch()
+        btn_row, self.severity_buttons = self._make_rating_row(
+            "severity", self.set_severity, 48
+        )
         layout.addLayout(btn_row)
 
         self.severity_description = QLabel("1 = sehr gut  —  5 = sehr schlecht")
-        self.severity_description.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 12px;")
+        self.severity_description.setProperty("styleClass", "caption")
         self.severity_description.setWordWrap(True)
         layout.addWidget(self.severity_description)
 
         layout.addWidget(self._sep())
 
         skin_lbl = QLabel("Notizen Hautzustand")
-        skin_lbl.setFont(QFont("Segoe UI", 12))
-        skin_lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY};")
+        skin_lbl.setFont(_FIELD_FONT)
+        skin_lbl.setProperty("styleClass", "fieldLabel")
         layout.addWidget(skin_lbl)
 
         self.skin_notes_input = QTextEdit()
         self.skin_notes_input.setPlaceholderText("z.B. Rötungen, Juckreiz, Stellen...")
         self.skin_notes_input.setMaximumHeight(80)
-        self.skin_notes_input.setStyleSheet(self._input_style())
         layout.addWidget(self.skin_notes_input)
 
     # ── Tab 2: Lebensmittel ────────────────────────────────────────────────────
 
     def _build_food_section(self, layout):
         header = QLabel("Lebensmittel")
-        header.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        header.setFont(_TITLE_FONT)
         layout.addWidget(header)
 
-        self.fixed_foods = self._load_food_suggestions()
-        self.food_checkboxes: dict = {}
-
-        grid_widget = QWidget()
-        grid = QGridLayout(grid_widget)
-        grid.setContentsMargins(0, 0, 0, 0)
-        grid.setSpacing(4)
-
-        for idx, food in enumerate(self.fixed_foods):
-            is_nickel = food in NICKEL_RICH_FOODS
-            cb = QCheckBox(food + (" [Ni]" if is_nickel else ""))
-            if is_nickel:
-                cb.setStyleSheet(self._nickel_checkbox_style())
-                cb.setToolTip("Nickelreich — kann Dyshidrosis-Schübe begünstigen")
+        self.fixed_foods = _load_food_suggestions()
+        self.food_list = _CheckList()
+        for food in self.fixed_foods:
+            if food in _NICKEL_SET:
+                self.food_list.add_item(
+                    food, food + " [Ni]",
+                    tooltip="Nickelreich — kann Dyshidrosis-Schübe begünstigen",
+                    color="#E65100", indicator="#FF9800",
+                )
             else:
-                cb.setStyleSheet(self._checkbox_style())
-            grid.addWidget(cb, idx // 2, idx % 2)
-            self.food_checkboxes[food] = cb
-
-        layout.addWidget(grid_widget)
+                self.food_list.add_item(food, food)
+        layout.addWidget(self.food_list)
 
         layout.addWidget(self._sep())
 
         food_lbl = QLabel("Notizen Nahrung")
-        food_lbl.setFont(QFont("Segoe UI", 12))
-        food_lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY};")
+        food_lbl.setFont(_FIELD_FONT)
+        food_lbl.setProperty("styleClass", "fieldLabel")
         layout.addWidget(food_lbl)
 
         self.food_notes_input = QTextEdit()
         self.food_notes_input.setPlaceholderText("z.B. Menge, Zubereitung...")
         self.food_notes_input.setMaximumHeight(80)
-        self.food_notes_input.setStyleSheet(self._input_style())
         layout.addWidget(self.food_notes_input)
 
-        # Hidden legacy field
-        self.notes_input = QTextEdit()
-        self.notes_input.setVisible(False)
-
     # ── Tab 3: Trigger (modular sections) ──────────────────────────────────────
 
     def _build_trigger_sections(self):
-        """Build all enabled trigger modules into the trigger tab."""
+        """Build every trigger module once; settings only toggle visibility."""
         layout = self.trigger_tab.layout()
-
-        # Clear existing
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            if item.spacerItem():
-                pass  # spacers get removed automatically
-
-        sm = self.settings_manager
         modules = [
             ("stress",   self._build_stress_section),
             ("fungal",   self._build_fungal_section),
@@ -270,26 +562,40 @@ class EntryPanel(QWidget):
             ("sweating", self._build_sweating_section),
             ("contact",  self._build_contact_section),
         ]
-
-        has_any = False
+        self._trigger_sections: dict = {}
         for key, builder in modules:
+            widget, sep = builder(), self._sep()
+            layout.addWidget(widget)
+            layout.addWidget(sep)
+            self._trigger_sections[key] = (widget, sep)
+
+        self._no_modules_hint = QLabel(
+            "Keine Trigger-Module aktiv.\n\n"
+            "Aktiviere Module über:\nEinstellungen → Tracker-Module"
+        )
+        self._no_modules_hint.setProperty("styleClass", "emptyHint")
+        self._no_modules_hint.setWordWrap(True)
+        self._no_modules_hint.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._no_modules_hint)
+        layout.addStretch()
+
+        self._refresh_trigger_visibility()
+
+    def _enabled_mods(self) -> int:
+        """Bitmask of the trigger modules enabled in the settings."""
+        sm = self.settings_manager
+        mods = 0
+        for key, bit in _MOD_BITS.items():
             if sm.is_module_enabled(key):
-                widget = builder()
-                layout.addWidget(widget)
-                layout.addWidget(self._sep())
-                has_any = True
-
-        if not has_any:
-            hint = QLabel(
-                "Keine Trigger-Module aktiv.\n\n"
-                "Aktiviere Module über:\nEinstellungen → Tracker-Module"
-            )
-            hint.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; padding: 16px;")
-            hint.setWordWrap(True)
-            hint.setAlignment(Qt.AlignCenter)
-            layout.addWidget(hint)
+                mods |= bit
+        return mods
 
-        layout.addStretch()
+    def _refresh_trigger_visibility(self):
+        for key, (widget, sep) in self._trigger_sections.items():
+            visible = bool(self._active_mods & _MOD_BITS[key])
+            widget.setVisible(visible)
+            sep.setVisible(visible)
+        self._no_modules_hint.setVisible(not self._active_mods)
 
     def _build_stress_section(self) -> QWidget:
         section = QWidget()
@@ -298,29 +604,18 @@ class EntryPanel(QWidget):
         lay.setSpacing(10)
 
         header = QLabel("😰 Stresslevel")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-        self.stress_buttons = []
-        for i in range(1, 6):
-            btn = QPushButton(str(i))
-            btn.setFixedSize(44, 44)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setProperty("stress_val", i)
-            btn.clicked.connect(lambda _, s=i: self.set_stress(s))
-            self.stress_buttons.append(btn)
-            btn_row.addWidget(btn)
-        btn_row.addStretch()
+        btn_row, self.stress_buttons = self._make_rating_row(
+            "stress_val", self.set_stress, 44
+        )
         lay.addLayout(btn_row)
 
         lbl = QLabel("1 = entspannt  —  5 = extremer Stress")
-        lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+        lbl.setProperty("styleClass", "scaleHint")
         lay.addWidget(lbl)
 
-        self.current_stress = getattr(self, 'current_stress', None)
-        self.update_stress_buttons()
         return section
 
     def _build_fungal_section(self) -> QWidget:
@@ -330,33 +625,18 @@ class EntryPanel(QWidget):
         lay.setSpacing(6)
 
         header = QLabel("🍄 Zehenpilz (Mykose)")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
         self.fungal_checkbox = QCheckBox("Zehenpilz aktuell aktiv")
-        self.fungal_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                font-size: 13px; padding: 6px;
-                border: 1px solid #E0E0E0; border-radius: 6px;
-            }}
-            QCheckBox:checked {{
-                background-color: #FFF3E0; border: 2px solid #FF9800; font-weight: bold;
-            }}
-            QCheckBox::indicator {{ width: 18px; height: 18px; }}
-            QCheckBox::indicator:checked {{
-                background-color: #FF9800; border: 1px solid #FF9800; border-radius: 3px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: white; border: 1px solid #BDBDBD; border-radius: 3px;
-            }}
-        """)
+        self.fungal_checkbox.setObjectName("fungalCheckbox")
         self.fungal_checkbox.setToolTip(
             "Tinea pedis kann eine Id-Reaktion an den Händen auslösen"
         )
         lay.addWidget(self.fungal_checkbox)
 
         hint = QLabel("Id-Reaktion: Pilz → Schub an den Händen")
-        hint.setStyleSheet("color: #FF9800; font-size: 11px;")
+        hint.setObjectName("fungalHint")
         hint.setWordWrap(True)
         lay.addWidget(hint)
         return section
@@ -368,29 +648,18 @@ class EntryPanel(QWidget):
         lay.setSpacing(10)
 
         header = QLabel("😴 Schlafqualität")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-        self.sleep_buttons = []
-        for i in range(1, 6):
-            btn = QPushButton(str(i))
-            btn.setFixedSize(44, 44)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setProperty("sleep_val", i)
-            btn.clicked.connect(lambda _, s=i: self.set_sleep(s))
-            self.sleep_buttons.append(btn)
-            btn_row.addWidget(btn)
-        btn_row.addStretch()
+        btn_row, self.sleep_buttons = self._make_rating_row(
+            "sleep_val", self.set_sleep, 44
+        )
         lay.addLayout(btn_row)
 
         lbl = QLabel("1 = schlecht  —  5 = ausgezeichnet")
-        lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+        lbl.setProperty("styleClass", "scaleHint")
         lay.addWidget(lbl)
 
-        self.current_sleep = getattr(self, 'current_sleep', None)
-        self.update_sleep_buttons()
         return section
 
     def _build_weather_section(self) -> QWidget:
@@ -400,20 +669,13 @@ class EntryPanel(QWidget):
         lay.setSpacing(6)
 
         header = QLabel("🌤 Wetter / Umgebung")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
         self.weather_combo = QComboBox()
         self.weather_combo.addItem("— nicht erfasst —")
         for opt in WEATHER_OPTIONS:
             self.weather_combo.addItem(opt)
-        self.weather_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 6px 10px; border: 1px solid #E0E0E0;
-                border-radius: 4px; font-size: 12px;
-            }}
-            QComboBox:focus {{ border: 2px solid {COLOR_PRIMARY}; }}
-        """)
         lay.addWidget(self.weather_combo)
         return section
 
@@ -424,11 +686,10 @@ class EntryPanel(QWidget):
         lay.setSpacing(6)
 
         header = QLabel("💧 Schwitzen")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
         self.sweating_checkbox = QCheckBox("Starkes Schwitzen heute")
-        self.sweating_checkbox.setStyleSheet(self._checkbox_style())
         lay.addWidget(self.sweating_checkbox)
         return section
 
@@ -439,65 +700,45 @@ class EntryPanel(QWidget):
         lay.setSpacing(6)
 
         header = QLabel("🧤 Kontaktexposition")
-        header.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        header.setFont(_SECTION_FONT)
         lay.addWidget(header)
 
-        self.contact_checkboxes: dict = {}
-        grid_widget = QWidget()
-        grid = QGridLayout(grid_widget)
-        grid.setContentsMargins(0, 0, 0, 0)
-        grid.setSpacing(4)
-        for idx, item in enumerate(CONTACT_SUGGESTIONS):
-            cb = QCheckBox(item)
-            cb.setStyleSheet(self._checkbox_style())
-            grid.addWidget(cb, idx // 2, idx % 2)
-            self.contact_checkboxes[item] = cb
-        lay.addWidget(grid_widget)
+        self.contact_list = _CheckList()
+        for item in CONTACT_SUGGESTIONS:
+            self.contact_list.add_item(item, item)
+        lay.addWidget(self.contact_list)
         return section
 
     # ── Action bar ─────────────────────────────────────────────────────────────
 
     def _build_action_bar(self) -> QWidget:
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget { background-color: white; border-top: 1px solid #E0E0E0; }
-        """)
+        container.setObjectName("actionBar")
         layout = QHBoxLayout(container)
         layout.setContentsMargins(20, 10, 20, 10)
         layout.setSpacing(8)
 
         self.save_button = QPushButton("Speichern")
         self.save_button.setCursor(Qt.PointingHandCursor)
-        self.save_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_SUCCESS}; color: white; border: none;
-                border-radius: 4px; padding: 8px 16px; font-size: 12px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background-color: #388E3C; }}
-            QPushButton:disabled {{ background-color: #BDBDBD; }}
-        """)
+        self.save_button.setObjectName("saveButton")
         self.save_button.clicked.connect(self.save_entry)
 
         self.delete_button = QPushButton("Löschen")
         self.delete_button.setCursor(Qt.PointingHandCursor)
-        self.delete_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: white; color: {COLOR_DANGER};
-                border: 1px solid {COLOR_DANGER}; border-radius: 4px;
-                padding: 8px 16px; font-size: 12px;
-            }}
-            QPushButton:hover {{ background-color: #FFEBEE; }}
-        """)
+        self.delete_button.setObjectName("deleteButton")
         self.delete_button.clicked.connect(self.delete_entry)
         self.delete_button.setVisible(False)
 
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet(
-            f"color: {COLOR_SUCCESS}; font-size: 13px; font-weight: bold; padding: 5px;"
-        )
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setVisible(False)
 
+        # One restartable timer so rapid saves don't stack hide callbacks
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self.status_label.hide)
+
         layout.addWidget(self.save_button)
         layout.addWidget(self.delete_button)
         layout.addStretch()
@@ -506,211 +747,155 @@ class EntryPanel(QWidget):
 
     # ── Style helpers ──────────────────────────────────────────────────────────
 
+    def _make_rating_row(self, prop: str, on_click, size: int):
+        """Row of 1-5 buttons tagged with `prop`; styled by the panel sheet."""
+        row = QHBoxLayout()
+        row.setSpacing(8)
+        buttons = []
+        for i in range(1, 6):
+            btn = QPushButton(str(i))
+            btn.setFixedSize(size, size)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setProperty(prop, i)
+            btn.clicked.connect(partial(on_click, i))
+            buttons.append(btn)
+            row.addWidget(btn)
+        row.addStretch()
+        return row, buttons
+
     def _sep(self) -> QFrame:
         sep = QFrame()
         sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet("background-color: #E0E0E0;")
+        sep.setProperty("styleClass", "separator")
         sep.setFixedHeight(1)
         return sep
 
-    def _input_style(self) -> str:
-        return f"""
-            QTextEdit {{
-                border: 1px solid #E0E0E0; border-radius: 4px;
-                padding: 8px; font-size: 13px;
-            }}
-            QTextEdit:focus {{ border: 2px solid {COLOR_PRIMARY}; }}
-        """
-
-    def _checkbox_style(self) -> str:
-        return f"""
-            QCheckBox {{ font-size: 12px; padding: 4px; }}
-            QCheckBox::indicator {{ width: 16px; height: 16px; }}
-            QCheckBox::indicator:checked {{
-                background-color: {COLOR_PRIMARY};
-                border: 1px solid {COLOR_PRIMARY}; border-radius: 3px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: white; border: 1px solid #BDBDBD; border-radius: 3px;
-            }}
-        """
-
-    def _nickel_checkbox_style(self) -> str:
-        return """
-            QCheckBox { font-size: 12px; padding: 4px; color: #E65100; }
-            QCheckBox::indicator { width: 16px; height: 16px; }
-            QCheckBox::indicator:checked {
-                background-color: #FF9800;
-                border: 1px solid #FF9800; border-radius: 3px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: white; border: 1px solid #BDBDBD; border-radius: 3px;
-            }
-        """
-
     # ── Data helpers ───────────────────────────────────────────────────────────
 
-    def _load_food_suggestions(self) -> list:
-        try:
-            with open(FOOD_SUGGESTIONS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return ["Milch", "Weizen", "Eier", "Nüsse", "Schokolade"]
-
     def get_selected_foods(self) -> list:
-        return [f for f, cb in self.food_checkboxes.items() if cb.isChecked()]
+        return self.food_list.checked_keys()
 
     def set_food_checkboxes(self, foods: list):
-        for f, cb in self.food_checkboxes.items():
-            cb.setChecked(f in foods)
+        self.food_list.set_checked(set(foods))
+
+    # Trigger widgets below exist once the trigger tab is built; callers check
 
     def _get_weather_value(self) -> Optional[str]:
-        if not hasattr(self, "weather_combo"):
-            return None
         idx = self.weather_combo.currentIndex()
         return None if idx == 0 else self.weather_combo.currentText()
 
     def _set_weather_value(self, value: Optional[str]):
-        if not hasattr(self, "weather_combo"):
-            return
-        if not value:
-            self.weather_combo.setCurrentIndex(0)
-            return
-        for i in range(self.weather_combo.count()):
-            if self.weather_combo.itemText(i) == value:
-                self.weather_combo.setCurrentIndex(i)
-                return
+        idx = _WEATHER_INDEX.get(value) if value else 0
+        if idx is not None:
+            self.weather_combo.setCurrentIndex(idx)
 
     def _get_contact_exposures(self) -> List[str]:
-        if not hasattr(self, "contact_checkboxes"):
-            return []
-        return [item for item, cb in self.contact_checkboxes.items() if cb.isChecked()]
+        return self.contact_list.checked_keys()
 
     def _set_contact_exposures(self, items: List[str]):
-        if not hasattr(self, "contact_checkboxes"):
-            return
-        for item, cb in self.contact_checkboxes.items():
-            cb.setChecked(item in items)
+        self.contact_list.set_checked(set(items))
 
     # ── Button group updates ───────────────────────────────────────────────────
 
     def set_severity(self, severity: int):
-        self.current_severity = severity
-        self.update_severity_buttons()
-        descs = {
-            1: "Sehr gut — Haut ist klar",
-            2: "Gut — Leichte Rötungen",
-            3: "Mittel — Moderate Symptome",
-            4: "Schlecht — Deutliche Symptome",
-            5: "Sehr schlecht — Starke Symptome",
-        }
-        self.severity_description.setText(descs.get(severity, ""))
-
-    def update_severity_buttons(self):
+        prev, self.current_severity = self.current_severity, severity
         self._update_buttons(
-            getattr(self, "severity_buttons", []),
-            getattr(self, "current_severity", None),
-            SEVERITY_COLORS, "severity",
+            self.severity_buttons, severity,
+            "severity", changed=(prev, severity),
         )
+        self.severity_description.setText(_SEVERITY_DESCS.get(severity, ""))
 
-    def set_stress(self, level: int):
-        self.current_stress = level
-        self.update_stress_buttons()
+    def update_severity_buttons(self):
+        self._update_buttons(self.severity_buttons, self.current_severity, "severity")
 
-    def update_stress_buttons(self):
+    def set_stress(self, level: int):
+        prev, self.current_stress = self.current_stress, level
         self._update_buttons(
-            getattr(self, "stress_buttons", []),
-            getattr(self, "current_stress", None),
-            STRESS_COLORS, "stress_val",
+            self.stress_buttons, level,
+            "stress_val", changed=(prev, level),
         )
 
-    def set_sleep(self, level: int):
-        self.current_sleep = level
-        self.update_sleep_buttons()
+    def update_stress_buttons(self):
+        self._update_buttons(self.stress_buttons, self.current_stress, "stress_val")
 
-    def update_sleep_buttons(self):
+    def set_sleep(self, level: int):
+        prev, self.current_sleep = self.current_sleep, level
         self._update_buttons(
-            getattr(self, "sleep_buttons", []),
-            getattr(self, "current_sleep", None),
-            SLEEP_COLORS, "sleep_val",
+            self.sleep_buttons, level,
+            "sleep_val", changed=(prev, level),
         )
 
-    def _update_buttons(self, buttons, current, colors, prop):
+    def update_sleep_buttons(self):
+        self._update_buttons(self.sleep_buttons, self.current_sleep, "sleep_val")
+
+    def _update_buttons(self, buttons, current, prop, changed=None):
+        """Flip the [selected] state of a 1-5 button row; with `changed`,
+        only the listed values are touched."""
         for btn in buttons:
             val = btn.property(prop)
-            c = colors.get(val, "#9E9E9E")
-            if val == current:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {c}; color: white;
-                        border: 2px solid {c}; border-radius: 22px;
-                        font-weight: bold; font-size: 15px;
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: white; color: {c};
-                        border: 2px solid {c}; border-radius: 22px;
-                        font-weight: bold; font-size: 15px;
-                    }}
-                    QPushButton:hover {{ background-color: {c}20; }}
-                """)
+            if changed is not None and val not in changed:
+                continue
+            selected = val == current
+            if btn.property("selected") is selected:
+                continue  # repolish is not free even for an unchanged state
+            btn.setProperty("selected", selected)
+            _repolish(btn)
 
     # ── Date / Entry loading ───────────────────────────────────────────────────
 
     def set_date(self, selected_date: date):
+        self._ensure_editor()
         self.current_date = selected_date
         self.current_entry = self.data_manager.get_entry(selected_date)
 
-        weekdays = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-        months = ["Januar", "Februar", "März", "April", "Mai", "Juni",
-                  "Juli", "August", "September", "Oktober", "November", "Dezember"]
-
         self.date_label.setText(
-            f"{selected_date.day}. {months[selected_date.month - 1]} {selected_date.year}"
+            f"{selected_date.day}. {_MONTHS[selected_date.month - 1]} {selected_date.year}"
         )
-        self.weekday_label.setText(weekdays[selected_date.weekday()])
-
-        if self.current_entry:
-            e = self.current_entry
-            self.set_severity(e.severity)
-            self.set_food_checkboxes(e.foods)
-            self.skin_notes_input.setText(e.skin_notes or "")
-            self.food_notes_input.setText(e.food_notes or "")
-            if hasattr(self, "stress_buttons"):
-                self.current_stress = e.stress_level
-                self.update_stress_buttons()
-            if hasattr(self, "fungal_checkbox"):
-                self.fungal_checkbox.setChecked(bool(e.fungal_active))
-            if hasattr(self, "sleep_buttons"):
-                self.current_sleep = e.sleep_quality
-                self.update_sleep_buttons()
-            self._set_weather_value(e.weather)
-            if hasattr(self, "sweating_checkbox"):
-                self.sweating_checkbox.setChecked(bool(e.sweating))
-            self._set_contact_exposures(e.contact_exposures or [])
-            self.delete_button.setVisible(True)
-        else:
-            self.current_severity = None
-            self.current_stress = None
-            self.current_sleep = None
-            self.set_food_checkboxes([])
-            self.skin_notes_input.clear()
-            self.food_notes_input.clear()
-            if hasattr(self, "fungal_checkbox"):
-                self.fungal_checkbox.setChecked(False)
-            self._set_weather_value(None)
-            if hasattr(self, "sweating_checkbox"):
-                self.sweating_checkbox.setChecked(False)
-            self._set_contact_exposures([])
-            self.delete_button.setVisible(False)
+        self.weekday_label.setText(_WEEKDAYS[selected_date.weekday()])
+        self._load_fields(self.current_entry)
 
-        self.update_severity_buttons()
-        if hasattr(self, "stress_buttons"):
-            self.update_stress_buttons()
-        if hasattr(self, "sleep_buttons"):
-            self.update_sleep_buttons()
+    def _load_fields(self, e: Optional[DayEntry]):
+        """Populate every built tab from `e`; None resets them."""
+        # One layout/paint pass for the whole load instead of one per field
+        self.setUpdatesEnabled(False)
+        try:
+            if e:
+                self.set_severity(e.severity)
+            else:
+                self.current_severity = None
+            self.delete_button.setVisible(e is not None)
+            _set_plain_text(self.skin_notes_input, (e.skin_notes or "") if e else "")
+            if self._food_built:
+                self._load_food_fields(e)
+            self._load_trigger_fields(e)
+            self.update_severity_buttons()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _reset_fields(self):
+        self._load_fields(None)
+
+    def _load_food_fields(self, e: Optional[DayEntry]):
+        self.set_food_checkboxes(e.foods if e else [])
+        _set_plain_text(self.food_notes_input, (e.food_notes or "") if e else "")
+
+    def _load_trigger_fields(self, e: Optional[DayEntry]):
+        """Hidden (disabled) modules are loaded too, so re-enabling one
+        shows the entry's values without a reload."""
+        self.current_stress = e.stress_level if e else None
+        self.current_sleep = e.sleep_quality if e else None
+        if not self._trigger_built:
+            return
+        with QSignalBlocker(self.fungal_checkbox):
+            self.fungal_checkbox.setChecked(bool(e and e.fungal_active))
+        with QSignalBlocker(self.weather_combo):
+            self._set_weather_value(e.weather if e else None)
+        with QSignalBlocker(self.sweating_checkbox):
+            self.sweating_checkbox.setChecked(bool(e and e.sweating))
+        self._set_contact_exposures((e.contact_exposures or []) if e else [])
+        self.update_stress_buttons()
+        self.update_sleep_buttons()
 
     # ── Save / Delete ──────────────────────────────────────────────────────────
 
@@ -718,71 +903,90 @@ class EntryPanel(QWidget):
         if not self.current_date:
             return
         if self.current_severity is None:
-            QMessageBox.warning(self, "Fehler", "Bitte wähle einen Hautzustand aus.")
+            self.show_status_message("Bitte Hautzustand wählen", error=True)
             return
 
+        # Tabs that were never opened pass the stored values through unchanged;
+        # disabled trigger modules are not tracked either way
+        prev = self.current_entry
+        on = self._active_mods
+        if self._food_built:
+            foods = self.get_selected_foods()
+            food_notes = self.food_notes_input.toPlainText().strip()
+        else:
+            foods = list(prev.foods) if prev else []
+            food_notes = prev.food_notes if prev else ""
+        if self._trigger_built:
+            stress_level = self.current_stress if on & _MOD_STRESS else None
+            fungal_active = self.fungal_checkbox.isChecked() if on & _MOD_FUNGAL else None
+            sleep_quality = self.current_sleep if on & _MOD_SLEEP else None
+            weather = self._get_weather_value() if on & _MOD_WEATHER else None
+            sweating = self.sweating_checkbox.isChecked() if on & _MOD_SWEATING else None
+            contact_exposures = self._get_contact_exposures() if on & _MOD_CONTACT else []
+        else:
+            stress_level = self.current_stress if on & _MOD_STRESS else None
+            fungal_active = prev.fungal_active if prev and on & _MOD_FUNGAL else None
+            sleep_quality = self.current_sleep if on & _MOD_SLEEP else None
+            weather = prev.weather if prev and on & _MOD_WEATHER else None
+            sweating = prev.sweating if prev and on & _MOD_SWEATING else None
+            contact_exposures = (
+                list(prev.contact_exposures) if prev and on & _MOD_CONTACT else []
+            )
+
         entry = DayEntry(
             date=self.current_date.isoformat(),
             severity=self.current_severity,
-            foods=self.get_selected_foods(),
+            foods=foods,
             skin_notes=self.skin_notes_input.toPlainText().strip(),
-            food_notes=self.food_notes_input.toPlainText().strip(),
-            stress_level=getattr(self, "current_stress", None),
-            fungal_active=(
-                self.fungal_checkbox.isChecked()
-                if hasattr(self, "fungal_checkbox") else None
-            ),
-            sleep_quality=getattr(self, "current_sleep", None),
-            weather=self._get_weather_value(),
-            sweating=(
-                self.sweating_checkbox.isChecked()
-                if hasattr(self, "sweating_checkbox") else None
-            ),
-            contact_exposures=self._get_contact_exposures(),
+            food_notes=food_notes,
+            stress_level=stress_level,
+            fungal_active=fungal_active,
+            sleep_quality=sleep_quality,
+            weather=weather,
+            sweating=sweating,
+            contact_exposures=contact_exposures,
         )
 
-        self.data_manager.add_or_update_entry(entry)
+        self.data_manager.add_or_update_entry(entry, save=False)
+        self._flush_timer.start()
         self.current_entry = entry
         self.delete_button.setVisible(True)
-        self.entry_saved.emit(self.current_date)
         self.show_status_message("✓ Gespeichert")
+        self._emit_later(self.entry_saved)
 
     def delete_entry(self):
         if not self.current_date or not self.current_entry:
             return
-        self.data_manager.delete_entry(self.current_date)
+        self.data_manager.delete_entry(self.current_date, save=False)
+        self._flush_timer.start()
         self.current_entry = None
-        self.current_severity = None
-        self.current_stress = None
-        self.current_sleep = None
-        self.set_food_checkboxes([])
-        self.skin_notes_input.clear()
-        self.food_notes_input.clear()
-        if hasattr(self, "fungal_checkbox"):
-            self.fungal_checkbox.setChecked(False)
-        self._set_weather_value(None)
-        if hasattr(self, "sweating_checkbox"):
-            self.sweating_checkbox.setChecked(False)
-        self._set_contact_exposures([])
-        self.delete_button.setVisible(False)
-        self.update_severity_buttons()
-        if hasattr(self, "stress_buttons"):
-            self.update_stress_buttons()
-        if hasattr(self, "sleep_buttons"):
-            self.update_sleep_buttons()
-        self.entry_deleted.emit(self.current_date)
+        self._reset_fields()
         self.show_status_message("✓ Gelöscht")
+        self._emit_later(self.entry_deleted)
+
+    def cancel_pending_flush(self):
+        """Stop the deferred write; for owners that save the data themselves (on close)."""
+        self._flush_timer.stop()
+
+    def _emit_later(self, signal):
+        """Emit `signal` for the current date on the next event-loop pass,
+        so the status label paints before the calendar/detail refresh."""
+        QTimer.singleShot(0, partial(signal.emit, self.current_date))
 
-    def show_status_message(self, message: str, duration: int = 2000):
+    def show_status_message(self, message: str, duration: int = 2000, error: bool = False):
+        self.status_label.setProperty("error", error)
+        _repolish(self.status_label)
         self.status_label.setText(message)
         self.status_label.setVisible(True)
-        QTimer.singleShot(duration, lambda: self.status_label.setVisible(False))
+        self._status_timer.start(duration)
 
     def rebuild_trigger_sections(self):
-        """Rebuild trigger tab after module settings change."""
-        self._build_trigger_sections()
-        if self.current_date:
-            self.set_date(self.current_date)
+        """Show/hide trigger modules after a settings change."""
+        if self._editor is None:
+            return  # built with the current settings on first set_date
+        self._active_mods = self._enabled_mods()
+        if self._trigger_built:
+            self._refresh_trigger_visibility()
 
     def clear(self):
         self.current_date = None
@@ -790,10 +994,9 @@ class EntryPanel(QWidget):
         self.current_severity = None
         self.current_stress = None
         self.current_sleep = None
-        self.set_food_checkboxes([])
         self.date_label.setText("Datum auswählen")
         self.weekday_label.setText("")
-        self.skin_notes_input.clear()
-        self.food_notes_input.clear()
-        self.delete_button.setVisible(False)
-        self.update_severity_buttons()
+        if self._editor is None:
+            return
+        self._reset_fields()
+        self._stack.setCurrentWidget(self._empty_state)
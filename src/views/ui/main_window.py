@@ -3,22 +3,27 @@ Main Window for Neuro-Tracker Application
 The primary application window containing all main components
 """
 
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QMenuBar, QMenu, QAction, QStatusBar, QMessageBox,
     QFileDialog, QLabel, QFrame, QSplitter, QScrollArea,
     QDialog, QCheckBox, QPushButton, QDialogButtonBox,
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QCoreApplication, QEventLoop, pyqtSignal,
+)
+from PyQt5.QtGui import QFont, QFontMetrics, QIcon, QPainter, QPixmap, QColor
 
 from config import (
     WINDOW_TITLE, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    COLOR_PRIMARY, COLOR_TEXT_PRIMARY, COLOR_TEXT_SECONDARY,
-    GOOGLE_DRIVE_ENABLED, SYNC_INTERVAL_MINUTES,
+    COLOR_PRIMARY, COLOR_SUCCESS, COLOR_TEXT_PRIMARY, COLOR_TEXT_SECONDARY,
+    GOOGLE_DRIVE_ENABLED, GOOGLE_TOKEN_FILE, SYNC_DELAY_SECONDS,
     SEVERITY_COLORS, STRESS_COLORS, SLEEP_COLORS, NICKEL_RICH_FOODS,
 )
 from models.data_manager import DataManager
@@ -27,9 +32,148 @@ from models.settings_manager import SettingsManager
 from views.ui.styles import get_main_stylesheet
 from views.ui.calendar_widget import CalendarWidget
 from views.ui.entry_panel import EntryPanel
-from views.ui.statistics_dialog import StatisticsDialog
-from utils.google_drive import GoogleDriveSync
-from utils.export import ExportManager
+
+if TYPE_CHECKING:
+    from views.ui.statistics_dialog import StatisticsDialog
+    from utils.google_drive import GoogleDriveSync
+    from utils.export import ExportManager
+
+
+_WEEKDAYS = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+_MONTH_ABBR = ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
+               "Jul", "Aug", "Sep", "Okt", "Nov", "Dez")
+_SEV_TEXTS = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
+
+# Detail panel styles, built once instead of per selected day
+_HEADER_FONT = QFont("Segoe UI", 14, QFont.Bold)
+_COLUMN_TITLE_FONT = QFont("Segoe UI", 11, QFont.Bold)
+_HEADER_QSS = f"color: {COLOR_TEXT_PRIMARY}; border: none;"
+_COLUMN_TITLE_QSS = f"color: {COLOR_TEXT_SECONDARY}; border: none;"
+_COLUMN_QSS = """
+    QFrame {
+        background-color: #FAFAFA;
+        border: 1px solid #E8E8E8;
+        border-radius: 6px;
+        padding: 8px;
+    }
+"""
+_EMPTY_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; border: none;"
+_NOTE_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px; border: none;"
+_TEXT_QSS = "font-size: 12px; border: none;"
+_NICKEL_QSS = "color: #E65100; font-size: 11px; border: none;"
+_SEVERITY_QSS = {
+    sev: f"color: {SEVERITY_COLORS.get(sev, '#9E9E9E')}; font-weight: bold; font-size: 14px; border: none;"
+    for sev in range(6)
+}
+_NICKEL_SET = frozenset(NICKEL_RICH_FOODS)
+_ABOUT_HTML = (
+    "<h2>Neuro-Tracker</h2>"
+    "<p>Version 1.0.0</p>"
+    "<p>Eine Anwendung zur Verfolgung von Neurodermitis-Symptomen "
+    "und Identifizierung möglicher Nahrungsmittel-Trigger.</p>"
+    "<p>Dokumentiere täglich deinen Hautzustand und deine Ernährung, "
+    "um Zusammenhänge zu erkennen.</p>"
+    "<hr>"
+    "<p><small>Entwickelt mit PyQt5</small></p>"
+)
+_HELP_HTML = (
+    "<h3>Neuro-Tracker Hilfe</h3>"
+    "<p><b>Tageseintrag erstellen:</b></p>"
+    "<ol>"
+    "<li>Klicke auf einen Tag im Kalender</li>"
+    "<li>Wähle deinen Hautzustand (1-5)</li>"
+    "<li>Füge die gegessenen Lebensmittel hinzu</li>"
+    "<li>Optional: Notizen hinzufügen</li>"
+    "<li>Klicke auf 'Speichern'</li>"
+    "</ol>"
+    "<p><b>Statistiken:</b></p>"
+    "<p>Über Ansicht → Statistiken kannst du Zusammenhänge "
+    "zwischen Lebensmitteln und deinem Hautzustand analysieren.</p>"
+    "<p><b>Tastaturkürzel:</b></p>"
+    "<ul>"
+    "<li>Strg+T: Zu heute springen</li>"
+    "<li>Strg+S: Statistiken</li>"
+    "<li>Strg+E: CSV exportieren</li>"
+    "<li>Strg+P: PDF exportieren</li>"
+    "</ul>"
+)
+
+# Menu bar: (menu title, items); an item is (text, shortcut, slot name) or None for a separator
+_MENU_SPEC = (
+    ("Datei", (
+        ("Als CSV exportieren...", "Ctrl+E", "export_csv"),
+        ("Als PDF exportieren...", "Ctrl+P", "export_pdf"),
+        None,
+        ("Daten importieren...", None, "import_data"),
+        None,
+        ("Beenden", "Ctrl+Q", "close"),
+    )),
+    ("Ansicht", (
+        ("Zu heute springen", "Ctrl+T", "go_today"),
+        None,
+        ("Statistiken anzeigen...", "Ctrl+S", "show_statistics"),
+    )),
+    ("Synchronisation", (
+        ("Jetzt synchronisieren", "Ctrl+R", "manual_sync"),
+        ("Sync-Status anzeigen", None, "show_sync_status"),
+        None,
+        ("Google Drive verbinden...", None, "connect_google_drive"),
+    )),
+    ("Einstellungen", (
+        ("Tracker-Module aktivieren...", None, "show_module_settings"),
+    )),
+    ("Hilfe", (
+        ("Über Neuro-Tracker", None, "show_about"),
+        ("Hilfe", "F1", "show_help"),
+    )),
+)
+
+_STATUS_GLYPH_PX = 14
+
+# File dialog name filters
+_CSV_FILTERS = ["CSV Dateien (*.csv)"]
+_PDF_FILTERS = ["PDF Dateien (*.pdf)"]
+_IMPORT_FILTERS = ["CSV Dateien (*.csv)", "JSON Dateien (*.json)"]
+
+# closeEvent waits at most this long for the final push to Google Drive
+_CLOSE_SYNC_TIMEOUT_S = 5
+
+
+
+@lru_cache(maxsize=None)
+def _glyph_pixmap(glyph: str, color: str) -> QPixmap:
+    """Render a status-bar emoji once; labels then just show the cached pixmap."""
+    font = QFont()
+    font.setPixelSize(_STATUS_GLYPH_PX)
+    metrics = QFontMetrics(font)
+    pixmap = QPixmap(metrics.horizontalAdvance(glyph), metrics.height())
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+    painter.end()
+    return pixmap
+
+
+class _SyncSignals(QObject):
+    """Signals emitted by SyncTask (QRunnable itself is not a QObject)."""
+    finished = pyqtSignal(bool, str, object)
+
+
+class SyncTask(QRunnable):
+    """Runs the network part of a sync (GoogleDriveSync.exchange) on a thread-pool
+    thread; merging the result into local data is left to the GUI thread."""
+
+    def __init__(self, drive_sync: 'GoogleDriveSync', snapshot: dict):
+        super().__init__()
+        self.drive_sync = drive_sync
+        self.snapshot = snapshot
+        self.signals = _SyncSignals()
+
+    def run(self):
+        success, message, result = self.drive_sync.exchange(self.snapshot)
+        self.signals.finished.emit(success, message, result)
 
 
 class MainWindow(QMainWindow):
@@ -41,146 +185,95 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Initialize managers
-        self.data_manager = DataManager()
-        self.food_manager = FoodManager()
-        self.settings_manager = SettingsManager()
-        self.drive_sync = GoogleDriveSync(self.data_manager)
-        self.export_manager = ExportManager(self.data_manager)
+        # Initialize managers; their JSON files are independent, so the two
+        # small ones load on worker threads while entries load here
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            food_future = pool.submit(FoodManager)
+            settings_future = pool.submit(SettingsManager)
+            self.data_manager = DataManager()
+            self.food_manager = food_future.result()
+            self.settings_manager = settings_future.result()
+        # Drive sync, export and statistics (and their imports) are created on first use
+        self._drive_sync: Optional['GoogleDriveSync'] = None
+        self._export_manager: Optional['ExportManager'] = None
+        self._stats_dialog: Optional['StatisticsDialog'] = None
+        self._info_boxes = {}
+        self._file_dialog: Optional[QFileDialog] = None
+        self._last_sync_state: Optional[bool] = None
+        self._pending_dates = set()
+        self._refresh_pending = False
 
         # Setup UI
         self.setWindowTitle(WINDOW_TITLE)
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
-        self.setStyleSheet(get_main_stylesheet())
+
+        # Applied once app-wide so dialogs and popups share the parsed sheet
+        app = QApplication.instance()
+        if app.styleSheet() != get_main_stylesheet():
+            app.setStyleSheet(get_main_stylesheet())
 
         self.setup_menu_bar()
         self.setup_central_widget()
         self.setup_status_bar()
 
-        # Auto-sync timer
-        if GOOGLE_DRIVE_ENABLED:
-            self.sync_timer = QTimer(self)
-            self.sync_timer.timeout.connect(self.auto_sync)
-            self.sync_timer.start(SYNC_INTERVAL_MINUTES * 60 * 1000)
+        # Entry panel and calendar are built after the shell has painted
+        QTimer.singleShot(0, self._finish_init)
+
+        # Auto-sync runs once after edits settle instead of on a fixed interval;
+        # second-granularity is plenty here and lets Qt batch the wakeup
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setTimerType(Qt.VeryCoarseTimer)
+        self._sync_timer.setInterval(SYNC_DELAY_SECONDS * 1000)
+        self._sync_timer.timeout.connect(self._maybe_sync)
+        self._sync_dirty = False
+        self._sync_running = False
+        # Set by closeEvent; no sync may start or apply after the final save
+        self._closing = False
+        # Snapshot and completion callback of the running sync
+        self._sync_snapshot: Optional[dict] = None
+        self._sync_callback = None
 
+        if GOOGLE_DRIVE_ENABLED:
             # Initial sync on startup (delayed to allow UI to load)
             QTimer.singleShot(1000, self.startup_sync)
 
-        # Select today by default
-        self.calendar_widget.go_today()
+    @property
+    def drive_sync(self) -> 'GoogleDriveSync':
+        if self._drive_sync is None:
+            from utils.google_drive import GoogleDriveSync
+            self._drive_sync = GoogleDriveSync(self.data_manager)
+        return self._drive_sync
+
+    def _drive_connected(self) -> bool:
+        """Connection state; until a sync is requested, the saved OAuth token stands
+        in for it, so startup does not build the client or import the Google API."""
+        if self._drive_sync is None:
+            return GOOGLE_TOKEN_FILE.exists()
+        return self._drive_sync.is_connected()
+
+    @property
+    def export_manager(self) -> 'ExportManager':
+        if self._export_manager is None:
+            from utils.export import ExportManager
+            self._export_manager = ExportManager(self.data_manager)
+        return self._export_manager
 
     def setup_menu_bar(self):
-        """Setup the menu bar"""
+        """Setup the menu bar from _MENU_SPEC"""
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: white;
-                border-bottom: 1px solid #E0E0E0;
-                padding: 4px;
-            }
-            QMenuBar::item {
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background-color: #E3F2FD;
-            }
-            QMenu {
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 8px 24px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #E3F2FD;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #E0E0E0;
-                margin: 4px 8px;
-            }
-        """)
-
-        # File menu
-        file_menu = menubar.addMenu("Datei")
-
-        export_csv_action = QAction("Als CSV exportieren...", self)
-        export_csv_action.setShortcut("Ctrl+E")
-        export_csv_action.triggered.connect(self.export_csv)
-        file_menu.addAction(export_csv_action)
-
-        export_pdf_action = QAction("Als PDF exportieren...", self)
-        export_pdf_action.setShortcut("Ctrl+P")
-        export_pdf_action.triggered.connect(self.export_pdf)
-        file_menu.addAction(export_pdf_action)
-
-        file_menu.addSeparator()
-
-        import_action = QAction("Daten importieren...", self)
-        import_action.triggered.connect(self.import_data)
-        file_menu.addAction(import_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Beenden", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # View menu
-        view_menu = menubar.addMenu("Ansicht")
-
-        today_action = QAction("Zu heute springen", self)
-        today_action.setShortcut("Ctrl+T")
-        today_action.triggered.connect(self.go_today)
-        view_menu.addAction(today_action)
-
-        view_menu.addSeparator()
-
-        stats_action = QAction("Statistiken anzeigen...", self)
-        stats_action.setShortcut("Ctrl+S")
-        stats_action.triggered.connect(self.show_statistics)
-        view_menu.addAction(stats_action)
-
-        # Sync menu
-        sync_menu = menubar.addMenu("Synchronisation")
-
-        sync_now_action = QAction("Jetzt synchronisieren", self)
-        sync_now_action.setShortcut("Ctrl+R")
-        sync_now_action.triggered.connect(self.manual_sync)
-        sync_menu.addAction(sync_now_action)
-
-        sync_status_action = QAction("Sync-Status anzeigen", self)
-        sync_status_action.triggered.connect(self.show_sync_status)
-        sync_menu.addAction(sync_status_action)
-
-        sync_menu.addSeparator()
-
-        connect_drive_action = QAction("Google Drive verbinden...", self)
-        connect_drive_action.triggered.connect(self.connect_google_drive)
-        sync_menu.addAction(connect_drive_action)
-
-        # Settings menu
-        settings_menu = menubar.addMenu("Einstellungen")
-
-        modules_action = QAction("Tracker-Module aktivieren...", self)
-        modules_action.triggered.connect(self.show_module_settings)
-        settings_menu.addAction(modules_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("Hilfe")
-
-        about_action = QAction("Über Neuro-Tracker", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-
-        help_action = QAction("Hilfe", self)
-        help_action.setShortcut("F1")
-        help_action.triggered.connect(self.show_help)
-        help_menu.addAction(help_action)
+        for title, items in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = item
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
 
     def setup_central_widget(self):
         """Setup the main content area with top (entry+calendar) and bottom (detail)."""
@@ -194,40 +287,19 @@ class MainWindow(QMainWindow):
         # ── Vertical splitter: top area / bottom detail ────────────────────────
         self.v_splitter = QSplitter(Qt.Vertical)
         self.v_splitter.setHandleWidth(4)
-        self.v_splitter.setStyleSheet("""
-            QSplitter::handle { background-color: #E0E0E0; }
-            QSplitter::handle:hover { background-color: #BDBDBD; }
-        """)
 
         # ── TOP: horizontal splitter (entry panel | calendar) ──────────────────
         self.h_splitter = QSplitter(Qt.Horizontal)
         self.h_splitter.setHandleWidth(4)
-        self.h_splitter.setStyleSheet("""
-            QSplitter::handle { background-color: #E0E0E0; }
-            QSplitter::handle:hover { background-color: #BDBDBD; }
-        """)
-
-        # Entry panel (left)
-        self.entry_panel = EntryPanel(self.data_manager, self.food_manager, self.settings_manager)
-        self.entry_panel.entry_saved.connect(self.on_entry_saved)
-        self.entry_panel.entry_deleted.connect(self.on_entry_deleted)
-        self.entry_panel.setMinimumWidth(320)
-        self.entry_panel.setMaximumWidth(500)
 
+        # Entry panel (left) and calendar (right) are filled in by _finish_init
         panel_frame = QFrame()
-        panel_frame.setStyleSheet("""
-            QFrame { background-color: white; border-right: 1px solid #E0E0E0; }
-        """)
-        panel_layout = QVBoxLayout(panel_frame)
-        panel_layout.setContentsMargins(0, 0, 0, 0)
-        panel_layout.addWidget(self.entry_panel)
-
-        # Calendar (right)
-        self.calendar_widget = CalendarWidget(self.data_manager)
-        self.calendar_widget.date_selected.connect(self.on_date_selected)
+        panel_frame.setObjectName("entryPanelFrame")
+        self._panel_layout = QVBoxLayout(panel_frame)
+        self._panel_layout.setContentsMargins(0, 0, 0, 0)
 
         self.h_splitter.addWidget(panel_frame)
-        self.h_splitter.addWidget(self.calendar_widget)
+        self.h_splitter.addWidget(QWidget())
         self.h_splitter.setStretchFactor(0, 0)
         self.h_splitter.setStretchFactor(1, 1)
         self.h_splitter.setSizes([370, 830])
@@ -244,12 +316,27 @@ class MainWindow(QMainWindow):
 
         outer_layout.addWidget(self.v_splitter)
 
+    def _finish_init(self):
+        """Build the entry panel and calendar, then select today."""
+        self.entry_panel = EntryPanel(self.data_manager, self.food_manager, self.settings_manager)
+        self.entry_panel.entry_saved.connect(self.on_entry_saved)
+        self.entry_panel.entry_deleted.connect(self.on_entry_deleted)
+        self.entry_panel.setMinimumWidth(320)
+        self.entry_panel.setMaximumWidth(500)
+        self._panel_layout.addWidget(self.entry_panel)
+
+        self.calendar_widget = CalendarWidget(self.data_manager)
+        self.calendar_widget.date_selected.connect(self.on_date_selected)
+        self.h_splitter.replaceWidget(1, self.calendar_widget).deleteLater()
+
+        # Select today by default
+        self.calendar_widget.go_today()
+        self.update_sync_status()
+
     def _build_detail_panel(self) -> QFrame:
         """Build the bottom detail panel that shows all info for the selected day."""
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame { background-color: white; border-top: 2px solid #E0E0E0; }
-        """)
+        frame.setObjectName("detailPanel")
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(16, 10, 16, 10)
@@ -257,47 +344,46 @@ class MainWindow(QMainWindow):
 
         # Header
         self.detail_header = QLabel("Kein Tag ausgewählt")
-        self.detail_header.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        self.detail_header.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY}; border: none;")
+        self.detail_header.setFont(_HEADER_FONT)
+        self.detail_header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(self.detail_header)
 
         # Content: horizontal scroll with columns
-        scroll = QScrollArea()
+        self._detail_scroll = scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setStyleSheet("QScrollArea { border: none; }")
+        self._new_detail_content()
+        layout.addWidget(scroll)
+
+        return frame
+
+    def _new_detail_content(self):
+        """Give the detail scroll area an empty content widget.
 
+        setWidget() deletes the previous one, so the old columns go in one
+        teardown instead of a queued deleteLater() per widget.
+        """
         content = QWidget()
         self.detail_content = QHBoxLayout(content)
         self.detail_content.setContentsMargins(0, 0, 0, 0)
         self.detail_content.setSpacing(20)
-
-        scroll.setWidget(content)
-        layout.addWidget(scroll)
-
-        return frame
+        self._detail_scroll.setWidget(content)
 
     def _update_detail_panel(self, selected_date):
         """Fill the bottom detail panel with data from the selected entry."""
-        weekdays = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-        months = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-
         self.detail_header.setText(
-            f"{weekdays[selected_date.weekday()]}, {selected_date.day}. "
-            f"{months[selected_date.month - 1]} {selected_date.year}"
+            f"{_WEEKDAYS[selected_date.weekday()]}, {selected_date.day}. "
+            f"{_MONTH_ABBR[selected_date.month - 1]} {selected_date.year}"
         )
 
-        # Clear existing content
-        while self.detail_content.count():
-            item = self.detail_content.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._new_detail_content()
 
         entry = self.data_manager.get_entry(selected_date)
         if not entry:
             lbl = QLabel("Noch kein Eintrag für diesen Tag")
-            lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; border: none;")
+            lbl.setStyleSheet(_EMPTY_QSS)
             self.detail_content.addWidget(lbl)
             self.detail_content.addStretch()
             return
@@ -305,16 +391,14 @@ class MainWindow(QMainWindow):
         # ── Column: Hautzustand ─────────────────────────────────────────────
         col = self._detail_column("Hautzustand")
         sev = entry.severity or 0
-        color = SEVERITY_COLORS.get(sev, "#9E9E9E")
-        sev_texts = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
-        sev_lbl = QLabel(f"  {sev} — {sev_texts.get(sev, '')}")
-        sev_lbl.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 14px; border: none;")
+        sev_lbl = QLabel(f"  {sev} — {_SEV_TEXTS.get(sev, '')}")
+        sev_lbl.setStyleSheet(_SEVERITY_QSS.get(sev, _SEVERITY_QSS[0]))
         col.layout().addWidget(sev_lbl)
         if entry.skin_notes:
             n = QLabel(entry.skin_notes)
             n.setWordWrap(True)
             n.setMaximumWidth(200)
-            n.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px; border: none;")
+            n.setStyleSheet(_NOTE_QSS)
             col.layout().addWidget(n)
         col.layout().addStretch()
         self.detail_content.addWidget(col)
@@ -326,13 +410,13 @@ class MainWindow(QMainWindow):
             f_lbl = QLabel(foods_text)
             f_lbl.setWordWrap(True)
             f_lbl.setMaximumWidth(250)
-            f_lbl.setStyleSheet(f"font-size: 12px; border: none;")
+            f_lbl.setStyleSheet(_TEXT_QSS)
             col.layout().addWidget(f_lbl)
             # Count nickel-rich
-            nickel = [f for f in entry.foods if f in NICKEL_RICH_FOODS]
+            nickel = [f for f in entry.foods if f in _NICKEL_SET]
             if nickel:
                 ni_lbl = QLabel(f"[Ni] {', '.join(nickel)}")
-                ni_lbl.setStyleSheet("color: #E65100; font-size: 11px; border: none;")
+                ni_lbl.setStyleSheet(_NICKEL_QSS)
                 ni_lbl.setWordWrap(True)
                 ni_lbl.setMaximumWidth(250)
                 col.layout().addWidget(ni_lbl)
@@ -340,7 +424,7 @@ class MainWindow(QMainWindow):
                 fn = QLabel(entry.food_notes)
                 fn.setWordWrap(True)
                 fn.setMaximumWidth(200)
-                fn.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px; border: none;")
+                fn.setStyleSheet(_NOTE_QSS)
                 col.layout().addWidget(fn)
             col.layout().addStretch()
             self.detail_content.addWidget(col)
@@ -367,7 +451,7 @@ class MainWindow(QMainWindow):
             for t in triggers:
                 lbl = QLabel(t)
                 lbl.setTextFormat(Qt.RichText)
-                lbl.setStyleSheet("font-size: 12px; border: none;")
+                lbl.setStyleSheet(_TEXT_QSS)
                 col.layout().addWidget(lbl)
             col.layout().addStretch()
             self.detail_content.addWidget(col)
@@ -378,21 +462,14 @@ class MainWindow(QMainWindow):
         """Create a titled column for the detail panel."""
         frame = QFrame()
         frame.setMinimumWidth(150)
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #FAFAFA;
-                border: 1px solid #E8E8E8;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        frame.setStyleSheet(_COLUMN_QSS)
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(8, 6, 8, 6)
         layout.setSpacing(4)
 
         header = QLabel(title)
-        header.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        header.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; border: none;")
+        header.setFont(_COLUMN_TITLE_FONT)
+        header.setStyleSheet(_COLUMN_TITLE_QSS)
         layout.addWidget(header)
         return frame
 
@@ -401,21 +478,21 @@ class MainWindow(QMainWindow):
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
 
-        self.statusBar.setStyleSheet("""
-            QStatusBar {
-                background-color: white;
-                border-top: 1px solid #E0E0E0;
-                padding: 4px;
-            }
-        """)
-
-        # Sync status indicator
+        # Sync status indicator (glyph pre-rendered, text in its own label)
+        self.sync_icon_label = QLabel()
+        self.sync_icon_label.setObjectName("statusIcon")
+        self.statusBar.addPermanentWidget(self.sync_icon_label)
         self.sync_status_label = QLabel()
-        self.update_sync_status()
+        self.sync_status_label.setObjectName("syncStatus")
         self.statusBar.addPermanentWidget(self.sync_status_label)
 
         # Entry count
+        count_icon = QLabel()
+        count_icon.setObjectName("statusIcon")
+        count_icon.setPixmap(_glyph_pixmap("📊", COLOR_TEXT_SECONDARY))
+        self.statusBar.addPermanentWidget(count_icon)
         self.entry_count_label = QLabel()
+        self.entry_count_label.setObjectName("entryCount")
         self.update_entry_count()
         self.statusBar.addPermanentWidget(self.entry_count_label)
 
@@ -427,33 +504,66 @@ class MainWindow(QMainWindow):
 
     def on_entry_saved(self, saved_date: date):
         """Handle entry save"""
-        self.calendar_widget.refresh_date(saved_date)
-        self._update_detail_panel(saved_date)
-        self.update_entry_count()
+        self._schedule_refresh(saved_date)
         self.statusBar.showMessage("Eintrag gespeichert", 3000)
+        self._schedule_sync()
 
     def on_entry_deleted(self, deleted_date: date):
         """Handle entry deletion"""
-        self.calendar_widget.refresh_date(deleted_date)
-        self._update_detail_panel(deleted_date)
-        self.update_entry_count()
+        self._schedule_refresh(deleted_date)
         self.statusBar.showMessage("Eintrag gelöscht", 3000)
+        self._schedule_sync()
+
+    def _schedule_refresh(self, changed_date: date):
+        """Queue a calendar/detail/count refresh; bursts of changes share one pass."""
+        self._pending_dates.add(changed_date)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        dates, self._pending_dates = self._pending_dates, set()
+        for d in dates:
+            self.calendar_widget.refresh_date(d)
+        if self.entry_panel.current_date in dates:
+            self._update_detail_panel(self.entry_panel.current_date)
+        self.update_entry_count()
 
     def go_today(self):
         """Navigate to today"""
         self.calendar_widget.go_today()
 
     def show_statistics(self):
-        """Show the statistics dialog"""
-        dialog = StatisticsDialog(self.data_manager, self)
-        dialog.exec_()
+        """Show the statistics dialog (built on first use, refreshed afterwards)"""
+        if self._stats_dialog is None:
+            from views.ui.statistics_dialog import StatisticsDialog
+            self._stats_dialog = StatisticsDialog(self.data_manager, self)
+        else:
+            self._stats_dialog.refresh()
+        self._stats_dialog.exec_()
+
+    def _ask_file_name(self, accept_mode, title: str, filters, default_name: str = "") -> str:
+        """Ask for a file with one shared QFileDialog; returns "" when cancelled."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setFileMode(
+            QFileDialog.AnyFile if accept_mode == QFileDialog.AcceptSave else QFileDialog.ExistingFile
+        )
+        dialog.setNameFilters(filters)
+        dialog.selectFile(default_name)
+        if dialog.exec_() != QDialog.Accepted:
+            return ""
+        return dialog.selectedFiles()[0]
 
     def export_csv(self):
         """Export data to CSV"""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "CSV exportieren",
-            f"neuro_tracker_export_{date.today().isoformat()}.csv",
-            "CSV Dateien (*.csv)"
+        filename = self._ask_file_name(
+            QFileDialog.AcceptSave, "CSV exportieren", _CSV_FILTERS,
+            f"neuro_tracker_export_{date.today().isoformat()}.csv"
         )
         if filename:
             success, message = self.export_manager.export_csv(filename)
@@ -464,10 +574,9 @@ class MainWindow(QMainWindow):
 
     def export_pdf(self):
         """Export data to PDF"""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "PDF exportieren",
-            f"neuro_tracker_report_{date.today().isoformat()}.pdf",
-            "PDF Dateien (*.pdf)"
+        filename = self._ask_file_name(
+            QFileDialog.AcceptSave, "PDF exportieren", _PDF_FILTERS,
+            f"neuro_tracker_report_{date.today().isoformat()}.pdf"
         )
         if filename:
             success, message = self.export_manager.export_pdf(filename)
@@ -478,10 +587,8 @@ class MainWindow(QMainWindow):
 
     def import_data(self):
         """Import data from CSV"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Daten importieren",
-            "",
-            "CSV Dateien (*.csv);;JSON Dateien (*.json)"
+        filename = self._ask_file_name(
+            QFileDialog.AcceptOpen, "Daten importieren", _IMPORT_FILTERS
         )
         if filename:
             success, message = self.export_manager.import_data(filename)
@@ -492,39 +599,82 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "Import fehlgeschlagen", message)
 
+    def _start_sync(self, on_finished=None) -> bool:
+        """Run a sync in the background; on_finished(success, message, changed_dates) runs on the GUI thread."""
+        if self._sync_running or self._closing:
+            return False
+        self._sync_running = True
+        # The worker only sees this copy (including unsaved entry-panel edits)
+        self._sync_snapshot = self.drive_sync.snapshot()
+        self._sync_callback = on_finished
+
+        task = SyncTask(self.drive_sync, self._sync_snapshot)
+        task.signals.finished.connect(self._on_sync_finished)
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def _on_sync_finished(self, success: bool, message: str, result: Optional[dict]):
+        self._sync_running = False
+        snapshot, on_finished = self._sync_snapshot, self._sync_callback
+        self._sync_snapshot = self._sync_callback = None
+        if self._closing:
+            # The close already saved; remote changes arrive with the next startup sync
+            return
+        changed_dates = []
+        if success:
+            # Merge and reload here, so edits made while the sync ran are kept
+            changed_dates, unsynced = self.drive_sync.apply(snapshot, result)
+            if unsynced:
+                self._schedule_sync()
+        self.update_sync_status()
+        # Only days the merge actually changed need repainting
+        for d in changed_dates:
+            self._schedule_refresh(d)
+        if on_finished is not None:
+            on_finished(success, message, changed_dates)
+
     def manual_sync(self):
         """Manually trigger sync"""
-        self.statusBar.showMessage("Synchronisiere...", 0)
-        success, message = self.drive_sync.sync()
-        self.update_sync_status()
+        if self._start_sync(self._on_manual_sync_finished):
+            self.statusBar.showMessage("Synchronisiere...", 0)
+        else:
+            self.statusBar.showMessage("Synchronisation läuft bereits", 3000)
 
+    def _on_manual_sync_finished(self, success: bool, message: str, changed_dates: list):
         if success:
-            self.calendar_widget.refresh_all()
-            self.update_entry_count()
             self.statusBar.showMessage("Synchronisation erfolgreich", 3000)
         else:
             self.statusBar.showMessage(f"Sync-Fehler: {message}", 5000)
 
+    def _schedule_sync(self):
+        """Mark local data as changed and arm a single delayed auto-sync."""
+        self._sync_dirty = True
+        if GOOGLE_DRIVE_ENABLED and not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def _maybe_sync(self):
+        """Run the auto-sync if anything changed since the last one."""
+        if self._sync_dirty:
+            self._sync_dirty = False
+            self.auto_sync()
+
     def auto_sync(self):
-        """Auto-sync triggered by timer"""
-        if GOOGLE_DRIVE_ENABLED:
-            success, _ = self.drive_sync.sync()
-            if success:
-                self.calendar_widget.refresh_all()
-            self.update_sync_status()
+        """Auto-sync triggered after local changes"""
+        if GOOGLE_DRIVE_ENABLED and not self._start_sync():
+            # A sync is already running; try again once it had time to finish
+            self._schedule_sync()
 
     def startup_sync(self):
         """Sync on application startup"""
-        if GOOGLE_DRIVE_ENABLED and self.drive_sync.is_connected():
-            self.statusBar.showMessage("Synchronisiere...", 0)
-            success, _ = self.drive_sync.sync()
-            if success:
-                self.calendar_widget.refresh_all()
-                self.update_entry_count()
-                self.statusBar.showMessage("Startup-Sync erfolgreich", 3000)
-            else:
-                self.statusBar.showMessage("Startup-Sync fehlgeschlagen", 3000)
-            self.update_sync_status()
+        if GOOGLE_DRIVE_ENABLED and self._drive_connected():
+            if self._start_sync(self._on_startup_sync_finished):
+                self.statusBar.showMessage("Synchronisiere...", 0)
+
+    def _on_startup_sync_finished(self, success: bool, message: str, changed_dates: list):
+        if success:
+            self.statusBar.showMessage("Startup-Sync erfolgreich", 3000)
+        else:
+            self.statusBar.showMessage("Startup-Sync fehlgeschlagen", 3000)
 
     def show_sync_status(self):
         """Show sync status dialog"""
@@ -536,7 +686,7 @@ class MainWindow(QMainWindow):
                 f"Google Drive Status: Verbunden ✓\n\n"
                 f"Ordner: {status['folder']}\n"
                 f"Letzter Sync: {last_sync}\n"
-                f"Auto-Sync: alle {SYNC_INTERVAL_MINUTES} Minuten"
+                f"Auto-Sync: {SYNC_DELAY_SECONDS} Sekunden nach Änderungen"
             )
         else:
             # Show diagnostic info when not connected
@@ -578,7 +728,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.Yes
             )
             if reply == QMessageBox.Yes:
-                self.statusBar.showMessage("Verbinde mit Google Drive...", 0)
+                self._show_busy_message("Verbinde mit Google Drive...")
                 success, message = self.drive_sync.connect()
                 self.update_sync_status()
 
@@ -589,62 +739,53 @@ class MainWindow(QMainWindow):
                 else:
                     QMessageBox.warning(self, "Google Drive Fehler", message)
 
+    def _show_busy_message(self, message: str):
+        """Show a status message and paint it before a blocking call starts."""
+        self.statusBar.showMessage(message, 0)
+        QCoreApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+
     def update_sync_status(self):
         """Update the sync status indicator"""
-        status = self.drive_sync.get_status()
+        connected = self._drive_connected()
+        if connected == self._last_sync_state:
+            return
+        self._last_sync_state = connected
 
-        if status['connected']:
-            self.sync_status_label.setText("🔗 Sync aktiv")
-            self.sync_status_label.setStyleSheet(f"color: #4CAF50; padding: 0 10px;")
+        if connected:
+            self.sync_icon_label.setPixmap(_glyph_pixmap("🔗", COLOR_SUCCESS))
         else:
-            self.sync_status_label.setText("⚡ Lokal")
-            self.sync_status_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; padding: 0 10px;")
+            self.sync_icon_label.setPixmap(_glyph_pixmap("⚡", COLOR_TEXT_SECONDARY))
+        label = self.sync_status_label
+        label.setText("Sync aktiv" if connected else "Lokal")
+        label.setProperty("connected", connected)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
 
     def update_entry_count(self):
         """Update the entry count in status bar"""
-        stats = self.data_manager.get_statistics()
-        count = stats.get('total_entries', 0)
-        self.entry_count_label.setText(f"📊 {count} Einträge")
-        self.entry_count_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; padding: 0 10px;")
+        self.entry_count_label.setText(f"{self.data_manager.entry_count} Einträge")
 
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self, "Über Neuro-Tracker",
-            "<h2>Neuro-Tracker</h2>"
-            "<p>Version 1.0.0</p>"
-            "<p>Eine Anwendung zur Verfolgung von Neurodermitis-Symptomen "
-            "und Identifizierung möglicher Nahrungsmittel-Trigger.</p>"
-            "<p>Dokumentiere täglich deinen Hautzustand und deine Ernährung, "
-            "um Zusammenhänge zu erkennen.</p>"
-            "<hr>"
-            "<p><small>Entwickelt mit PyQt5</small></p>"
-        )
+        box = self._info_box("about", "Über Neuro-Tracker", _ABOUT_HTML, QMessageBox.NoIcon)
+        icon = self.windowIcon()
+        if not icon.isNull():
+            box.setIconPixmap(icon.pixmap(64, 64))
+        box.exec_()
 
     def show_help(self):
         """Show help dialog"""
-        QMessageBox.information(
-            self, "Hilfe",
-            "<h3>Neuro-Tracker Hilfe</h3>"
-            "<p><b>Tageseintrag erstellen:</b></p>"
-            "<ol>"
-            "<li>Klicke auf einen Tag im Kalender</li>"
-            "<li>Wähle deinen Hautzustand (1-5)</li>"
-            "<li>Füge die gegessenen Lebensmittel hinzu</li>"
-            "<li>Optional: Notizen hinzufügen</li>"
-            "<li>Klicke auf 'Speichern'</li>"
-            "</ol>"
-            "<p><b>Statistiken:</b></p>"
-            "<p>Über Ansicht → Statistiken kannst du Zusammenhänge "
-            "zwischen Lebensmitteln und deinem Hautzustand analysieren.</p>"
-            "<p><b>Tastaturkürzel:</b></p>"
-            "<ul>"
-            "<li>Strg+T: Zu heute springen</li>"
-            "<li>Strg+S: Statistiken</li>"
-            "<li>Strg+E: CSV exportieren</li>"
-            "<li>Strg+P: PDF exportieren</li>"
-            "</ul>"
-        )
+        self._info_box("help", "Hilfe", _HELP_HTML, QMessageBox.Information).exec_()
+
+    def _info_box(self, key: str, title: str, html: str, icon) -> QMessageBox:
+        """Return the message box for key, creating it (and parsing html) only once."""
+        box = self._info_boxes.get(key)
+        if box is None:
+            box = QMessageBox(icon, title, html, QMessageBox.Ok, self)
+            box.setTextFormat(Qt.RichText)
+            self._info_boxes[key] = box
+        return box
 
     def show_module_settings(self):
         """Open dialog for enabling/disabling tracker modules."""
@@ -693,13 +834,22 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close"""
-        # Save any pending changes
+        # Stop everything that could start a sync or write behind the final save
+        self._closing = True
+        self._sync_timer.stop()
+        self.entry_panel.cancel_pending_flush()
+
         self.data_manager.save()
         self.food_manager.save()
 
-        # Sync to Google Drive before closing
-        if GOOGLE_DRIVE_ENABLED and self.drive_sync.is_connected():
+        # Push to Google Drive before closing, bounded by _CLOSE_SYNC_TIMEOUT_S;
+        # remote changes are pulled in by the next startup sync
+        if GOOGLE_DRIVE_ENABLED and self._drive_connected():
             self.statusBar.showMessage("Synchronisiere vor dem Beenden...", 0)
-            self.drive_sync.sync()
+            self.statusBar.repaint()
+            push = threading.Thread(target=self.drive_sync.exchange,
+                                    args=(self.drive_sync.snapshot(),), daemon=True)
+            push.start()
+            push.join(_CLOSE_SYNC_TIMEOUT_S)
 
         event.accept()
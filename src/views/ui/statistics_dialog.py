@@ -4,16 +4,20 @@ Shows analysis and correlations for all tracked trigger factors.
 """
 
 from datetime import date, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTabWidget, QWidget, QTableWidget, QTableWidgetItem,
+    QTabWidget, QWidget, QTableView, QAbstractItemView,
     QFrame, QScrollArea, QComboBox, QHeaderView, QSizePolicy,
-    QSpinBox, QGroupBox
+    QSpinBox, QGroupBox, QApplication, QStyledItemDelegate, QStyle, QStyleOptionViewItem,
+    QToolTip,
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import (
+    Qt, QRect, QRectF, QSize, QTimer, QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex,
+    QEvent, pyqtSignal,
+)
+from PyQt5.QtGui import QFont, QFontMetrics, QColor, QPainter, QPixmap
 
 from config import (
     SEVERITY_COLORS, COLOR_PRIMARY, COLOR_TEXT_PRIMARY,
@@ -24,6 +28,128 @@ from models.data_manager import DataManager
 from utils.statistics import StatisticsCalculator
 
 
+_SEVERITY_LABELS = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
+# Levels 1-5 in display order; the trigger cards walk these instead of sorting
+_STRESS_LABELS = {1: "Entspannt", 2: "Leicht", 3: "Mittel", 4: "Hoch", 5: "Extrem"}
+_SLEEP_LABELS = {1: "Schlecht", 2: "Wenig", 3: "OK", 4: "Gut", 5: "Sehr gut"}
+_DAY_NAMES = ("Montag", "Dienstag", "Mittwoch", "Donnerstag",
+              "Freitag", "Samstag", "Sonntag")
+
+_H1_FONT = QFont("Segoe UI", 24, QFont.Bold)
+_CARD_TITLE_FONT = QFont("Segoe UI", 14, QFont.Bold)
+
+_NICKEL_COLOR = QColor("#E65100")
+_BAR_FOOD_COLOR = QColor(COLOR_PRIMARY)
+_BAR_LABEL_COLOR = QColor(COLOR_TEXT_PRIMARY)
+_BAR_VALUE_COLOR = QColor(COLOR_TEXT_SECONDARY)
+_BAR_LABEL_FONT = QFont("Segoe UI")
+_BAR_LABEL_FONT.setPixelSize(12)
+_BAR_VALUE_FONT = QFont("Segoe UI")
+_BAR_VALUE_FONT.setPixelSize(11)
+_BAR_VALUE_BOLD_FONT = QFont("Segoe UI", -1, QFont.Bold)
+_BAR_VALUE_BOLD_FONT.setPixelSize(13)
+_AXIS_FONT = QFont("Segoe UI")
+_AXIS_FONT.setPixelSize(9)
+_CHART_SEVERITY_COLORS = {sev: QColor(c) for sev, c in SEVERITY_COLORS.items()}
+_CHART_EMPTY_COLOR = QColor("#E0E0E0")
+
+# Style sheets, built once at import instead of per widget
+_CARD_QSS = "QFrame { background-color: white; border: 1px solid #E0E0E0; border-radius: 8px; }"
+_CARD_HIGHLIGHT_QSS = (
+    f"QFrame {{ background-color: #E3F2FD; border: 1px solid {COLOR_PRIMARY}; border-radius: 8px; }}"
+)
+_VALUE_QSS = f"color: {COLOR_TEXT_PRIMARY};"
+_CAPTION_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-size: 12px;"
+_SMALL_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;"
+_NO_DATA_QSS = f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; padding: 4px 0;"
+_SPINBOX_QSS = (
+    "QSpinBox { padding: 6px 10px; border: 1px solid #E0E0E0; border-radius: 4px; min-width: 60px; }"
+)
+_SCROLL_QSS = "QScrollArea { border: none; }"
+_INFO_BANNER_QSS = (
+    f"color: {COLOR_TEXT_SECONDARY}; padding: 10px; background-color: #E8F5E9; border-radius: 4px;"
+)
+_COMBO_QSS = """
+    QComboBox { padding: 8px 12px; border: 1px solid #E0E0E0;
+                border-radius: 4px; min-width: 150px; }
+"""
+_TABS_QSS = """
+    QTabWidget::pane {
+        border: 1px solid #E0E0E0; border-radius: 4px; background-color: white;
+    }
+    QTabBar::tab {
+        padding: 10px 20px; margin-right: 4px;
+        background-color: #F5F5F5;
+        border: 1px solid #E0E0E0; border-bottom: none;
+        border-top-left-radius: 4px; border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: white; border-bottom: 1px solid white; margin-bottom: -1px;
+    }
+"""
+_TABLE_QSS = """
+    QTableView { border: none; gridline-color: #F5F5F5; }
+    QTableView::item { padding: 8px; }
+    QHeaderView::section {
+        background-color: #F5F5F5; padding: 10px; border: none;
+        border-bottom: 1px solid #E0E0E0; font-weight: bold;
+    }
+"""
+_BUTTON_QSS_TPL = f"""
+    QPushButton {{
+        background-color: {COLOR_PRIMARY}; color: white;
+        border: none; border-radius: 4px; padding: %s; font-weight: bold;
+    }}
+    QPushButton:hover {{ background-color: #1976D2; }}
+"""
+_CLOSE_BUTTON_QSS = _BUTTON_QSS_TPL % "10px 30px"
+_REFRESH_BUTTON_QSS = _BUTTON_QSS_TPL % "6px 16px"
+# One sheet per trigger card body; rows pick their rules through dynamic
+# properties, so a colour change is setProperty() + repolish, not a new parse.
+_INFO_VALUE_COLORS = (COLOR_TEXT_PRIMARY, COLOR_SUCCESS, COLOR_WARNING, COLOR_DANGER,
+                      "#E65100", *SEVERITY_COLORS.values())
+_INFO_ROWS_QSS = f"""
+    QLabel[rowStyle="caption"] {{ color: {COLOR_TEXT_SECONDARY}; font-size: 12px; }}
+    QLabel[rowStyle="noData"] {{ {_NO_DATA_QSS} }}
+    QLabel[rowStyle="hint"] {{
+        color: #B71C1C; background: #FFEBEE; border-radius: 4px; padding: 8px; font-size: 12px;
+    }}
+""" + "".join(
+    f'    QLabel[valueColor="{c}"] {{ color: {c}; font-size: 13px; font-weight: bold; }}\n'
+    for c in dict.fromkeys(_INFO_VALUE_COLORS)
+)
+# good / warning / bad, for probabilities and weekday averages
+_RATING_COLOR_NAMES = (COLOR_SUCCESS, COLOR_WARNING, COLOR_DANGER)
+_RATING_COLORS = tuple(QColor(c) for c in _RATING_COLOR_NAMES)
+_RATING_ICONS = ('✓', '⚡', '⚠️')
+# Indexed by severity 1-5
+_SEVERITY_QCOLORS = (None,) + tuple(QColor(SEVERITY_COLORS[sev]) for sev in range(1, 6))
+_NO_DATA_TEXT = "Noch nicht genügend Daten — tracke mehr Tage um Muster zu erkennen."
+_STATS_CACHE_SIZE = 8
+_RELOAD_DELAY_MS = 150
+_PATTERN_TYPE_LABELS = {
+    'food':    '🍽 Nahrung',
+    'stress':  '😰 Stress',
+    'fungal':  '🍄 Pilz',
+    'sleep':   '😴 Schlaf',
+    'weather': '🌤 Wetter',
+    'sweating':'💧 Schwitzen',
+    'contact': '🧤 Kontakt',
+}
+
+
+def _probability_level(prob: float) -> int:
+    """0 below 25 %, 1 below 50 %, 2 from 50 % — index into the _RATING_* tuples."""
+    return min(int(prob // 25), 2)
+
+
+def _cache_put(cache: dict, key, value):
+    """Insert into a small result cache, evicting the oldest entry when full."""
+    if len(cache) >= _STATS_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 class StatCard(QFrame):
     """A card widget for displaying a single statistic"""
 
@@ -33,37 +159,495 @@ class StatCard(QFrame):
         self.setup_ui(title, value, subtitle, highlight)
 
     def setup_ui(self, title, value, subtitle, highlight):
-        bg = "#E3F2FD" if highlight else "white"
-        border = COLOR_PRIMARY if highlight else "#E0E0E0"
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg};
-                border: 1px solid {border};
-                border-radius: 8px;
-            }}
-        """)
+        self.setStyleSheet(_CARD_HIGHLIGHT_QSS if highlight else _CARD_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
         layout.setSpacing(4)
 
-        self._title = QLabel(title)
-        self._title.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 12px;")
+        self.title_label = QLabel(title)
+        self.title_label.setStyleSheet(_CAPTION_QSS)
 
-        self._value = QLabel(value)
-        self._value.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        self._value.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY};")
+        self.value_label = QLabel(value)
+        self.value_label.setFont(_H1_FONT)
+        self.value_label.setStyleSheet(_VALUE_QSS)
 
-        layout.addWidget(self._title)
-        layout.addWidget(self._value)
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.value_label)
 
+        self.subtitle_label = None
         if subtitle:
-            sub = QLabel(subtitle)
-            sub.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
-            sub.setWordWrap(True)
-            layout.addWidget(sub)
+            self.subtitle_label = QLabel(subtitle)
+            self.subtitle_label.setStyleSheet(_SMALL_QSS)
+            self.subtitle_label.setWordWrap(True)
+            layout.addWidget(self.subtitle_label)
 
     def set_value(self, v: str):
-        self._value.setText(v)
+        # Reloading a range often yields the same value; skip the relayout then
+        if self.value_label.text() != v:
+            self.value_label.setText(v)
+
+
+class BarChartWidget(QWidget):
+    """Labelled horizontal bars drawn in one paintEvent (no widget per row)."""
+
+    ROW_GAP = 8
+
+    def __init__(self, label_width: int, bar_height: int, row_height: int,
+                 value_width: int = 0, colored_values: bool = False, parent=None):
+        super().__init__(parent)
+        self._label_width = label_width
+        self._bar_height = bar_height
+        self._row_height = row_height
+        # > 0: values sit in a right-aligned column; 0: right after the bar
+        self._value_width = value_width
+        # Value text in bold, in the bar's colour (instead of small grey)
+        self._colored_values = colored_values
+        # (label, bar width in px, colour, value text)
+        self._items: List[Tuple[str, int, QColor, str]] = []
+
+    def set_items(self, items: List[Tuple[str, int, QColor, str]]):
+        if items == self._items:
+            return
+        if len(items) != len(self._items):
+            self._items = items
+            self.updateGeometry()
+        else:
+            self._items = items
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._label_width + 200, len(self._items) * self._row_height)
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(self._label_width, len(self._items) * self._row_height)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        row_h, bar_h = self._row_height, self._bar_height
+        bar_x = self._label_width + self.ROW_GAP
+        value_x = self.width() - self._value_width
+        for i, (label, width, color, value) in enumerate(self._items):
+            y = i * row_h
+            p.setFont(_BAR_LABEL_FONT)
+            p.setPen(_BAR_LABEL_COLOR)
+            p.drawText(QRect(0, y, self._label_width, row_h), Qt.AlignLeft | Qt.AlignVCenter, label)
+            if width > 0:
+                p.setPen(Qt.NoPen)
+                p.setBrush(color)
+                p.drawRoundedRect(QRectF(bar_x, y + (row_h - bar_h) / 2, width, bar_h), 3, 3)
+            if self._colored_values:
+                p.setFont(_BAR_VALUE_BOLD_FONT)
+                p.setPen(color)
+            else:
+                p.setFont(_BAR_VALUE_FONT)
+                p.setPen(_BAR_VALUE_COLOR)
+            if self._value_width:
+                rect = QRect(value_x, y, self._value_width, row_h)
+            else:
+                rect = QRect(bar_x + width + self.ROW_GAP, y, self.width(), row_h)
+            p.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, value)
+        p.end()
+
+
+class TrendChartWidget(QWidget):
+    """Daily severity bars with date ticks, rendered into one cached pixmap."""
+
+    COLUMN_WIDTH = 16
+    COLUMN_GAP = 2
+    BAR_WIDTH = 12
+    BAR_MAX = 160
+    AXIS_HEIGHT = 14
+    MARGIN_TOP = 20
+    MARGIN_BOTTOM = 40
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (bar height in px, severity or 0 for no entry, tooltip, axis text)
+        self._items: List[Tuple[int, int, str, str]] = []
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_key = None
+
+    def set_items(self, items: List[Tuple[int, int, str, str]]):
+        if items == self._items:
+            return
+        old, self._items = self._items, items
+        if len(items) != len(old):
+            self.updateGeometry()
+        elif self._pixmap is not None and all(a[3] == b[3] for a, b in zip(old, items)):
+            # Same days on the axis: only re-draw the columns whose bar changed
+            self._redraw_columns([i for i, (a, b) in enumerate(zip(old, items)) if a[:2] != b[:2]])
+            return
+        self._pixmap = None
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        step = self.COLUMN_WIDTH + self.COLUMN_GAP
+        return QSize(max(len(self._items) * step - self.COLUMN_GAP, 0),
+                     self.MARGIN_TOP + self.BAR_MAX + 2 + self.AXIS_HEIGHT + self.MARGIN_BOTTOM)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def _column_at(self, x: int) -> int:
+        step = self.COLUMN_WIDTH + self.COLUMN_GAP
+        i = x // step
+        return i if 0 <= i < len(self._items) and x % step < self.COLUMN_WIDTH else -1
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            pos = event.pos()
+            i = self._column_at(pos.x())
+            if i >= 0:
+                height, _, tooltip, _ = self._items[i]
+                bar_bottom = self._axis_y(self.height()) - 2
+                if tooltip and bar_bottom - height <= pos.y() < bar_bottom:
+                    QToolTip.showText(event.globalPos(), tooltip, self)
+                    return True
+            QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().event(event)
+
+    def _axis_y(self, height: int) -> int:
+        return height - self.MARGIN_BOTTOM - self.AXIS_HEIGHT
+
+    def _draw_bar(self, p: QPainter, i: int, bar_bottom: int):
+        height, severity = self._items[i][:2]
+        x = i * (self.COLUMN_WIDTH + self.COLUMN_GAP) + (self.COLUMN_WIDTH - self.BAR_WIDTH) / 2
+        p.setBrush(_CHART_SEVERITY_COLORS.get(severity, _CHART_EMPTY_COLOR))
+        p.drawRoundedRect(QRectF(x, bar_bottom - height, self.BAR_WIDTH, height), 2, 2)
+
+    def _redraw_columns(self, columns: List[int]):
+        """Patch single day columns into the cached pixmap and expose only those."""
+        axis_y = self._axis_y(self._pixmap_key[0].height())
+        step = self.COLUMN_WIDTH + self.COLUMN_GAP
+        p = QPainter(self._pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        for i in columns:
+            rect = QRect(i * step, 0, self.COLUMN_WIDTH, axis_y)
+            p.setCompositionMode(QPainter.CompositionMode_Source)
+            p.fillRect(rect, Qt.transparent)
+            p.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            self._draw_bar(p, i, axis_y - 2)
+            self.update(rect)
+        p.end()
+
+    def _render(self, size: QSize, dpr: float) -> QPixmap:
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setFont(_AXIS_FONT)
+        step = self.COLUMN_WIDTH + self.COLUMN_GAP
+        axis_y = self._axis_y(size.height())
+        p.setPen(Qt.NoPen)
+        for i in range(len(self._items)):
+            self._draw_bar(p, i, axis_y - 2)
+        # Ticks are wider than a column: centre each on its day, kept inside the
+        # widget, and walk right to left so today wins over a colliding tick
+        p.setPen(_BAR_VALUE_COLOR)
+        metrics = p.fontMetrics()
+        left_edge = size.width()
+        for i in range(len(self._items) - 1, -1, -1):
+            axis_text = self._items[i][3]
+            if not axis_text:
+                continue
+            width = metrics.horizontalAdvance(axis_text) + 4
+            x = i * step + (self.COLUMN_WIDTH - width) // 2
+            x = max(0, min(x, size.width() - width))
+            if x + width > left_edge:
+                continue
+            p.drawText(QRect(x, axis_y, width, self.AXIS_HEIGHT), Qt.AlignCenter, axis_text)
+            left_edge = x
+        p.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        key = (self.size(), self.devicePixelRatioF())
+        if self._pixmap is None or key != self._pixmap_key:
+            self._pixmap = self._render(*key)
+            self._pixmap_key = key
+        QPainter(self).drawPixmap(0, 0, self._pixmap)
+
+
+def _repolish(widget: QWidget):
+    """Re-evaluate stylesheet rules after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    # Colours follow the polish; padding only with a StyleChange on a shown widget
+    QApplication.sendEvent(widget, QEvent(QEvent.StyleChange))
+
+
+class _InfoRow:
+    """One line of a trigger card: caption plus optional right-aligned value."""
+
+    __slots__ = ("widget", "layout", "label", "value", "_is_text")
+
+    def __init__(self, parent_layout: QVBoxLayout):
+        self.widget = QWidget()
+        self.layout = QHBoxLayout(self.widget)
+        self.label = QLabel()
+        self.value = QLabel()
+        self.layout.addWidget(self.label)
+        self.layout.addStretch()
+        self.layout.addWidget(self.value)
+        self._is_text = None
+        parent_layout.addWidget(self.widget)
+
+    @staticmethod
+    def _set_style(label: QLabel, prop: str, value: str):
+        if label.property(prop) != value:
+            label.setProperty(prop, value)
+            _repolish(label)
+
+    def set(self, label: str, value: Optional[str], row_style: str, value_color: str = ""):
+        self.label.setText(label)
+        is_text = value is None
+        if is_text != self._is_text:
+            # Plain text lines (headings, hints) wrap and span the full width
+            self.label.setWordWrap(is_text)
+            self.layout.setStretch(0, int(is_text))
+            self.layout.setStretch(1, int(not is_text))
+            margin = 0 if is_text else 2
+            self.layout.setContentsMargins(0, margin, 0, margin)
+            self._is_text = is_text
+        self._set_style(self.label, "rowStyle", row_style)
+        if value is None:
+            self.value.hide()
+        else:
+            self.value.setText(value)
+            self._set_style(self.value, "valueColor", value_color)
+            self.value.show()
+        if self.widget.isHidden():
+            self.widget.show()
+
+
+class InfoRows:
+    """Reusable rows of a trigger card.
+
+    Fill inside ``with rows:``; rows are updated in place and any left over
+    from a longer previous result are hidden, so a refresh creates no widgets
+    once the card has grown to its largest size.
+    """
+
+    def __init__(self, layout: QVBoxLayout):
+        layout.parentWidget().setStyleSheet(_INFO_ROWS_QSS)
+        self._layout = layout
+        self._rows: List[_InfoRow] = []
+        self._used = 0
+
+    def __enter__(self) -> "InfoRows":
+        self._used = 0
+        return self
+
+    def __exit__(self, *exc):
+        for row in self._rows[self._used:]:
+            row.widget.hide()
+        return False
+
+    def _next(self) -> _InfoRow:
+        if self._used == len(self._rows):
+            self._rows.append(_InfoRow(self._layout))
+        row = self._rows[self._used]
+        self._used += 1
+        return row
+
+    def add(self, label: str, value: str, value_color: str = COLOR_TEXT_PRIMARY):
+        """A caption/value line; value_color must be one of _INFO_VALUE_COLORS."""
+        self._next().set(label, value, "caption", value_color)
+
+    def text(self, text: str, row_style: str = ""):
+        """A full-width line: plain heading, or a "hint"/"noData" box."""
+        self._next().set(text, None, row_style)
+
+    def no_data(self):
+        self.text(_NO_DATA_TEXT, "noData")
+
+
+def trigger_analyses(calculator: StatisticsCalculator) -> Dict[str, dict]:
+    """Inputs of the Trigger-Analyse cards (all entries, independent of the time range)."""
+    return {
+        'fungal':  calculator.detect_fungal_pattern(),
+        'stress':  calculator.detect_stress_pattern(),
+        'sleep':   calculator.get_sleep_analysis(),
+        'weather': calculator.get_weather_analysis(),
+        'nickel':  calculator.get_nickel_analysis(),
+    }
+
+
+class _StatsSignals(QObject):
+    """Signals emitted by StatsTask (QRunnable itself is not a QObject)."""
+    # cache key, result of the computation
+    finished = pyqtSignal(object, object)
+
+
+class StatsTask(QRunnable):
+    """Runs one statistics computation (calculate_all, pattern detection or the
+    trigger analyses) on a thread-pool thread; the result is cached under `key`."""
+
+    def __init__(self, key: tuple, compute: Callable[[], object]):
+        super().__init__()
+        self.key = key
+        self.compute = compute
+        self.signals = _StatsSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.key, self.compute())
+
+
+class PatternTableModel(QAbstractTableModel):
+    """Read-only model over the pattern dicts from detect_all_trigger_patterns()."""
+
+    HEADERS = ("Trigger", "Typ", "Vorkommen", "Reaktionen", "Wahrscheinlichkeit")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Per row: the first four display strings, the name colour and the raw
+        # probability (column 4 is drawn by ProbabilityDelegate)
+        self._rows: List[Tuple[Tuple[str, ...], Optional[QColor], float]] = []
+
+    def set_rows(self, rows: List[Dict]):
+        """Replace the rows, signalling only what changed (no full model reset)."""
+        new = [self._format_row(data) for data in rows]
+        old = self._rows
+        if new == old:
+            return
+        # Rows present before and after keep their place and are diffed below
+        common = min(len(old), len(new))
+        if len(new) < len(old):
+            self.beginRemoveRows(QModelIndex(), common, len(old) - 1)
+            self._rows = old[:common]
+            self.endRemoveRows()
+        elif len(new) > len(old):
+            self.beginInsertRows(QModelIndex(), common, len(new) - 1)
+            self._rows = old + new[common:]
+            self.endInsertRows()
+        changed = [r for r in range(common) if old[r] != new[r]]
+        self._rows = new
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 0),
+                                  self.index(changed[-1], len(self.HEADERS) - 1))
+
+    @staticmethod
+    def _format_row(data: Dict):
+        # Trigger name (+ [Ni] marker for nickel-rich foods)
+        nickel = data.get('is_nickel_rich')
+        name = data['trigger_label'] + " [Ni]" if nickel else data['trigger_label']
+        texts = (
+            name,
+            _PATTERN_TYPE_LABELS.get(data['trigger_type'], data['trigger_type']),
+            str(data['total_occurrences']),
+            str(data['triggered_reactions']),
+        )
+        return texts, _NICKEL_COLOR if nickel else None, data['probability']
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        texts, name_color, prob = self._rows[index.row()]
+        col = index.column()
+
+        if col == 4:
+            # Raw number only; ProbabilityDelegate picks icon and colour at paint time
+            return prob if role == Qt.UserRole else None
+        if role == Qt.DisplayRole:
+            return texts[col]
+        if role == Qt.TextAlignmentRole and col > 0:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole and col == 0:
+            return name_color
+        return None
+
+
+class ProbabilityDelegate(QStyledItemDelegate):
+    """Draws a Qt.UserRole probability as rating icon + percent in the rating colour."""
+
+    # (icon level, pen rgba, font key, width, row height, device pixel ratio)
+    # -> rendered icon glyph. Colour emoji are slow to shape and rasterise,
+    # so each variant is drawn once and then blitted.
+    _icon_cache: Dict[tuple, QPixmap] = {}
+
+    @classmethod
+    def _icon(cls, level: int, color: QColor, font: QFont, width: int, height: int,
+              dpr: float) -> QPixmap:
+        key = (level, color.rgba(), font.key(), width, height, dpr)
+        pixmap = cls._icon_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            p = QPainter(pixmap)
+            p.setFont(font)
+            p.setPen(color)
+            p.drawText(QRect(0, 0, width, height), Qt.AlignLeft | Qt.AlignVCenter,
+                       _RATING_ICONS[level])
+            p.end()
+            cls._icon_cache[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _text(prob: float) -> str:
+        return f"{_RATING_ICONS[_probability_level(prob)]} {prob}%"
+
+    def _style_option(self, option, index) -> QStyleOptionViewItem:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        return opt
+
+    def paint(self, painter, option, index):
+        opt = self._style_option(option, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        # Background, selection and focus as for any other cell
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        prob = index.data(Qt.UserRole)
+        if prob is None:
+            return
+        level = _probability_level(prob)
+        if opt.state & QStyle.State_Selected:
+            color = opt.palette.highlightedText().color()
+        else:
+            color = _RATING_COLORS[level]
+        fm = QFontMetrics(opt.font)
+        rest = f" {prob}%"
+        icon_width = fm.horizontalAdvance(_RATING_ICONS[level])
+        rest_width = fm.horizontalAdvance(rest)
+        rect = opt.rect
+        x = rect.x() + (rect.width() - icon_width - rest_width) // 2
+        icon = self._icon(level, color, opt.font, icon_width, rect.height(),
+                          painter.device().devicePixelRatioF())
+        painter.save()
+        painter.drawPixmap(x, rect.y(), icon)
+        painter.setFont(opt.font)
+        painter.setPen(color)
+        painter.drawText(QRect(x + icon_width, rect.y(), rest_width, rect.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, rest)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        opt = self._style_option(option, index)
+        prob = index.data(Qt.UserRole)
+        if prob is not None:
+            opt.text = self._text(prob)
+            opt.features |= QStyleOptionViewItem.HasDisplay
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        return style.sizeFromContents(QStyle.CT_ItemViewItem, opt, QSize(), widget)
 
 
 class StatisticsDialog(QDialog):
@@ -73,6 +657,20 @@ class StatisticsDialog(QDialog):
         super().__init__(parent)
         self.data_manager = data_manager
         self.stats_calculator = StatisticsCalculator(data_manager)
+        # calculate_all() results keyed by (days, today, data version)
+        self._stats_cache: Dict[tuple, dict] = {}
+        # detect_all_trigger_patterns() results keyed by (delay, threshold, today, version)
+        self._patterns_cache: Dict[tuple, List[Dict]] = {}
+        # trigger_analyses() results keyed by (today, version)
+        self._analyses_cache: Dict[tuple, Dict[str, dict]] = {}
+        self._stats_running = False
+        self._stats_pending = False
+        # Pattern detection and trigger analyses run on the pool as well; their
+        # finished handlers re-check the current inputs, so no pending flags
+        self._patterns_running = False
+        self._analyses_running = False
+        # Set while hidden: loading is deferred to the next showEvent
+        self._dirty = False
 
         self.setWindowTitle("Statistiken & Analyse")
         self.setMinimumSize(900, 650)
@@ -90,71 +688,72 @@ class StatisticsDialog(QDialog):
         # Header row
         header = QHBoxLayout()
         title = QLabel("Statistiken & Analyse")
-        title.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        title.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY};")
+        title.setFont(_H1_FONT)
+        title.setStyleSheet(_VALUE_QSS)
 
         self.time_range = QComboBox()
         self.time_range.addItems([
             "Letzte 7 Tage", "Letzte 14 Tage", "Letzte 30 Tage",
             "Letzte 90 Tage", "Alle Daten",
         ])
+        # Set before any connect: __init__ does the one initial load_statistics()
         self.time_range.setCurrentIndex(2)
-        self.time_range.setStyleSheet("""
-            QComboBox { padding: 8px 12px; border: 1px solid #E0E0E0;
-                        border-radius: 4px; min-width: 150px; }
-        """)
-        self.time_range.currentIndexChanged.connect(self.load_statistics)
+        self.time_range.setStyleSheet(_COMBO_QSS)
+        # Scrolling through the ranges only reloads once the selection settles
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self.load_statistics)
+        # start() without args; the index would otherwise become the interval
+        self.time_range.currentIndexChanged.connect(lambda _: self._reload_timer.start())
 
         header.addWidget(title)
         header.addStretch()
+        self._busy_label = QLabel("Berechne…")
+        self._busy_label.setStyleSheet(_SMALL_QSS)
+        self._busy_label.hide()
+        header.addWidget(self._busy_label)
+        header.addSpacing(12)
         header.addWidget(QLabel("Zeitraum:"))
         header.addWidget(self.time_range)
         layout.addLayout(header)
 
         # Tabs
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #E0E0E0; border-radius: 4px; background-color: white;
-            }
-            QTabBar::tab {
-                padding: 10px 20px; margin-right: 4px;
-                background-color: #F5F5F5;
-                border: 1px solid #E0E0E0; border-bottom: none;
-                border-top-left-radius: 4px; border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: white; border-bottom: 1px solid white; margin-bottom: -1px;
-            }
-        """)
+        self.tabs.setStyleSheet(_TABS_QSS)
 
         self.overview_tab = QWidget()
         self.setup_overview_tab()
         self.tabs.addTab(self.overview_tab, "Übersicht")
 
+        # The other tabs start empty and are built on first selection
         self.trends_tab = QWidget()
-        self.setup_trends_tab()
         self.tabs.addTab(self.trends_tab, "Verlauf")
 
         self.patterns_tab = QWidget()
-        self.setup_patterns_tab()
         self.tabs.addTab(self.patterns_tab, "Muster-Erkennung")
 
         self.trigger_tab = QWidget()
-        self.setup_trigger_tab()
         self.tabs.addTab(self.trigger_tab, "Trigger-Analyse")
 
+        # tab index -> (setup, update(stats)); only the visible tab is kept current
+        self._tab_handlers = {
+            0: (self.setup_overview_tab, self._update_overview_tab),
+            1: (self.setup_trends_tab, self._update_trends_tab),
+            2: (self.setup_patterns_tab, self._update_patterns_tab),
+            3: (self.setup_trigger_tab, self._update_trigger_tab),
+        }
+        self._built_tabs = {0}
+        self._last_stats: Optional[dict] = None
+        self._last_key: Optional[tuple] = None
+        # tab index -> what it was last rendered from (see _render_tokens)
+        self._rendered: Dict[int, object] = {}
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
         layout.addWidget(self.tabs)
 
         close_btn = QPushButton("Schließen")
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_PRIMARY}; color: white;
-                border: none; border-radius: 4px;
-                padding: 10px 30px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background-color: #1976D2; }}
-        """)
+        close_btn.setStyleSheet(_CLOSE_BUTTON_QSS)
         close_btn.clicked.connect(self.accept)
         btn_row = QHBoxLayout()
         btn_row.addStretch()
@@ -192,14 +791,17 @@ class StatisticsDialog(QDialog):
 
         # Severity distribution
         sev_frame = self._card_frame("Verteilung der Hautzustände")
-        self.severity_bars_layout = QVBoxLayout()
-        sev_frame.layout().addLayout(self.severity_bars_layout)
+        self.severity_chart = BarChartWidget(label_width=130, bar_height=18, row_height=21,
+                                             value_width=70)
+        sev_frame.layout().addWidget(self.severity_chart)
         layout.addWidget(sev_frame)
 
         # Top foods
         food_frame = self._card_frame("Häufigste Lebensmittel")
-        self.top_foods_layout = QVBoxLayout()
-        food_frame.layout().addLayout(self.top_foods_layout)
+        self._top_foods_empty = self._no_data_label()
+        food_frame.layout().addWidget(self._top_foods_empty)
+        self.top_foods_chart = BarChartWidget(label_width=130, bar_height=14, row_height=17)
+        food_frame.layout().addWidget(self.top_foods_chart)
         layout.addWidget(food_frame)
         layout.addStretch()
 
@@ -211,19 +813,14 @@ class StatisticsDialog(QDialog):
         layout.setSpacing(16)
 
         chart_frame = self._card_frame("Verlauf der Hautzustände")
-        self.chart_container = QWidget()
-        self.chart_layout = QHBoxLayout(self.chart_container)
-        self.chart_layout.setContentsMargins(0, 20, 0, 40)
-        self.chart_layout.setSpacing(2)
-        self.chart_layout.setAlignment(Qt.AlignBottom | Qt.AlignLeft)
-
-        chart_scroll = QScrollArea()
-        chart_scroll.setWidget(self.chart_container)
+        self.chart_scroll = chart_scroll = QScrollArea()
         chart_scroll.setWidgetResizable(True)
         chart_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         chart_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         chart_scroll.setMinimumHeight(250)
-        chart_scroll.setStyleSheet("QScrollArea { border: none; }")
+        chart_scroll.setStyleSheet(_SCROLL_QSS)
+        self.trend_chart = TrendChartWidget()
+        chart_scroll.setWidget(self.trend_chart)
 
         y_frame = QFrame()
         y_layout = QVBoxLayout(y_frame)
@@ -233,7 +830,7 @@ class StatisticsDialog(QDialog):
             lbl = QLabel(str(i))
             lbl.setFixedHeight(32)
             lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
+            lbl.setStyleSheet(_SMALL_QSS)
             y_layout.addWidget(lbl)
 
         chart_with_axis = QHBoxLayout()
@@ -244,8 +841,8 @@ class StatisticsDialog(QDialog):
 
         # Day of week averages
         dow_frame = self._card_frame("Durchschnitt nach Wochentag")
-        self.dow_bars_layout = QVBoxLayout()
-        dow_frame.layout().addLayout(self.dow_bars_layout)
+        self.dow_chart = BarChartWidget(label_width=100, bar_height=20, row_height=26)
+        dow_frame.layout().addWidget(self.dow_chart)
         layout.addWidget(dow_frame)
 
     # ── Pattern Detection Tab ──────────────────────────────────────────────────
@@ -261,17 +858,12 @@ class StatisticsDialog(QDialog):
             "Je höher die Wahrscheinlichkeit, desto öfter folgte auf diesen Trigger ein schlechter Tag."
         )
         info.setWordWrap(True)
-        info.setStyleSheet(
-            f"color: {COLOR_TEXT_SECONDARY}; padding: 10px; "
-            "background-color: #E8F5E9; border-radius: 4px;"
-        )
+        info.setStyleSheet(_INFO_BANNER_QSS)
         layout.addWidget(info)
 
         # Settings
         settings_frame = QFrame()
-        settings_frame.setStyleSheet(
-            "QFrame { background-color: white; border: 1px solid #E0E0E0; border-radius: 8px; }"
-        )
+        settings_frame.setStyleSheet(_CARD_QSS)
         settings_layout = QHBoxLayout(settings_frame)
         settings_layout.setContentsMargins(16, 12, 16, 12)
 
@@ -279,10 +871,13 @@ class StatisticsDialog(QDialog):
         self.delay_spinbox = QSpinBox()
         self.delay_spinbox.setRange(1, 5)
         self.delay_spinbox.setValue(2)
-        self.delay_spinbox.setStyleSheet(
-            "QSpinBox { padding: 6px 10px; border: 1px solid #E0E0E0; border-radius: 4px; min-width: 60px; }"
-        )
-        self.delay_spinbox.valueChanged.connect(self.update_patterns)
+        self.delay_spinbox.setStyleSheet(_SPINBOX_QSS)
+        # Holding an arrow key steps through values; recompute once it settles
+        self._patterns_timer = QTimer(self)
+        self._patterns_timer.setSingleShot(True)
+        self._patterns_timer.setInterval(_RELOAD_DELAY_MS)
+        self._patterns_timer.timeout.connect(self.update_patterns)
+        self.delay_spinbox.valueChanged.connect(lambda _: self._patterns_timer.start())
         settings_layout.addWidget(self.delay_spinbox)
 
         settings_layout.addSpacing(20)
@@ -290,20 +885,12 @@ class StatisticsDialog(QDialog):
         self.threshold_spinbox = QSpinBox()
         self.threshold_spinbox.setRange(3, 5)
         self.threshold_spinbox.setValue(4)
-        self.threshold_spinbox.setStyleSheet(
-            "QSpinBox { padding: 6px 10px; border: 1px solid #E0E0E0; border-radius: 4px; min-width: 60px; }"
-        )
-        self.threshold_spinbox.valueChanged.connect(self.update_patterns)
+        self.threshold_spinbox.setStyleSheet(_SPINBOX_QSS)
+        self.threshold_spinbox.valueChanged.connect(lambda _: self._patterns_timer.start())
         settings_layout.addWidget(self.threshold_spinbox)
 
         refresh_btn = QPushButton("Aktualisieren")
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_PRIMARY}; color: white;
-                border: none; border-radius: 4px; padding: 6px 16px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background-color: #1976D2; }}
-        """)
+        refresh_btn.setStyleSheet(_REFRESH_BUTTON_QSS)
         refresh_btn.clicked.connect(self.update_patterns)
         settings_layout.addSpacing(20)
         settings_layout.addWidget(refresh_btn)
@@ -312,11 +899,10 @@ class StatisticsDialog(QDialog):
 
         # Patterns table — 5 columns (with Trigger-Typ and Nickel-Flag)
         patterns_frame = self._card_frame("Erkannte Muster (alle Trigger)")
-        self.patterns_table = QTableWidget()
-        self.patterns_table.setColumnCount(5)
-        self.patterns_table.setHorizontalHeaderLabels([
-            "Trigger", "Typ", "Vorkommen", "Reaktionen", "Wahrscheinlichkeit"
-        ])
+        self.patterns_model = PatternTableModel(self)
+        self.patterns_table = QTableView()
+        self.patterns_table.setModel(self.patterns_model)
+        self.patterns_table.setItemDelegateForColumn(4, ProbabilityDelegate(self.patterns_table))
         hdr = self.patterns_table.horizontalHeader()
         hdr.setSectionResizeMode(0, QHeaderView.Stretch)
         hdr.setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -324,16 +910,9 @@ class StatisticsDialog(QDialog):
         hdr.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         hdr.setSectionResizeMode(4, QHeaderView.Stretch)
         self.patterns_table.setAlternatingRowColors(True)
-        self.patterns_table.setStyleSheet("""
-            QTableWidget { border: none; gridline-color: #F5F5F5; }
-            QTableWidget::item { padding: 8px; }
-            QHeaderView::section {
-                background-color: #F5F5F5; padding: 10px; border: none;
-                border-bottom: 1px solid #E0E0E0; font-weight: bold;
-            }
-        """)
+        self.patterns_table.setStyleSheet(_TABLE_QSS)
         self.patterns_table.verticalHeader().setVisible(False)
-        self.patterns_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.patterns_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         patterns_frame.layout().addWidget(self.patterns_table)
         layout.addWidget(patterns_frame, stretch=1)
 
@@ -346,7 +925,7 @@ class StatisticsDialog(QDialog):
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
+        scroll.setStyleSheet(_SCROLL_QSS)
         inner = QWidget()
         self.trigger_inner_layout = QVBoxLayout(inner)
         self.trigger_inner_layout.setContentsMargins(0, 0, 0, 0)
@@ -357,32 +936,31 @@ class StatisticsDialog(QDialog):
         # Placeholder cards — filled in load_trigger_analysis()
         # Fungal
         self.fungal_frame = self._card_frame("🍄 Zehenpilz → Hautschub (Id-Reaktion)")
-        self.fungal_layout = QVBoxLayout()
-        self.fungal_frame.layout().addLayout(self.fungal_layout)
+        self.fungal_rows = InfoRows(self._card_body(self.fungal_frame))
         self.trigger_inner_layout.addWidget(self.fungal_frame)
 
         # Stress
         self.stress_frame = self._card_frame("😰 Stresslevel → Hautzustand")
-        self.stress_layout = QVBoxLayout()
-        self.stress_frame.layout().addLayout(self.stress_layout)
+        self.stress_rows = InfoRows(self._card_body(self.stress_frame))
         self.trigger_inner_layout.addWidget(self.stress_frame)
 
         # Sleep
         self.sleep_frame = self._card_frame("😴 Schlafqualität → Hautzustand")
-        self.sleep_layout = QVBoxLayout()
-        self.sleep_frame.layout().addLayout(self.sleep_layout)
+        self.sleep_rows = InfoRows(self._card_body(self.sleep_frame))
         self.trigger_inner_layout.addWidget(self.sleep_frame)
 
         # Weather
         self.weather_frame = self._card_frame("🌤 Wetter → Ø Schweregrad")
-        self.weather_layout = QVBoxLayout()
-        self.weather_frame.layout().addLayout(self.weather_layout)
+        self._weather_empty = self._no_data_label()
+        self.weather_frame.layout().addWidget(self._weather_empty)
+        self.weather_chart = BarChartWidget(label_width=180, bar_height=18, row_height=26,
+                                            colored_values=True)
+        self.weather_frame.layout().addWidget(self.weather_chart)
         self.trigger_inner_layout.addWidget(self.weather_frame)
 
         # Nickel
         self.nickel_frame = self._card_frame("⚗ Nickel-Analyse (Dyshidrosis-spezifisch)")
-        self.nickel_layout = QVBoxLayout()
-        self.nickel_frame.layout().addLayout(self.nickel_layout)
+        self.nickel_rows = InfoRows(self._card_body(self.nickel_frame))
         self.trigger_inner_layout.addWidget(self.nickel_frame)
 
         self.trigger_inner_layout.addStretch()
@@ -391,46 +969,126 @@ class StatisticsDialog(QDialog):
 
     def _card_frame(self, title: str) -> QFrame:
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame { background-color: white; border: 1px solid #E0E0E0; border-radius: 8px; }
-        """)
+        frame.setStyleSheet(_CARD_QSS)
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(16, 16, 16, 16)
         if title:
             lbl = QLabel(title)
-            lbl.setFont(QFont("Segoe UI", 14, QFont.Bold))
+            lbl.setFont(_CARD_TITLE_FONT)
             layout.addWidget(lbl)
         return frame
 
-    def _info_row(self, label: str, value: str, value_color: str = COLOR_TEXT_PRIMARY) -> QWidget:
-        w = QWidget()
-        row = QHBoxLayout(w)
-        row.setContentsMargins(0, 2, 0, 2)
-        lbl = QLabel(label)
-        lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 12px;")
-        val = QLabel(value)
-        val.setStyleSheet(f"color: {value_color}; font-size: 13px; font-weight: bold;")
-        row.addWidget(lbl)
-        row.addStretch()
-        row.addWidget(val)
-        return w
+    def _card_body(self, frame: QFrame) -> QVBoxLayout:
+        """Add a content widget to a card frame; returns its layout."""
+        body = QWidget()
+        layout = QVBoxLayout(body)
+        layout.setContentsMargins(0, 0, 0, 0)
+        frame.layout().addWidget(body)
+        return layout
 
     def _no_data_label(self) -> QLabel:
-        lbl = QLabel("Noch nicht genügend Daten — tracke mehr Tage um Muster zu erkennen.")
-        lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; padding: 4px 0;")
+        lbl = QLabel(_NO_DATA_TEXT)
+        lbl.setStyleSheet(_NO_DATA_QSS)
         lbl.setWordWrap(True)
         return lbl
 
     # ── Stats loading ──────────────────────────────────────────────────────────
 
+    def refresh(self):
+        """Reload every tab from the data manager (used when the dialog is reopened)."""
+        self.load_statistics()
+
     def get_selected_days(self) -> Optional[int]:
         return {0: 7, 1: 14, 2: 30, 3: 90, 4: None}.get(self.time_range.currentIndex())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.load_statistics()
+
     def load_statistics(self):
+        """Show stats for the selected range; uncached ranges are computed off the GUI thread."""
+        if not self.isVisible():
+            self._dirty = True
+            return
         days = self.get_selected_days()
-        stats = self.stats_calculator.calculate_all(days)
-
-        # Overview cards
+        key = (days, date.today(), self.data_manager.version)
+        stats = self._stats_cache.get(key)
+        if stats is not None:
+            self._show_statistics(key, stats)
+            return
+        if self._stats_running:
+            # The finished handler reloads with whatever range is selected then
+            self._stats_pending = True
+            return
+        self._stats_running = True
+        self._update_busy()
+        # The trigger cards ignore the range; compute them once per data version
+        calculator = self.stats_calculator
+        with_analyses = key[1:] not in self._analyses_cache
+        task = StatsTask(key, lambda: (calculator.calculate_all(days),
+                                       trigger_analyses(calculator) if with_analyses else None))
+        task.signals.finished.connect(self._on_stats_finished)
+        QThreadPool.globalInstance().start(task)
+
+    def _update_busy(self):
+        self._busy_label.setVisible(
+            self._stats_running or self._patterns_running or self._analyses_running)
+
+    def _on_stats_finished(self, key: tuple, result: tuple):
+        stats, analyses = result
+        self._stats_running = False
+        self._update_busy()
+        _cache_put(self._stats_cache, key, stats)
+        if analyses is not None:
+            _cache_put(self._analyses_cache, key[1:], analyses)
+        if self._stats_pending:
+            self._stats_pending = False
+            self.load_statistics()
+        else:
+            self._show_statistics(key, stats)
+
+    @staticmethod
+    def _render_tokens(key: tuple, stats: dict) -> tuple:
+        """Per tab, the inputs its content depends on (indexed like the tabs)."""
+        days_today_version = key
+        today_version = key[1:]
+        # overview: the numbers; trends: range + data; patterns/trigger: data only
+        return stats, days_today_version, today_version, today_version
+
+    def _show_statistics(self, key: tuple, stats: dict):
+        if not self.isVisible():
+            # Closed while computing; the result stays cached for the next show
+            self._dirty = True
+            return
+        self._last_key, self._last_stats = key, stats
+        # Hidden tabs catch up when they are next selected
+        self._render_tab(self.tabs.currentIndex())
+
+    def _on_tab_changed(self, index: int):
+        self._render_tab(index)
+
+    def _render_tab(self, index: int):
+        """Build a tab on first use and bring it up to date with the last statistics."""
+        setup, update = self._tab_handlers[index]
+        if index not in self._built_tabs:
+            setup()
+            self._built_tabs.add(index)
+        if self._last_stats is None:
+            return
+        token = self._render_tokens(self._last_key, self._last_stats)[index]
+        if self._rendered.get(index) == token:
+            return
+        # Rows, chart bars and trigger cards all change; repaint the tab once at the end
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            update(self._last_stats)
+            self._rendered[index] = token
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+
+    def _update_overview_tab(self, stats: dict):
         self.total_entries_card.set_value(str(stats['total_entries']))
         self.avg_severity_card.set_value(f"{stats['average_severity']:.1f}")
         self.good_days_card.set_value(str(stats['good_days']))
@@ -445,380 +1103,241 @@ class StatisticsDialog(QDialog):
 
         self._update_severity_bars(stats['severity_distribution'])
         self._update_top_foods(stats['top_foods'])
-        self._update_chart()
+
+    def _update_trends_tab(self, stats: dict):
+        # Range and "today" of the shown statistics, so the chart and its render
+        # token agree even if the combo moved or midnight passed meanwhile
+        days, today = self._last_key[:2]
+        self._update_chart(days, today)
         self._update_dow_bars(stats['day_of_week_averages'])
+
+    def _update_patterns_tab(self, stats: dict):
         self.update_patterns()
-        self.load_trigger_analysis()
+
+    def _update_trigger_tab(self, stats: dict):
+        key = self._last_key[1:]
+        analyses = self._analyses_cache.get(key)
+        if analyses is not None:
+            self.load_trigger_analysis(analyses)
+            return
+        # Evicted, or stats came from the cache after a data change
+        if not self._analyses_running:
+            self._analyses_running = True
+            self._update_busy()
+            calculator = self.stats_calculator
+            task = StatsTask(key, lambda: trigger_analyses(calculator))
+            task.signals.finished.connect(self._on_analyses_finished)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_analyses_finished(self, key: tuple, analyses: dict):
+        self._analyses_running = False
+        self._update_busy()
+        _cache_put(self._analyses_cache, key, analyses)
+        # The tab was marked rendered without its cards; fill them now or on next visit
+        self._rendered.pop(3, None)
+        if self.isVisible() and self.tabs.currentIndex() == 3:
+            self._render_tab(3)
 
     # ── Pattern table (all triggers) ───────────────────────────────────────────
 
     def update_patterns(self):
         delay = self.delay_spinbox.value()
         threshold = self.threshold_spinbox.value()
-        patterns = self.stats_calculator.detect_all_trigger_patterns(delay, threshold)
-
-        type_labels = {
-            'food':    '🍽 Nahrung',
-            'stress':  '😰 Stress',
-            'fungal':  '🍄 Pilz',
-            'sleep':   '😴 Schlaf',
-            'weather': '🌤 Wetter',
-            'sweating':'💧 Schwitzen',
-            'contact': '🧤 Kontakt',
-        }
-
-        self.patterns_table.setRowCount(len(patterns))
-        for row, data in enumerate(patterns):
-            # Trigger name (+ [Ni] marker for nickel-rich foods)
-            name = data['trigger_label']
-            if data.get('is_nickel_rich'):
-                name += " [Ni]"
-            name_item = QTableWidgetItem(name)
-            if data.get('is_nickel_rich'):
-                name_item.setForeground(QColor("#E65100"))
-            self.patterns_table.setItem(row, 0, name_item)
-
-            # Type
-            type_item = QTableWidgetItem(type_labels.get(data['trigger_type'], data['trigger_type']))
-            type_item.setTextAlignment(Qt.AlignCenter)
-            self.patterns_table.setItem(row, 1, type_item)
-
-            # Occurrences
-            occ_item = QTableWidgetItem(str(data['total_occurrences']))
-            occ_item.setTextAlignment(Qt.AlignCenter)
-            self.patterns_table.setItem(row, 2, occ_item)
-
-            # Reactions
-            react_item = QTableWidgetItem(str(data['triggered_reactions']))
-            react_item.setTextAlignment(Qt.AlignCenter)
-            self.patterns_table.setItem(row, 3, react_item)
-
-            # Probability with color
-            prob = data['probability']
-            if prob >= 50:
-                color, icon = COLOR_DANGER, "⚠️"
-            elif prob >= 25:
-                color, icon = COLOR_WARNING, "⚡"
-            else:
-                color, icon = COLOR_SUCCESS, "✓"
-            prob_item = QTableWidgetItem(f"{icon} {prob}%")
-            prob_item.setForeground(QColor(color))
-            prob_item.setTextAlignment(Qt.AlignCenter)
-            self.patterns_table.setItem(row, 4, prob_item)
+        key = (delay, threshold, date.today(), self.data_manager.version)
+        patterns = self._patterns_cache.get(key)
+        if patterns is not None:
+            self.patterns_model.set_rows(patterns)
+        elif not self._patterns_running:
+            self._patterns_running = True
+            self._update_busy()
+            calculator = self.stats_calculator
+            task = StatsTask(key, lambda: calculator.detect_all_trigger_patterns(delay, threshold))
+            task.signals.finished.connect(self._on_patterns_finished)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_patterns_finished(self, key: tuple, patterns: list):
+        self._patterns_running = False
+        self._update_busy()
+        _cache_put(self._patterns_cache, key, patterns)
+        # Shows this result, or starts over if the spinboxes moved meanwhile
+        self.update_patterns()
 
     # ── Trigger Analysis Tab content ───────────────────────────────────────────
 
-    def load_trigger_analysis(self):
-        self._load_fungal_analysis()
-        self._load_stress_analysis()
-        self._load_sleep_analysis()
-        self._load_weather_analysis()
-        self._load_nickel_analysis()
-
-    def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-    def _load_fungal_analysis(self):
-        self._clear_layout(self.fungal_layout)
-        result = self.stats_calculator.detect_fungal_pattern()
-
-        if result.get('insufficient_data'):
-            self.fungal_layout.addWidget(self._no_data_label())
-            return
-
-        baseline = result['avg_baseline_severity']
-        active   = result['avg_fungal_active_severity']
-        onsets   = result['total_onsets']
-        prob     = result['flare_probability']
-        delay    = result['avg_peak_delay_days']
-
-        color_active = COLOR_DANGER if active > baseline + 0.5 else COLOR_TEXT_PRIMARY
-        self.fungal_layout.addWidget(self._info_row("Ø Schwere OHNE Pilz:", f"{baseline:.1f}"))
-        self.fungal_layout.addWidget(self._info_row("Ø Schwere MIT Pilz:", f"{active:.1f}", color_active))
-        self.fungal_layout.addWidget(self._info_row("Erkannte Pilz-Onsets:", str(onsets)))
-        self.fungal_layout.addWidget(self._info_row(
-            "Schub-Wahrscheinlichkeit nach Pilz-Onset:",
-            f"{prob}%",
-            COLOR_DANGER if prob >= 50 else COLOR_WARNING if prob >= 25 else COLOR_SUCCESS,
-        ))
-        if delay is not None:
-            self.fungal_layout.addWidget(
-                self._info_row("Ø Tage bis Schub-Peak:", f"{delay} Tage")
-            )
-
-        if active > baseline + 0.3:
-            hint = QLabel(
-                "⚠️  Deine Daten deuten auf eine Id-Reaktion hin: "
-                "der Hautzustand ist bei aktivem Zehenpilz deutlich schlechter. "
-                "Zeige diese Auswertung deinem Dermatologen."
-            )
-            hint.setWordWrap(True)
-            hint.setStyleSheet(
-                "color: #B71C1C; background: #FFEBEE; border-radius: 4px; padding: 8px; font-size: 12px;"
-            )
-            self.fungal_layout.addWidget(hint)
-
-    def _load_stress_analysis(self):
-        self._clear_layout(self.stress_layout)
-        result = self.stats_calculator.detect_stress_pattern()
-
-        sev_by_stress = result.get('stress_severity_by_level', {})
-        if not sev_by_stress:
-            self.stress_layout.addWidget(self._no_data_label())
-            return
-
-        stress_labels = {1: "Entspannt", 2: "Leicht", 3: "Mittel", 4: "Hoch", 5: "Extrem"}
-        for level in sorted(sev_by_stress):
-            avg = sev_by_stress[level]
-            color = COLOR_DANGER if avg >= 4 else COLOR_WARNING if avg >= 3 else COLOR_TEXT_PRIMARY
-            self.stress_layout.addWidget(
-                self._info_row(f"Stress {level} ({stress_labels.get(level, '')}): Ø Schwere", f"{avg:.1f}", color)
-            )
-
-        prob = result.get('high_stress_flare_probability', 0)
-        corr = result.get('correlation')
-        self.stress_layout.addWidget(self._info_row(
-            "Schub-Wahrscheinlichkeit bei Stress ≥4:",
-            f"{prob}%",
-            COLOR_DANGER if prob >= 50 else COLOR_WARNING if prob >= 25 else COLOR_SUCCESS,
-        ))
-        if corr is not None:
-            strength = "stark" if abs(corr) > 0.6 else "moderat" if abs(corr) > 0.3 else "schwach"
-            direction = "positiv (mehr Stress → mehr Schübe)" if corr > 0 else "negativ"
-            self.stress_layout.addWidget(
-                self._info_row(f"Korrelation ({strength}, {direction}):", f"r = {corr}")
+    def load_trigger_analysis(self, analyses: Dict[str, dict]):
+        self._load_fungal_analysis(analyses['fungal'])
+        self._load_stress_analysis(analyses['stress'])
+        self._load_sleep_analysis(analyses['sleep'])
+        self._load_weather_analysis(analyses['weather'])
+        self._load_nickel_analysis(analyses['nickel'])
+
+    def _load_fungal_analysis(self, result: dict):
+        with self.fungal_rows as rows:
+            if result.get('insufficient_data'):
+                rows.no_data()
+                return
+
+            baseline = result['avg_baseline_severity']
+            active   = result['avg_fungal_active_severity']
+            onsets   = result['total_onsets']
+            prob     = result['flare_probability']
+            delay    = result['avg_peak_delay_days']
+
+            color_active = COLOR_DANGER if active > baseline + 0.5 else COLOR_TEXT_PRIMARY
+            rows.add("Ø Schwere OHNE Pilz:", f"{baseline:.1f}")
+            rows.add("Ø Schwere MIT Pilz:", f"{active:.1f}", color_active)
+            rows.add("Erkannte Pilz-Onsets:", str(onsets))
+            rows.add(
+                "Schub-Wahrscheinlichkeit nach Pilz-Onset:",
+                f"{prob}%",
+                _RATING_COLOR_NAMES[_probability_level(prob)],
             )
-
-    def _load_sleep_analysis(self):
-        self._clear_layout(self.sleep_layout)
-        result = self.stats_calculator.get_sleep_analysis()
-
-        same_day = result.get('same_day', {})
-        next_day = result.get('next_day', {})
-        if not same_day and not next_day:
-            self.sleep_layout.addWidget(self._no_data_label())
-            return
-
-        if same_day:
-            self.sleep_layout.addWidget(QLabel("Gleicher Tag:"))
-            sleep_labels = {1: "Schlecht", 2: "Wenig", 3: "OK", 4: "Gut", 5: "Sehr gut"}
-            for q in sorted(same_day):
-                color = COLOR_SUCCESS if same_day[q] <= 2 else (COLOR_DANGER if same_day[q] >= 4 else COLOR_TEXT_PRIMARY)
-                self.sleep_layout.addWidget(
-                    self._info_row(f"  Schlaf {q} ({sleep_labels.get(q, '')}): Ø Schwere",
-                                   f"{same_day[q]:.1f}", color)
+            if delay is not None:
+                rows.add("Ø Tage bis Schub-Peak:", f"{delay} Tage")
+
+            if active > baseline + 0.3:
+                rows.text(
+                    "⚠️  Deine Daten deuten auf eine Id-Reaktion hin: "
+                    "der Hautzustand ist bei aktivem Zehenpilz deutlich schlechter. "
+                    "Zeige diese Auswertung deinem Dermatologen.",
+                    "hint",
                 )
 
-        corr = result.get('correlation')
-        if corr is not None:
-            direction = "negativ (schlechter Schlaf → mehr Schübe)" if corr < 0 else "positiv"
-            self.sleep_layout.addWidget(
-                self._info_row(f"Korrelation Schlaf↔Schwere ({direction}):", f"r = {corr}")
+    def _load_stress_analysis(self, result: dict):
+        with self.stress_rows as rows:
+            sev_by_stress = result.get('stress_severity_by_level', {})
+            if not sev_by_stress:
+                rows.no_data()
+                return
+
+            for level, name in _STRESS_LABELS.items():
+                avg = sev_by_stress.get(level)
+                if avg is None:
+                    continue
+                color = COLOR_DANGER if avg >= 4 else COLOR_WARNING if avg >= 3 else COLOR_TEXT_PRIMARY
+                rows.add(f"Stress {level} ({name}): Ø Schwere", f"{avg:.1f}", color)
+
+            prob = result.get('high_stress_flare_probability', 0)
+            corr = result.get('correlation')
+            rows.add(
+                "Schub-Wahrscheinlichkeit bei Stress ≥4:",
+                f"{prob}%",
+                _RATING_COLOR_NAMES[_probability_level(prob)],
             )
+            if corr is not None:
+                strength = "stark" if abs(corr) > 0.6 else "moderat" if abs(corr) > 0.3 else "schwach"
+                direction = "positiv (mehr Stress → mehr Schübe)" if corr > 0 else "negativ"
+                rows.add(f"Korrelation ({strength}, {direction}):", f"r = {corr}")
+
+    def _load_sleep_analysis(self, result: dict):
+        with self.sleep_rows as rows:
+            same_day = result.get('same_day', {})
+            next_day = result.get('next_day', {})
+            if not same_day and not next_day:
+                rows.no_data()
+                return
+
+            if same_day:
+                rows.text("Gleicher Tag:")
+                for q, name in _SLEEP_LABELS.items():
+                    avg = same_day.get(q)
+                    if avg is None:
+                        continue
+                    color = COLOR_SUCCESS if avg <= 2 else (COLOR_DANGER if avg >= 4 else COLOR_TEXT_PRIMARY)
+                    rows.add(f"  Schlaf {q} ({name}): Ø Schwere", f"{avg:.1f}", color)
+
+            corr = result.get('correlation')
+            if corr is not None:
+                direction = "negativ (schlechter Schlaf → mehr Schübe)" if corr < 0 else "positiv"
+                rows.add(f"Korrelation Schlaf↔Schwere ({direction}):", f"r = {corr}")
+
+    def _load_weather_analysis(self, data: dict):
+        self._weather_empty.setVisible(not data)
+        max_val = max(data.values(), default=0) or 1
+        self.weather_chart.set_items([
+            (weather, max(4, int(avg / max_val * 200)),
+             _SEVERITY_QCOLORS[min(5, max(1, round(avg)))], f"{avg:.1f}")
+            for weather, avg in sorted(data.items(), key=lambda x: x[1], reverse=True)
+        ])
 
-    def _load_weather_analysis(self):
-        self._clear_layout(self.weather_layout)
-        data = self.stats_calculator.get_weather_analysis()
-        if not data:
-            self.weather_layout.addWidget(self._no_data_label())
-            return
-
-        sorted_weather = sorted(data.items(), key=lambda x: x[1], reverse=True)
-        max_val = max(v for _, v in sorted_weather) or 1
-        for weather, avg in sorted_weather:
-            color = SEVERITY_COLORS.get(min(5, max(1, round(avg))), COLOR_TEXT_PRIMARY)
-            row_w = QWidget()
-            row = QHBoxLayout(row_w)
-            row.setContentsMargins(0, 2, 0, 2)
-            lbl = QLabel(weather)
-            lbl.setFixedWidth(180)
-            bar = QFrame()
-            bar.setFixedSize(max(4, int(avg / max_val * 200)), 18)
-            bar.setStyleSheet(f"background-color: {color}; border-radius: 3px;")
-            val = QLabel(f"{avg:.1f}")
-            val.setStyleSheet(f"color: {color}; font-weight: bold;")
-            row.addWidget(lbl)
-            row.addWidget(bar)
-            row.addSpacing(8)
-            row.addWidget(val)
-            row.addStretch()
-            self.weather_layout.addWidget(row_w)
-
-    def _load_nickel_analysis(self):
-        self._clear_layout(self.nickel_layout)
-        result = self.stats_calculator.get_nickel_analysis()
-
+    def _load_nickel_analysis(self, result: dict):
         prob  = result.get('high_nickel_flare_probability', 0)
-        foods = result.get('nickel_food_frequencies', {})
+        foods = result.get('nickel_food_frequencies', [])
         by_load = result.get('avg_severity_by_nickel_load', {})
 
-        if not foods and not by_load:
-            hint = QLabel(
-                "Keine nickelreichen Lebensmittel erfasst. "
-                "Lebensmittel wie Schokolade, Haferflocken, Nüsse und Weizen sind nickelreich "
-                "und können bei Nickel-sensiblen Patienten Dyshidrosis-Schübe auslösen."
-            )
-            hint.setWordWrap(True)
-            hint.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-style: italic; padding: 4px 0;")
-            self.nickel_layout.addWidget(hint)
-            return
+        with self.nickel_rows as rows:
+            if not foods and not by_load:
+                rows.text(
+                    "Keine nickelreichen Lebensmittel erfasst. "
+                    "Lebensmittel wie Schokolade, Haferflocken, Nüsse und Weizen sind nickelreich "
+                    "und können bei Nickel-sensiblen Patienten Dyshidrosis-Schübe auslösen.",
+                    "noData",
+                )
+                return
 
-        self.nickel_layout.addWidget(
-            self._info_row(
+            rows.add(
                 "Schub-Wahrsch. bei ≥2 nickelreichen Lebensmitteln:",
                 f"{prob}%",
-                COLOR_DANGER if prob >= 50 else COLOR_WARNING if prob >= 25 else COLOR_SUCCESS,
+                _RATING_COLOR_NAMES[_probability_level(prob)],
             )
-        )
 
-        if by_load:
-            self.nickel_layout.addWidget(QLabel("Ø Schwere nach Nickel-Last (Anzahl Lebensmittel):"))
-            for load in sorted(by_load):
-                color = SEVERITY_COLORS.get(min(5, max(1, round(by_load[load]))), COLOR_TEXT_PRIMARY)
-                self.nickel_layout.addWidget(
-                    self._info_row(f"  {load} nickelreiche{'s' if load == 1 else ''} Lebensmittel",
-                                   f"Ø {by_load[load]:.1f}", color)
-                )
+            if by_load:
+                rows.text("Ø Schwere nach Nickel-Last (Anzahl Lebensmittel):")
+                for load in sorted(by_load):
+                    color = SEVERITY_COLORS.get(min(5, max(1, round(by_load[load]))), COLOR_TEXT_PRIMARY)
+                    rows.add(f"  {load} nickelreiche{'s' if load == 1 else ''} Lebensmittel",
+                             f"Ø {by_load[load]:.1f}", color)
 
-        if foods:
-            self.nickel_layout.addWidget(QLabel("Häufig konsumierte nickelreiche Lebensmittel:"))
-            for food, cnt in list(foods.items())[:6]:
-                self.nickel_layout.addWidget(
-                    self._info_row(f"  {food}", f"{cnt}×", "#E65100")
-                )
+            if foods:
+                rows.text("Häufig konsumierte nickelreiche Lebensmittel:")
+                for food, cnt in foods:
+                    rows.add(f"  {food}", f"{cnt}×", "#E65100")
 
     # ── Overview helpers ───────────────────────────────────────────────────────
 
     def _update_severity_bars(self, distribution: Dict[int, int]):
-        self._clear_layout(self.severity_bars_layout)
         total = sum(distribution.values()) or 1
-        labels = {1: "Sehr gut", 2: "Gut", 3: "Mittel", 4: "Schlecht", 5: "Sehr schlecht"}
+        items = []
         for sev in range(1, 6):
             count = distribution.get(sev, 0)
             pct   = (count / total) * 100
-            row_w = QWidget()
-            row   = QHBoxLayout(row_w)
-            row.setContentsMargins(0, 2, 0, 2)
-            label = QLabel(f"{sev} - {labels[sev]}")
-            label.setFixedWidth(130)
-            label.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY}; font-size: 12px;")
-            bar = QFrame()
-            bar.setFixedHeight(20)
-            bar.setFixedWidth(max(int(pct * 2.5), 4))
-            bar.setStyleSheet(f"background-color: {SEVERITY_COLORS[sev]}; border-radius: 3px;")
-            cnt_lbl = QLabel(f"{count} ({pct:.0f}%)")
-            cnt_lbl.setFixedWidth(70)
-            cnt_lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
-            row.addWidget(label)
-            row.addWidget(bar)
-            row.addStretch()
-            row.addWidget(cnt_lbl)
-            self.severity_bars_layout.addWidget(row_w)
+            items.append((f"{sev} - {_SEVERITY_LABELS[sev]}", max(int(pct * 2.5), 4),
+                          _SEVERITY_QCOLORS[sev], f"{count} ({pct:.0f}%)"))
+        self.severity_chart.set_items(items)
 
     def _update_top_foods(self, top_foods: List[Tuple[str, int]]):
-        self._clear_layout(self.top_foods_layout)
-        if not top_foods:
-            self.top_foods_layout.addWidget(self._no_data_label())
-            return
+        self._top_foods_empty.setVisible(not top_foods)
         max_count = top_foods[0][1] if top_foods else 1
-        for food, count in top_foods[:10]:
-            row_w = QWidget()
-            row   = QHBoxLayout(row_w)
-            row.setContentsMargins(0, 2, 0, 2)
-            name = QLabel(food)
-            name.setFixedWidth(130)
-            name.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY}; font-size: 12px;")
-            bar = QFrame()
-            bar.setFixedSize(max(int((count / max_count) * 150), 4), 16)
-            bar.setStyleSheet(f"background-color: {COLOR_PRIMARY}; border-radius: 3px;")
-            cnt = QLabel(f"{count}×")
-            cnt.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 11px;")
-            row.addWidget(name)
-            row.addWidget(bar)
-            row.addSpacing(8)
-            row.addWidget(cnt)
-            row.addStretch()
-            self.top_foods_layout.addWidget(row_w)
-
-    def _update_chart(self):
-        while self.chart_layout.count():
-            item = self.chart_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self.top_foods_chart.set_items([
+            (food, max(int((count / max_count) * 150), 4), _BAR_FOOD_COLOR, f"{count}×")
+            for food, count in top_foods
+        ])
 
-        days = self.get_selected_days()
+    def _update_chart(self, days: Optional[int], end_date: date):
         days = min(days if days is not None else 90, 60)
-        end_date   = date.today()
         start_date = end_date - timedelta(days=days - 1)
-        entries    = self.data_manager.get_entries_in_range(start_date, end_date)
-        entry_map  = {date.fromisoformat(e.date): e for e in entries}
-        bar_max    = 160
-
-        current = start_date
-        while current <= end_date:
-            entry = entry_map.get(current)
-            bar_w = QWidget()
-            bar_l = QVBoxLayout(bar_w)
-            bar_l.setContentsMargins(0, 0, 0, 0)
-            bar_l.setSpacing(2)
-            bar_l.setAlignment(Qt.AlignBottom)
-
+        series     = self.stats_calculator.daily_entries(start_date, end_date)
+        bar_max    = TrendChartWidget.BAR_MAX
+
+        items = []
+        for i, entry in enumerate(series):
+            current = start_date + timedelta(days=i)
+            label = current.strftime("%d.%m")
+            axis_text = (label if current == start_date or current == end_date
+                         or current.weekday() == 0 else "")
             if entry and entry.severity:
-                h = int((entry.severity / 5) * bar_max)
-                color = SEVERITY_COLORS.get(entry.severity, "#9E9E9E")
-                bar = QFrame()
-                bar.setFixedSize(12, h)
-                bar.setStyleSheet(f"background-color: {color}; border-radius: 2px;")
-                # Fungal marker on top
+                tooltip = f"{label}: Schwere {entry.severity}"
                 if entry.fungal_active:
-                    bar.setToolTip(
-                        f"{current.strftime('%d.%m')}: Schwere {entry.severity} 🍄 Pilz aktiv"
-                    )
-                else:
-                    bar.setToolTip(f"{current.strftime('%d.%m')}: Schwere {entry.severity}")
-                bar_l.addWidget(bar, alignment=Qt.AlignHCenter)
-            else:
-                empty = QFrame()
-                empty.setFixedSize(12, 4)
-                empty.setStyleSheet("background-color: #E0E0E0; border-radius: 2px;")
-                bar_l.addWidget(empty, alignment=Qt.AlignHCenter)
-
-            if current == start_date or current == end_date or current.weekday() == 0:
-                date_lbl = QLabel(current.strftime("%d.%m"))
-                date_lbl.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 9px;")
-                date_lbl.setAlignment(Qt.AlignCenter)
+                    tooltip += " 🍄 Pilz aktiv"
+                items.append((int((entry.severity / 5) * bar_max), entry.severity, tooltip, axis_text))
             else:
-                date_lbl = QLabel("")
-                date_lbl.setFixedHeight(14)
-            bar_l.addWidget(date_lbl)
-            bar_w.setFixedWidth(16)
-            self.chart_layout.addWidget(bar_w)
-            current += timedelta(days=1)
-        self.chart_layout.addStretch()
+                items.append((4, 0, "", axis_text))
+        self.trend_chart.set_items(items)
 
     def _update_dow_bars(self, dow_data: Dict[int, float]):
-        while self.dow_bars_layout.count():
-            item = self.dow_bars_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        day_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag",
-                     "Freitag", "Samstag", "Sonntag"]
-        for day_num, name in enumerate(day_names):
+        items = []
+        for day_num, name in enumerate(_DAY_NAMES):
             avg = dow_data.get(day_num, 0)
-            row = QHBoxLayout()
-            lbl = QLabel(name)
-            lbl.setFixedWidth(100)
-            color = (COLOR_SUCCESS if avg <= 2 else COLOR_WARNING if avg <= 3 else COLOR_DANGER)
-            bar = QFrame()
-            bar.setFixedSize(int(avg * 40), 20)
-            bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-            val = QLabel(f"{avg:.1f}" if avg else "-")
-            val.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY};")
-            row.addWidget(lbl)
-            row.addWidget(bar)
-            row.addWidget(val)
-            row.addStretch()
-            self.dow_bars_layout.addLayout(row)
+            color = _RATING_COLORS[0 if avg <= 2 else 1 if avg <= 3 else 2]
+            items.append((name, int(avg * 40), color, f"{avg:.1f}" if avg else "-"))
+        self.dow_chart.set_items(items)
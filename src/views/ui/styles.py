@@ -3,6 +3,8 @@ Stylesheet definitions for Neuro-Tracker Application
 Uses QSS (Qt Style Sheets) for consistent styling
 """
 
+from functools import lru_cache
+
 from config import (
     COLOR_PRIMARY, COLOR_SECONDARY, COLOR_SUCCESS, COLOR_WARNING, COLOR_DANGER,
     COLOR_BACKGROUND, COLOR_SURFACE, COLOR_TEXT_PRIMARY, COLOR_TEXT_SECONDARY,
@@ -10,9 +12,9 @@ from config import (
 )
 
 
-def get_main_stylesheet():
-    """Returns the main application stylesheet"""
-    return f"""
+# Built once at import: the sheet only depends on config constants, so there
+# is nothing to re-read or re-format per call (and no file/resource to open).
+_MAIN_STYLESHEET = f"""
         /* Main Window */
         QMainWindow {{
             background-color: {COLOR_BACKGROUND};
@@ -317,10 +319,12 @@ def get_main_stylesheet():
         QMenuBar {{
             background-color: {COLOR_SURFACE};
             border-bottom: 1px solid #E0E0E0;
+            padding: 4px;
         }}
 
         QMenuBar::item {{
-            padding: 8px 12px;
+            padding: 8px 16px;
+            border-radius: 4px;
         }}
 
         QMenuBar::item:selected {{
@@ -330,20 +334,61 @@ def get_main_stylesheet():
         QMenu {{
             background-color: {COLOR_SURFACE};
             border: 1px solid #E0E0E0;
+            padding: 4px;
         }}
 
         QMenu::item {{
             padding: 8px 24px;
+            border-radius: 4px;
         }}
 
         QMenu::item:selected {{
             background-color: #E3F2FD;
         }}
 
+        QMenu::separator {{
+            height: 1px;
+            background-color: #E0E0E0;
+            margin: 4px 8px;
+        }}
+
         /* Status Bar */
         QStatusBar {{
             background-color: {COLOR_SURFACE};
             border-top: 1px solid #E0E0E0;
+            padding: 4px;
+        }}
+
+        QLabel#statusIcon {{
+            padding-left: 10px;
+        }}
+
+        QLabel#syncStatus, QLabel#entryCount {{
+            color: {COLOR_TEXT_SECONDARY};
+            padding: 0 10px 0 0;
+        }}
+
+        QLabel#syncStatus[connected="true"] {{
+            color: {COLOR_SUCCESS};
+        }}
+
+        /* Main Window Layout */
+        QSplitter::handle {{
+            background-color: #E0E0E0;
+        }}
+
+        QSplitter::handle:hover {{
+            background-color: #BDBDBD;
+        }}
+
+        QFrame#entryPanelFrame {{
+            background-color: {COLOR_SURFACE};
+            border-right: 1px solid #E0E0E0;
+        }}
+
+        QFrame#detailPanel {{
+            background-color: {COLOR_SURFACE};
+            border-top: 2px solid #E0E0E0;
         }}
 
         /* Tool Tip */
@@ -397,6 +442,12 @@ def get_main_stylesheet():
     """
 
 
+def get_main_stylesheet():
+    """Returns the main application stylesheet"""
+    return _MAIN_STYLESHEET
+
+
+@lru_cache(maxsize=64)
 def get_severity_button_style(severity: int, is_selected: bool = False) -> str:
     """Returns the style for a severity button"""
     color = SEVERITY_COLORS.get(severity, "#9E9E9E")
@@ -434,6 +485,7 @@ def get_severity_button_style(severity: int, is_selected: bool = False) -> str:
         """
 
 
+@lru_cache(maxsize=64)
 def get_day_card_style(severity: int = None, is_today: bool = False, is_selected: bool = False) -> str:
     """Returns the style for a day card"""
     base_color = SEVERITY_COLORS.get(severity, "#E0E0E0") if severity else "#E0E0E0"
@@ -455,6 +507,7 @@ def get_day_card_style(severity: int = None, is_today: bool = False, is_selected
     """
 
 
+@lru_cache(maxsize=None)
 def get_panel_style():
     """Returns the style for side panels"""
     return f"""
@@ -466,6 +519,7 @@ def get_panel_style():
     """
 
 
+@lru_cache(maxsize=None)
 def get_calendar_header_style():
     """Returns the style for calendar headers"""
     return f"""
@@ -478,6 +532,7 @@ def get_calendar_header_style():
     """
 
 
+@lru_cache(maxsize=None)
 def get_food_tag_style(is_removable: bool = True) -> str:
     """Returns the style for food tags/chips"""
     return f"""
@@ -507,6 +562,7 @@ def get_food_tag_style(is_removable: bool = True) -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def get_statistics_card_style(highlight: bool = False) -> str:
     """Returns the style for statistics cards"""
     bg_color = "#E3F2FD" if highlight else COLOR_SURFACE
@@ -522,6 +578,7 @@ def get_statistics_card_style(highlight: bool = False) -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def get_empty_state_style():
     """Returns the style for empty state messages"""
     return f"""